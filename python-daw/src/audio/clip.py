@@ -1,12 +1,14 @@
 from typing import Optional, Sequence
 
+from .peaks import build_peak_pyramid, peaks_from_pyramid
+
 
 class AudioClip:
     """Represents an audio clip placed on a timeline.
 
     Attributes:
         name: Optional label for UI.
-        buffer: Sequence[float] mono samples in range [-1, 1] (placeholder for real buffers)
+        buffer: Sequence[float] mono samples in range [-1, 1]; numpy buffers are stored as float32
         start_time: Start time on timeline (seconds)
         duration: Optional override for clip duration (seconds); if None, derived from buffer length and sample_rate
         sample_rate: Samples per second of buffer
@@ -23,6 +25,8 @@ class AudioClip:
         file_path: Optional[str] = None,
     ) -> None:
         self.name = name
+        if getattr(buffer, "dtype", None) is not None and buffer.dtype != "float32":
+            buffer = buffer.astype("float32", copy=False)
         self.buffer = buffer
         self.sample_rate = int(sample_rate)
         self.start_time = float(start_time)
@@ -48,6 +52,10 @@ class AudioClip:
         # Volume control (0.0 to 2.0, where 1.0 is unity gain)
         self.volume: float = 1.0
 
+        # Min/max peak pyramid of the buffer (see set_peak_pyramid)
+        self._peak_pyramid = None
+        self._peak_pyramid_buffer = None
+
     @property
     def length_seconds(self) -> float:
         """Logical clip length shown on the timeline.
@@ -67,6 +75,55 @@ class AudioClip:
     def end_time(self) -> float:
         return self.start_time + self.length_seconds
 
+    def copy(self, start_time: Optional[float] = None, name: Optional[str] = None) -> "AudioClip":
+        """Return a copy of the clip that shares its sample buffer.
+
+        Clip edits (trim, fades, pitch, volume) are non-destructive
+        parameters, so copies never need their own PCM data. numpy
+        buffers are handed over as read-only views so an accidental
+        in-place write can't leak into the other clips.
+
+        Args:
+            start_time: Start time of the copy (defaults to this clip's)
+            name: Name of the copy (defaults to this clip's)
+        """
+        buffer = self.buffer
+        if hasattr(buffer, "flags"):  # numpy array
+            buffer = buffer.view()
+            buffer.flags.writeable = False
+        # Duplicating many clips is common (loops, track copies): clone the
+        # instance dict in one step instead of running __init__ and then
+        # overwriting every editing parameter
+        new_clip = AudioClip.__new__(AudioClip)
+        d = new_clip.__dict__
+        d.update(self.__dict__)
+        d["buffer"] = buffer
+        if name is not None:
+            d["name"] = name
+        if start_time is not None:
+            d["start_time"] = float(start_time)
+        d["selected"] = False
+        if self._peak_pyramid_buffer is self.buffer:
+            d["_peak_pyramid_buffer"] = buffer
+        else:
+            d["_peak_pyramid"] = d["_peak_pyramid_buffer"] = None
+        return new_clip
+
+    def set_peak_pyramid(self, levels) -> None:
+        """Attach a precomputed peak pyramid for the current buffer.
+
+        Args:
+            levels: Result of build_peak_pyramid(self.buffer)
+        """
+        self._peak_pyramid = levels
+        self._peak_pyramid_buffer = self.buffer
+
+    def _get_peak_pyramid(self):
+        # Rebuilt only if the buffer object was replaced
+        if self._peak_pyramid_buffer is not self.buffer:
+            self.set_peak_pyramid(build_peak_pyramid(self.buffer))
+        return self._peak_pyramid
+
     def _playback_rate(self) -> float:
         # 2^(n/12)
         import math
@@ -233,17 +290,23 @@ class AudioClip:
         Returns:
             List of (min, max) tuples representing peaks
         """
-        if not self.buffer or len(self.buffer) == 0:
+        if len(self.buffer) == 0:
             return [(0.0, 0.0)] * num_points
         # visualize trimmed region of the buffer
         sr = max(1, int(self.sample_rate))
         start_idx = max(0, int(float(self.start_offset) * sr))
         end_limit = len(self.buffer) - int(float(self.end_offset) * sr)
         end_limit = max(start_idx, min(len(self.buffer), end_limit))
-        buf = self.buffer[start_idx:end_limit]
-        if not buf:
+        if end_limit <= start_idx:
             return [(0.0, 0.0)] * num_points
 
+        # Zoomed out: read from the peak pyramid instead of the samples
+        peaks = peaks_from_pyramid(self._get_peak_pyramid(), start_idx, end_limit, num_points)
+        if peaks is not None:
+            return peaks
+
+        buf = self.buffer[start_idx:end_limit]
+
         samples_per_point = max(1, len(buf) // num_points)
         peaks = []
         
@@ -253,7 +316,7 @@ class AudioClip:
             
             if start < len(buf):
                 segment = buf[start:end]
-                if segment:
+                if len(segment):
                     min_val = min(segment)
                     max_val = max(segment)
                     peaks.append((min_val, max_val))
@@ -89,6 +89,22 @@ class Mixer:
         if 0 <= index < len(self.tracks):
             self.tracks[index]["name"] = new_name
     
+    def set_track_volume(self, index: int, volume: float):
+        """Set track volume by index (the player's gain cache is refreshed)."""
+        if 0 <= index < len(self.tracks):
+            self.tracks[index]["volume"] = float(volume)
+            # Invalidate player cache
+            if self._player is not None and hasattr(self._player, 'invalidate_cache'):
+                self._player.invalidate_cache()
+    
+    def set_track_pan(self, index: int, pan: float):
+        """Set track pan (-1.0 to 1.0) by index (the player's gain cache is refreshed)."""
+        if 0 <= index < len(self.tracks):
+            self.tracks[index]["pan"] = float(pan)
+            # Invalidate player cache
+            if self._player is not None and hasattr(self._player, 'invalidate_cache'):
+                self._player.invalidate_cache()
+    
     def set_track_color(self, index: int, color: str):
         """Set track color by index."""
         if 0 <= index < len(self.tracks):
@@ -133,4 +149,23 @@ class Mixer:
             if self.has_soloed_tracks():
                 return track.get("solo", False)
             return True
-        return False
\ No newline at end of file
+        return False
+
+    def track_columns(self) -> dict:
+        """Snapshot track state as parallel columns (structure of arrays).
+
+        One pass over the track dicts; "play" applies the same mute/solo
+        rule as should_play_track without re-scanning for solos per track.
+
+        Returns:
+            Dict of equal-length lists: volume, pan, mute, solo, play
+        """
+        volume = [float(t.get("volume", 1.0)) for t in self.tracks]
+        pan = [float(t.get("pan", 0.0)) for t in self.tracks]
+        mute = [bool(t.get("mute", False)) for t in self.tracks]
+        solo = [bool(t.get("solo", False)) for t in self.tracks]
+        if any(solo):
+            play = [s and not m for m, s in zip(mute, solo)]
+        else:
+            play = [not m for m in mute]
+        return {"volume": volume, "pan": pan, "mute": mute, "solo": solo, "play": play}
@@ -0,0 +1,98 @@
+"""Multi-resolution min/max peak pyramids for waveform drawing."""
+
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+# Samples per block at each pyramid level (finest first)
+PYRAMID_BLOCK_SIZES = (64, 256, 1024, 4096)
+
+
+def build_peak_pyramid(buffer: Sequence[float], block_sizes=PYRAMID_BLOCK_SIZES) -> List[Tuple[int, Sequence[float], Sequence[float]]]:
+    """Compute block-wise min/max of a buffer at several block sizes.
+
+    Each level is derived from the previous one, so the buffer itself is
+    scanned only once.
+
+    Args:
+        buffer: Mono samples
+        block_sizes: Increasing block sizes, each a multiple of the previous
+
+    Returns:
+        List of (block_size, mins, maxs), finest level first; empty when
+        the buffer is shorter than one block
+    """
+    levels = []
+    if len(buffer) < block_sizes[0]:
+        return levels
+
+    if np is not None:
+        data = np.asarray(buffer, dtype=np.float32)
+        prev_size = 1
+        mins = maxs = data
+        for size in block_sizes:
+            # reduceat also handles a partial block at the tail
+            starts = np.arange(0, len(mins), size // prev_size)
+            mins = np.minimum.reduceat(mins, starts)
+            maxs = np.maximum.reduceat(maxs, starts)
+            levels.append((size, mins, maxs))
+            prev_size = size
+        return levels
+
+    prev_size = 1
+    mins = maxs = buffer
+    for size in block_sizes:
+        step = size // prev_size
+        mins = [min(mins[i:i + step]) for i in range(0, len(mins), step)]
+        maxs = [max(maxs[i:i + step]) for i in range(0, len(maxs), step)]
+        levels.append((size, mins, maxs))
+        prev_size = size
+    return levels
+
+
+def peaks_from_pyramid(levels, start_idx: int, end_idx: int, num_points: int):
+    """Get (min, max) peaks for buffer[start_idx:end_idx] from a pyramid.
+
+    Uses the coarsest level whose blocks still fit in one point; segment
+    edges snap to that level's block boundaries.
+
+    Args:
+        levels: Result of build_peak_pyramid
+        start_idx: First sample of the visible region
+        end_idx: End sample (exclusive) of the visible region
+        num_points: Number of peak points to return
+
+    Returns:
+        List of (min, max) tuples, or None if no level is coarse-grained
+        enough to help (caller should scan the samples)
+    """
+    total = end_idx - start_idx
+    samples_per_point = max(1, total // num_points)
+    level = None
+    for entry in levels:
+        if entry[0] <= samples_per_point:
+            level = entry
+    if level is None:
+        return None
+
+    size, mins, maxs = level
+    count = min(num_points, -(-total // samples_per_point))
+    last_block = -(-end_idx // size)
+
+    if np is not None and isinstance(mins, np.ndarray):
+        blocks = (start_idx + np.arange(count) * samples_per_point) // size
+        seg_mins = np.minimum.reduceat(mins[:last_block], blocks)
+        seg_maxs = np.maximum.reduceat(maxs[:last_block], blocks)
+        peaks = list(zip(seg_mins.tolist(), seg_maxs.tolist()))
+    else:
+        blocks = [(start_idx + i * samples_per_point) // size for i in range(count)]
+        blocks.append(last_block)
+        peaks = [
+            (min(mins[blocks[i]:blocks[i + 1]]), max(maxs[blocks[i]:blocks[i + 1]]))
+            for i in range(count)
+        ]
+    peaks.extend([(0.0, 0.0)] * (num_points - count))
+    return peaks
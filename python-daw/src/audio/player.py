@@ -121,28 +121,43 @@ class TimelinePlayer:
         self._track_state_cache = {}
         
         if self.project is not None and hasattr(self.project, 'tracks'):
-            for idx in range(len(self.project.tracks)):
-                should_play = True
-                if self.mixer is not None and hasattr(self.mixer, 'should_play_track'):
-                    should_play = self.mixer.should_play_track(idx)
-                
-                gain = 1.0
-                pan = 0.0
-                if self.mixer is not None and hasattr(self.mixer, "get_track"):
-                    tr = self.mixer.get_track(idx)
-                    if tr is not None:
-                        gain = float(tr.get("volume", 1.0))
-                        pan = float(tr.get("pan", 0.0))
-                
-                # Pre-calculate stereo gain (equal-power pan)
-                angle = (pan + 1) * (math.pi / 4)
-                gL = math.cos(angle) * gain
-                gR = math.sin(angle) * gain
-                
+            n = len(self.project.tracks)
+            if self.mixer is not None and hasattr(self.mixer, 'track_columns'):
+                # Column snapshot: one pass over the mixer instead of a
+                # should_play_track/get_track lookup per track
+                cols = self.mixer.track_columns()
+                m = min(n, len(cols["play"]))
+                play = cols["play"][:m] + [False] * (n - m)
+                gains = cols["volume"][:m] + [1.0] * (n - m)
+                pans = cols["pan"][:m] + [0.0] * (n - m)
+            else:
+                play = [True] * n
+                gains = [1.0] * n
+                pans = [0.0] * n
+                for idx in range(n):
+                    if self.mixer is not None and hasattr(self.mixer, 'should_play_track'):
+                        play[idx] = self.mixer.should_play_track(idx)
+                    if self.mixer is not None and hasattr(self.mixer, "get_track"):
+                        tr = self.mixer.get_track(idx)
+                        if tr is not None:
+                            gains[idx] = float(tr.get("volume", 1.0))
+                            pans[idx] = float(tr.get("pan", 0.0))
+            
+            # Pre-calculate stereo gains (equal-power pan)
+            if np is not None:
+                angle = (np.asarray(pans, dtype=np.float64) + 1) * (math.pi / 4)
+                gains_arr = np.asarray(gains, dtype=np.float64)
+                gL = (np.cos(angle) * gains_arr).tolist()
+                gR = (np.sin(angle) * gains_arr).tolist()
+            else:
+                gL = [math.cos((p + 1) * (math.pi / 4)) * g for p, g in zip(pans, gains)]
+                gR = [math.sin((p + 1) * (math.pi / 4)) * g for p, g in zip(pans, gains)]
+            
+            for idx in range(n):
                 self._track_state_cache[idx] = {
-                    'should_play': should_play,
-                    'gainL': gL,
-                    'gainR': gR,
+                    'should_play': play[idx],
+                    'gainL': gL[idx],
+                    'gainR': gR[idx],
                 }
         
         # Master volume
@@ -218,10 +233,11 @@ class TimelinePlayer:
         # Update current time
         with self._lock:
             self._current_time = start_t
-            # update peaks for UI
+            # update peaks for UI (max/min reductions: no abs() temporaries
+            # allocated in the audio callback)
             try:
-                self._last_peak_L = float(np.max(np.abs(outL)))
-                self._last_peak_R = float(np.max(np.abs(outR)))
+                self._last_peak_L = float(max(outL.max(), -outL.min()))
+                self._last_peak_R = float(max(outR.max(), -outR.min()))
             except Exception:
                 self._last_peak_L = 0.0
                 self._last_peak_R = 0.0
@@ -1,39 +1,248 @@
+import weakref
+from array import array
+from bisect import bisect_left
 from typing import List, Tuple
 
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
 
 class Timeline:
     """Simple timeline managing (track_index, clip) placements.
 
     API keeps it lean and OOP; no overengineering, but ready to scale.
+    Clips are stored in one bucket per track (list position = track index),
+    so per-track queries and track removal don't scan every placement.
+
+    Range queries use a per-track index sorted by start time, built lazily.
+    Clips are moved and resized in place by the UI, so whoever changes clip
+    timing without going through this class must call ``invalidate()``
+    (the timeline canvas does it on every redraw).
+
+    The index is usually built by the player's audio thread while the Tk
+    thread keeps editing, so each invalidation bumps a generation counter
+    and a build only stays cached if no invalidation happened meanwhile.
     """
 
     def __init__(self):
-        self._placements: List[Tuple[int, object]] = []  # (track_index, clip)
+        self._clips_per_track: List[List[object]] = []  # [track_index] -> clips
+        # Lazily built range index: [(starts, ends, clips, max_length,
+        # end_time)] per track, sorted by start (numpy arrays when available)
+        self._range_index = None
+        self._index_generation = 0  # bumped by every invalidate()
+        # (file_path, sample_rate, length) -> buffer of a clip on the timeline
+        self._shared_buffers = weakref.WeakValueDictionary()
+
+    @property
+    def _placements(self) -> List[Tuple[int, object]]:
+        """Flat (track_index, clip) view, ordered by track (legacy layout)."""
+        return [(ti, clip) for ti, bucket in enumerate(self._clips_per_track) for clip in bucket]
+
+    @_placements.setter
+    def _placements(self, placements):
+        self._clips_per_track = []
+        self.add_clips(placements)
+
+    def _bucket(self, track_index: int) -> List[object]:
+        ti = int(track_index)
+        if ti < 0:
+            raise ValueError(f"Invalid track index: {track_index}")
+        buckets = self._clips_per_track
+        while len(buckets) <= ti:
+            buckets.append([])
+        return buckets[ti]
+
+    def invalidate(self):
+        """Drop the range index after clips were moved or resized in place."""
+        # Bump first: a build finishing meanwhile then sees the new
+        # generation and drops its index (see _build_range_index)
+        self._index_generation += 1
+        self._range_index = None
+
+    def _share_buffer(self, clip):
+        """Point an audio clip at an identical buffer already on the timeline.
+
+        Copies and imports of the same file already share one buffer; this
+        catches clips that were decoded separately (e.g. on project load).
+        Candidates are matched by source file, rate and length and only
+        shared when the samples are equal.
+        """
+        file_path = getattr(clip, "file_path", None)
+        buffer = getattr(clip, "buffer", None)
+        if not file_path or buffer is None or np is None:
+            return
+        key = (file_path, getattr(clip, "sample_rate", None), len(buffer))
+        try:
+            shared = self._shared_buffers.get(key)
+            if shared is None:
+                self._shared_buffers[key] = buffer
+            elif shared is not buffer and np.array_equal(shared, buffer):
+                clip.buffer = shared
+        except TypeError:
+            pass  # Python lists can't be weakly referenced
 
     def add_clip(self, track_index: int, clip):
-        self._placements.append((int(track_index), clip))
+        self._share_buffer(clip)
+        self._bucket(track_index).append(clip)
+        self.invalidate()
+
+    def add_clips(self, placements):
+        """Add many (track_index, clip) placements, invalidating the index once."""
+        share = self._share_buffer
+        bucket = self._bucket
+        for ti, clip in placements:
+            share(clip)
+            bucket(ti).append(clip)
+        self.invalidate()
 
     def remove_clip(self, track_index: int, clip):
-        try:
-            self._placements.remove((int(track_index), clip))
-        except ValueError:
-            pass
+        ti = int(track_index)
+        if 0 <= ti < len(self._clips_per_track):
+            try:
+                self._clips_per_track[ti].remove(clip)
+            except ValueError:
+                pass
+            self.invalidate()
+
+    def remove_clips(self, placements):
+        """Remove many (track_index, clip) placements in one pass per track.
+
+        Clips are matched by identity, so each affected bucket is filtered
+        once instead of one list.remove scan per clip.
+        """
+        by_track = {}
+        for ti, clip in placements:
+            by_track.setdefault(int(ti), set()).add(id(clip))
+        buckets = self._clips_per_track
+        for ti, ids in by_track.items():
+            if 0 <= ti < len(buckets):
+                buckets[ti] = [c for c in buckets[ti] if id(c) not in ids]
+        self.invalidate()
+
+    def remove_track(self, track_index: int):
+        """Drop a track's clips; clips on later tracks shift down by one."""
+        ti = int(track_index)
+        if 0 <= ti < len(self._clips_per_track):
+            self._clips_per_track.pop(ti)
+            self.invalidate()
+
+    def clear(self):
+        """Remove all clips."""
+        self._clips_per_track = []
+        self.invalidate()
+
+    def _build_range_index(self):
+        generation = self._index_generation
+        index = []
+        for bucket in self._clips_per_track:
+            entries = []
+            max_length = 0.0
+            end_time = 0.0
+            for clip in bucket:
+                start = getattr(clip, "start_time", None)
+                if start is None:
+                    continue
+                start = float(start)
+                end = float(clip.end_time)
+                entries.append((start, end, clip))
+                max_length = max(max_length, end - start)
+                end_time = max(end_time, end)
+            entries.sort(key=lambda e: e[0])
+            if np is not None:
+                starts = np.fromiter((e[0] for e in entries), dtype=np.float64, count=len(entries))
+                ends = np.fromiter((e[1] for e in entries), dtype=np.float64, count=len(entries))
+            else:
+                starts = array("d", [e[0] for e in entries])
+                ends = array("d", [e[1] for e in entries])
+            index.append((starts, ends, [e[2] for e in entries], max_length, end_time))
+        # Cache the index, then drop it again if clips changed while it was
+        # built (checking afterwards can't miss an invalidate() in between).
+        # The caller still gets this index for its own query.
+        self._range_index = index
+        if self._index_generation != generation:
+            self._range_index = None
+        return index
 
     def get_clips_for_range(self, start_time: float, end_time: float):
-        """Yield (track_index, clip) for clips overlapping [start_time, end_time)."""
+        """Yield (track_index, clip) for clips overlapping [start_time, end_time).
+
+        Per track, only clips starting between start_time minus the longest
+        clip length and end_time are candidates (binary search on sorted
+        starts); their ends are then tested in one vectorized comparison
+        when numpy is available.
+        """
         s = float(start_time)
         e = float(end_time)
-        for ti, clip in self._placements:
-            if getattr(clip, "start_time", None) is None:
+        index = self._range_index
+        if index is None:
+            index = self._build_range_index()
+        for ti, (starts, ends, clips, max_length, _) in enumerate(index):
+            # Small margin so float rounding of end - start can't drop a clip
+            if np is not None:
+                lo = int(np.searchsorted(starts, s - max_length - 1e-9, side="left"))
+                hi = int(np.searchsorted(starts, e, side="left"))
+                if lo < hi:
+                    for j in np.nonzero(ends[lo:hi] > s)[0]:
+                        yield ti, clips[lo + j]
                 continue
-            if clip.end_time > s and clip.start_time < e:
-                yield ti, clip
+            lo = bisect_left(starts, s - max_length - 1e-9)
+            hi = bisect_left(starts, e)
+            for j in range(lo, hi):
+                if ends[j] > s:
+                    yield ti, clips[j]
+
+    def get_track_end_time(self, track_index: int) -> float:
+        """End time of the last clip on a track (0.0 if it has none).
+
+        Computed along with the range index, so repeated calls between
+        edits are a lookup.
+        """
+        ti = int(track_index)
+        index = self._range_index
+        if index is None:
+            index = self._build_range_index()
+        if not 0 <= ti < len(index):
+            return 0.0
+        return index[ti][4]
+
+    def get_end_time(self) -> float:
+        """End time of the last clip on any track (0.0 if empty)."""
+        index = self._range_index
+        if index is None:
+            index = self._build_range_index()
+        return max((entry[4] for entry in index), default=0.0)
+
+    def snapshot(self) -> "Timeline":
+        """Return a new timeline holding copies of all clips.
+
+        Copies share the clips' sample buffers, so this is cheap. Later
+        moves, trims or deletions here don't reach the snapshot, which
+        makes it safe to render on a worker thread.
+        """
+        snap = Timeline()
+        snap._clips_per_track = [[clip.copy() for clip in bucket] for bucket in self._clips_per_track]
+        return snap
 
     def all_placements(self):
-        return list(self._placements)
+        return self._placements
 
     def get_clips_for_track(self, track_index: int):
-        lst = [c for ti, c in self._placements if ti == int(track_index)]
+        """Return a new list of a track's clips sorted by start time.
+
+        The range index already holds each track's clips in that order, so
+        it is copied when built (and covering every clip of the track);
+        otherwise the bucket is sorted.
+        """
+        ti = int(track_index)
+        if not 0 <= ti < len(self._clips_per_track):
+            return []
+        bucket = self._clips_per_track[ti]
+        index = self._range_index
+        if index is not None and ti < len(index) and len(index[ti][2]) == len(bucket):
+            return list(index[ti][2])
+        lst = list(bucket)
         try:
             lst.sort(key=lambda c: getattr(c, "start_time", 0.0))
         except Exception:
@@ -41,4 +250,7 @@ class Timeline:
         return lst
 
     def count_clips_for_track(self, track_index: int) -> int:
-        return sum(1 for ti, _ in self._placements if ti == int(track_index))
\ No newline at end of file
+        ti = int(track_index)
+        if not 0 <= ti < len(self._clips_per_track):
+            return 0
+        return len(self._clips_per_track[ti])
@@ -61,6 +61,29 @@ class MidiClip:
     def add_note(self, note: MidiNote):
         self.notes.append(note)
 
+    def copy(self, start_time: Optional[float] = None, name: Optional[str] = None) -> "MidiClip":
+        """Return a copy of the clip with its own notes.
+
+        Notes are edited in place by the piano roll, so they are cloned;
+        the instrument is shared.
+
+        Args:
+            start_time: Start time of the copy (defaults to this clip's)
+            name: Name of the copy (defaults to this clip's)
+        """
+        # Positional construction: much cheaper than keyword args per note
+        note_cls = MidiNote
+        notes = [note_cls(n.pitch, n.start, n.duration, n.velocity) for n in self.notes]
+        return MidiClip(
+            self.name if name is None else name,
+            notes,
+            self.start_time if start_time is None else start_time,
+            self.duration,
+            self.color,
+            self.instrument,
+            self.sample_rate,
+        )
+
     # --- Audio interface ---
     def slice_samples(self, start_sec: float, end_sec: float) -> Sequence[float]:
         """Render notes overlapping [start_sec, end_sec) in clip-local time.
@@ -0,0 +1,54 @@
+"""Ballistics for the output level meters."""
+
+# Seconds for a full-scale reading to fall back to zero
+METER_RELEASE_SECONDS = 3.0
+
+
+class PeakMeterEnvelope:
+    """Envelope follower for one meter bar: instant attack, linear release.
+
+    Peaks from the player jump the bar up immediately and then let it fall
+    at a fixed rate, so short dips and noise don't make it flicker. Levels
+    are quantized to the bar's pixel width and ``update`` only returns a
+    value when the drawn length changes, so callers can skip the
+    Progressbar write (and the repaint it schedules) otherwise.
+    """
+
+    def __init__(self, width: int, release_seconds: float = METER_RELEASE_SECONDS):
+        """
+        Args:
+            width: Bar length in pixels
+            release_seconds: Time to fall from full scale to zero
+        """
+        self.width = max(1, int(width))
+        self.release_per_second = 1.0 / release_seconds
+        self.level = 0.0
+        self._last_time = None
+        self._shown = 0  # drawn bar length in pixels
+
+    def update(self, peak: float, now: float):
+        """Feed a new peak reading.
+
+        Args:
+            peak: Peak level (clamped to [0, 1])
+            now: Current time in seconds (time.monotonic())
+
+        Returns:
+            The level to draw, or None if the bar would not move
+        """
+        peak = 0.0 if peak < 0.0 else (1.0 if peak > 1.0 else peak)
+        level = self.level
+        if self._last_time is not None and level > 0.0:
+            level -= (now - self._last_time) * self.release_per_second
+        self._last_time = now
+        if peak >= level:
+            level = peak
+        elif level < 0.0:
+            level = 0.0
+        self.level = level
+
+        shown = int(level * self.width)
+        if shown == self._shown:
+            return None
+        self._shown = shown
+        return level
@@ -20,6 +20,7 @@ except Exception:  # pragma: no cover
     ttk = None
     tkfont = None
 
+import functools
 from typing import List, Optional, Tuple, Set
 from dataclasses import dataclass
 
@@ -1062,16 +1063,25 @@ class PianoRollEditor:
         note = notes[pitch % 12]
         return f"{note}{octave}"
         
-    def _adjust_color_brightness(self, hex_color: str, factor: float) -> str:
-        """Adjust color brightness by factor (0.0-1.0)."""
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _adjust_color_brightness(hex_color: str, factor: float) -> str:
+        """Adjust color brightness by factor (0.0-1.0).
+
+        Memoized: called per drawn note, but only with the clip color and
+        one of 128 velocity factors.
+        """
         try:
             # Remove # if present
             hex_color = hex_color.lstrip('#')
             
-            # Convert to RGB
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
+            # Convert to RGB (one int parse, channels split with shifts)
+            if len(hex_color) != 6:
+                raise ValueError(hex_color)
+            packed = int(hex_color, 16)
+            r = packed >> 16
+            g = (packed >> 8) & 0xFF
+            b = packed & 0xFF
             
             # Adjust brightness
             factor = max(0.3, min(1.0, factor))  # Clamp to reasonable range
@@ -49,9 +49,11 @@ class ProjectManager:
         # Clear current project
         if self.window.timeline:
             # Remove all clips from timeline using Timeline's API
-            all_clips = list(self.window.timeline.all_placements())
-            for track_idx, clip in all_clips:
-                self.window.timeline.remove_clip(track_idx, clip)
+            self.window.timeline.clear()
+        
+        # Don't keep the old project's decoded imports pinned in memory
+        from src.utils.audio_io_cache import clear_audio_cache
+        clear_audio_cache()
         
         # Reset project properties
         self.window.project.name = "Untitled"
@@ -108,7 +110,11 @@ class ProjectManager:
             # Update timeline - clear existing clips and add loaded ones
             if self.window.timeline:
                 # Clear all existing clips from timeline
-                self.window.timeline._placements.clear()
+                self.window.timeline.clear()
+                
+                # Don't keep the old project's decoded imports pinned in memory
+                from src.utils.audio_io_cache import clear_audio_cache
+                clear_audio_cache()
                 
                 # Add all clips from loaded tracks to timeline
                 for track_idx, track in enumerate(self.window.project.tracks):
@@ -136,6 +142,11 @@ class ProjectManager:
                         
                         # Add clip to timeline
                         self.window.timeline.add_clip(track_idx, clip)
+                
+                # Waveform peaks: build in the background, not on first draw
+                self._prebuild_peak_pyramids(
+                    clip for track in self.window.project.tracks for clip in track.audio_files
+                )
             
             # Stop player if running and reset position
             if self.window.player:
@@ -201,6 +212,46 @@ class ProjectManager:
                 self.window._status.set(f"⚠ Failed to load project: {str(e)}")
             print(f"✗ Load error: {e}")
     
+    def _prebuild_peak_pyramids(self, clips):
+        """Build waveform peak pyramids for loaded audio clips on the I/O pool.
+        
+        Without this every clip builds its pyramid on the Tk thread the
+        first time it is drawn. Clips sharing a buffer share one build.
+        """
+        from src.audio.clip import AudioClip
+        from src.audio.peaks import build_peak_pyramid
+        
+        results = getattr(self.window, '_worker_results', None)
+        pool = getattr(self.window, '_io_pool', None)
+        if results is None or pool is None:
+            return
+        
+        by_buffer = {}
+        for clip in clips:
+            if isinstance(clip, AudioClip) and len(clip.buffer):
+                by_buffer.setdefault(id(clip.buffer), []).append(clip)
+        
+        def _attach(group, buffer, future):
+            try:
+                levels = future.result()
+            except Exception:
+                return  # Drawing builds it lazily instead
+            for clip in group:
+                # Skip clips whose buffer changed or that already built one
+                if clip.buffer is buffer and clip._peak_pyramid_buffer is not buffer:
+                    clip.set_peak_pyramid(levels)
+            if self.window._track_clip_manager:
+                self.window._track_clip_manager.schedule_redraw()
+        
+        # Results are attached on the Tk thread (see TkResultQueue)
+        for group in by_buffer.values():
+            buffer = group[0].buffer
+            results.submit(
+                pool, build_peak_pyramid,
+                lambda f, g=group, b=buffer: _attach(g, b, f),
+                buffer
+            )
+    
     def save_project(self):
         """Save the current project."""
         if self._project_file_path:
@@ -263,10 +314,8 @@ class ProjectManager:
                     project_track.volume = mixer_track.get("volume", 1.0)
                     
                     # Sync clips from timeline to track
-                    project_track.audio_files = []
-                    clips = self.window.timeline.get_clips_for_track(i)
-                    for clip in clips:
-                        project_track.audio_files.append(clip)
+                    # get_clips_for_track returns a new list
+                    project_track.audio_files = self.window.timeline.get_clips_for_track(i)
                     print(f"Syncing track {i}: '{project_track.name}' vol={project_track.volume:.2f} with {len(project_track.audio_files)} clips")
             
             # Save project
@@ -330,12 +379,9 @@ class ProjectManager:
             else:
                 # Find the extent of all clips in the timeline
                 if self.window.timeline:
-                    max_end = 0.0
-                    clip_count = 0
-                    for track_idx, clip in self.window.timeline.all_placements():
-                        if hasattr(clip, 'end_time'):
-                            max_end = max(max_end, clip.end_time)
-                            clip_count += 1
+                    timeline = self.window.timeline
+                    clip_count = len(timeline.all_placements())
+                    max_end = timeline.get_end_time()
                     
                     if clip_count == 0:
                         if messagebox:
@@ -59,6 +59,21 @@ class ThemeManager:
             style.map("Active.Tool.TButton",
                      background=[("active", "#b91c1c"), ("pressed", "#991b1b")])
 
+            # Track row mute/solo buttons (off / engaged)
+            for name, on_bg, on_active in (("Mute", "#dc2626", "#b91c1c"),
+                                           ("Solo", "#eab308", "#ca8a04")):
+                for state, bg, active in (("Off", "#404040", "#4a4a4a"), ("On", on_bg, on_active)):
+                    style_name = f"{name}.{state}.TButton"
+                    style.configure(style_name,
+                                    background=bg,
+                                    foreground="#ffffff",
+                                    borderwidth=0,
+                                    focuscolor="none",
+                                    padding=(4, 1),
+                                    font=("Segoe UI", 9, "bold"))
+                    style.map(style_name,
+                             background=[("active", active), ("pressed", active)])
+
             # Status bar
             style.configure("Status.TLabel",
                             background="#252525",
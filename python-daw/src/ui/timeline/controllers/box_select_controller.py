@@ -1,7 +1,11 @@
 """Box selection controller for rectangular clip selection."""
 
+import logging
+import math
 from typing import Optional, Tuple, Callable, List, Any
 
+_log = logging.getLogger(__name__)
+
 
 class BoxSelectController:
     """Handles box selection (rectangular selection) logic."""
@@ -17,15 +21,25 @@ class BoxSelectController:
         self.box_selection_rect: Optional[int] = None  # Canvas item ID
         self.on_invalidate: Optional[Callable] = None
     
-    def start_selection(self, mouse_x: float, mouse_y: float):
+    def start_selection(self, mouse_x: float, mouse_y: float, canvas=None):
         """Start box selection.
         
         Args:
             mouse_x: Mouse x coordinate
             mouse_y: Mouse y coordinate
+            canvas: Tkinter canvas; when given, the selection rectangle is
+                created once (hidden) and only moved while dragging
         """
         self.box_selection_start = (mouse_x, mouse_y)
         self.box_selection_rect = None
+        
+        if canvas is not None:
+            self.box_selection_rect = canvas.create_rectangle(
+                mouse_x, mouse_y, mouse_x, mouse_y,
+                outline="#60a5fa", width=2, dash=(4, 4),
+                fill="#3b82f6", stipple="gray25",
+                state="hidden", tags="box_selection"
+            )
     
     def update_selection(self, canvas, mouse_x: float, mouse_y: float):
         """Update box selection visual.
@@ -46,22 +60,20 @@ class BoxSelectController:
         x2 = max(start_x, mouse_x)
         y2 = max(start_y, mouse_y)
         
-        # Delete previous selection rectangle
+        # Move the existing rectangle; create it only on first use
         if self.box_selection_rect is not None:
-            try:
-                canvas.delete(self.box_selection_rect)
-            except Exception:
-                pass
-        
-        # Draw selection rectangle
-        self.box_selection_rect = canvas.create_rectangle(
-            x1, y1, x2, y2,
-            outline="#60a5fa", width=2, dash=(4, 4),
-            fill="#3b82f6", stipple="gray25",
-            tags="box_selection"
-        )
-        
-        print(f"📦 Drawing box: ({x1:.0f},{y1:.0f}) → ({x2:.0f},{y2:.0f})")
+            canvas.coords(self.box_selection_rect, x1, y1, x2, y2)
+            canvas.itemconfigure(self.box_selection_rect, state="normal")
+        else:
+            self.box_selection_rect = canvas.create_rectangle(
+                x1, y1, x2, y2,
+                outline="#60a5fa", width=2, dash=(4, 4),
+                fill="#3b82f6", stipple="gray25",
+                tags="box_selection"
+            )
+        
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Drawing box: (%.0f,%.0f) -> (%.0f,%.0f)", x1, y1, x2, y2)
     
     def complete_selection(
         self,
@@ -74,7 +86,7 @@ class BoxSelectController:
         
         Args:
             canvas: Tkinter canvas
-            timeline: Timeline object with all_placements method
+            timeline: Timeline object with get_clips_for_range method
             current_mouse_x: Current mouse x coordinate
             current_mouse_y: Current mouse y coordinate
             
@@ -94,16 +106,20 @@ class BoxSelectController:
         
         selected_clips = []
         
-        # Find clips within selection box
+        # Find clips within selection box: a time-range query on the
+        # timeline's range index, restricted to the tracks the box spans
         if timeline is not None:
+            geometry = self.geometry
+            first_track = max(0, math.floor((y1 - geometry.ruler_height) / geometry.track_height))
+            last_track = math.ceil((y2 - geometry.ruler_height) / geometry.track_height) - 1
             try:
-                for track_idx, clip in timeline.all_placements():
-                    clip_x0, clip_y0, clip_x1, clip_y1 = self.geometry.clip_bounds(clip, track_idx)
-                    
-                    # Check if clip intersects with selection box
-                    if (clip_x0 < x2 and clip_x1 > x1 and
-                        clip_y0 < y2 and clip_y1 > y1):
-                        selected_clips.append((track_idx, clip))
+                selected_clips = [
+                    (track_idx, clip)
+                    for track_idx, clip in timeline.get_clips_for_range(
+                        geometry.x_to_time(x1), geometry.x_to_time(x2)
+                    )
+                    if first_track <= track_idx <= last_track
+                ]
             except Exception:
                 pass
         
@@ -17,6 +17,9 @@ class DragController:
         self.snap_service = snap_service
         self.drag_data: Optional[Dict[str, Any]] = None
         self.on_invalidate: Optional[Callable] = None
+        # Called with the moved clip instead of on_invalidate when set,
+        # so the view can update only that clip's canvas items
+        self.on_clip_changed: Optional[Callable] = None
     
     def start_drag(self, clip, track_idx: int, mouse_x: float):
         """Start dragging a clip.
@@ -60,7 +63,14 @@ class DragController:
         # Check track change
         track_idx = self.geometry.y_to_track(mouse_y)
         if track_idx is not None and mixer is not None:
-            track_idx = max(0, min(track_idx, len(mixer.tracks) - 1))
+            # Tracks can't be added or removed mid-drag: count them once
+            last_track = self.drag_data.get('last_track')
+            if last_track is None:
+                last_track = self.drag_data['last_track'] = len(mixer.tracks) - 1
+            if track_idx > last_track:
+                track_idx = last_track
+            if track_idx < 0:
+                track_idx = 0
             
             if track_idx != self.drag_data['track']:
                 # Move clip to different track
@@ -68,7 +78,9 @@ class DragController:
                 self.drag_data['track'] = track_idx
                 # Caller should handle timeline.move_clip(old_track, track_idx, clip)
         
-        if self.on_invalidate:
+        if self.on_clip_changed:
+            self.on_clip_changed(clip)
+        elif self.on_invalidate:
             self.on_invalidate()
         
         return True
@@ -1,6 +1,6 @@
 """Loop marker controller for loop region dragging."""
 
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 
 
 class LoopMarkerController:
@@ -18,12 +18,35 @@ class LoopMarkerController:
         self.dragging_loop_marker: Optional[str] = None  # "start" or "end"
         self.marker_click_threshold: int = 15  # Detection zone in pixels
         self.on_invalidate: Optional[Callable] = None
+        # (enabled, x_start, x_end) in pixels; refreshed on redraw/drag so
+        # hover hit tests don't take the player lock on every <Motion>
+        self._loop_cache: Optional[Tuple[bool, float, float]] = None
+    
+    def refresh_loop_cache(self, player):
+        """Snapshot the loop state in pixels.
+        
+        Call after loop points or zoom change (the canvas does it on redraw).
+        
+        Args:
+            player: Player object with get_loop method
+        """
+        try:
+            loop_enabled, loop_start, loop_end = player.get_loop()
+        except Exception:
+            self._loop_cache = None
+            return
+        self._loop_cache = (
+            loop_enabled,
+            self.geometry.time_to_x(loop_start),
+            self.geometry.time_to_x(loop_end)
+        )
     
     def check_loop_marker_hit(
         self,
         mouse_x: float,
         mouse_y: float,
-        player
+        player,
+        on_ruler: bool = False
     ) -> Optional[str]:
         """Check if mouse is over a loop marker.
         
@@ -31,6 +54,8 @@ class LoopMarkerController:
             mouse_x: Mouse x coordinate
             mouse_y: Mouse y coordinate
             player: Player object with get_loop method
+            on_ruler: True when coordinates come from the ruler canvas,
+                which restricts the hit area to the ruler strip
             
         Returns:
             "start" for start marker, "end" for end marker, None otherwise
@@ -39,26 +64,31 @@ class LoopMarkerController:
             return None
         
         # Only check in ruler area
-        if mouse_y > self.geometry.ruler_height + 30:
+        if on_ruler:
+            if not 0 <= mouse_y <= self.geometry.ruler_height:
+                return None
+        elif mouse_y > self.geometry.ruler_height + 30:
             return None
         
-        try:
-            loop_enabled, loop_start, loop_end = player.get_loop()
-            if not loop_enabled:
+        if self._loop_cache is None:
+            self.refresh_loop_cache(player)
+            if self._loop_cache is None:
                 return None
-            
-            loop_x_start = self.geometry.time_to_x(loop_start)
-            loop_x_end = self.geometry.time_to_x(loop_end)
-            
-            # Check start marker (higher priority)
-            if abs(mouse_x - loop_x_start) <= self.marker_click_threshold:
-                return "start"
-            
-            # Check end marker
-            if abs(mouse_x - loop_x_end) <= self.marker_click_threshold:
-                return "end"
-        except Exception:
-            pass
+        
+        loop_enabled, loop_x_start, loop_x_end = self._loop_cache
+        if not loop_enabled:
+            return None
+        
+        # Chained comparisons instead of abs() calls
+        limit = self.marker_click_threshold
+        
+        # Check start marker (higher priority)
+        if -limit <= mouse_x - loop_x_start <= limit:
+            return "start"
+        
+        # Check end marker
+        if -limit <= mouse_x - loop_x_end <= limit:
+            return "end"
         
         return None
     
@@ -99,6 +129,8 @@ class LoopMarkerController:
                 if new_time > loop_start:
                     player.set_loop(True, loop_start, new_time)
             
+            self.refresh_loop_cache(player)
+            
             if self.on_invalidate:
                 self.on_invalidate()
             
@@ -18,6 +18,8 @@ class ResizeController:
         self.resize_data: Optional[Dict[str, Any]] = None
         self.resize_handle_size: int = 12  # Detection zone size in pixels
         self.on_invalidate: Optional[Callable] = None
+        # Called with the resized clip instead of on_invalidate when set
+        self.on_clip_changed: Optional[Callable] = None
     
     def check_resize_edge(self, mouse_x: float, clip, track_idx: int) -> Optional[str]:
         """Check if mouse is over a resize edge.
@@ -31,13 +33,14 @@ class ResizeController:
             "left" for left edge, "right" for right edge, None otherwise
         """
         x0, _, x1, _ = self.geometry.clip_bounds(clip, track_idx)
+        size = self.resize_handle_size
         
         # Check left edge (higher priority)
-        if abs(mouse_x - x0) <= self.resize_handle_size:
+        if -size <= mouse_x - x0 <= size:
             return "left"
         
         # Check right edge
-        if abs(mouse_x - x1) <= self.resize_handle_size:
+        if -size <= mouse_x - x1 <= size:
             return "right"
         
         return None
@@ -94,7 +97,9 @@ class ResizeController:
                 new_duration = new_time - clip.start_time
                 clip.duration = new_duration
         
-        if self.on_invalidate:
+        if self.on_clip_changed:
+            self.on_clip_changed(clip)
+        elif self.on_invalidate:
             self.on_invalidate()
         
         return True
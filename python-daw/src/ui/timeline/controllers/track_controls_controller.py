@@ -125,7 +125,7 @@ class TrackControlsController:
         volume = max(0.0, min(1.0, volume))
         
         # Update mixer
-        mixer.tracks[track_idx]['volume'] = volume
+        mixer.set_track_volume(track_idx, volume)
         
         if self.on_invalidate:
             self.on_invalidate()
@@ -189,7 +189,7 @@ class TrackControlsController:
             pan = 0.0
         
         # Update mixer
-        mixer.tracks[track_idx]['pan'] = pan
+        mixer.set_track_pan(track_idx, pan)
         
         if self.on_invalidate:
             self.on_invalidate()
@@ -2,6 +2,11 @@
 
 from typing import Optional, Tuple
 
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
 
 class TimelineGeometry:
     """Handles all coordinate conversions and dimension calculations for the timeline."""
@@ -25,6 +30,9 @@ class TimelineGeometry:
         self.track_height = track_height
         self.ruler_height = ruler_height
         self.left_margin = left_margin
+        # Cached per-track (y_top, y_bottom) arrays, see track_bands()
+        self._bands_key = None
+        self._bands = ((), ())
     
     # Coordinate conversions
     
@@ -77,6 +85,31 @@ class TimelineGeometry:
         track_idx = int((y - self.ruler_height) / self.track_height)
         return track_idx if track_idx >= 0 else None
     
+    def track_bands(self, track_count: int):
+        """Get the vertical band of every track.
+        
+        The arrays are cached and only rebuilt when the track count or the
+        track/ruler height changes.
+        
+        Args:
+            track_count: Number of tracks
+            
+        Returns:
+            Tuple (y_tops, y_bottoms), numpy arrays when available
+            (lists otherwise), indexed by track
+        """
+        key = (track_count, self.ruler_height, self.track_height)
+        if key != self._bands_key:
+            if np is not None:
+                y0s = self.ruler_height + np.arange(track_count) * self.track_height
+                y1s = y0s + self.track_height
+            else:
+                y0s = [self.ruler_height + i * self.track_height for i in range(track_count)]
+                y1s = [y + self.track_height for y in y0s]
+            self._bands = (y0s, y1s)
+            self._bands_key = key
+        return self._bands
+    
     def clip_bounds(self, clip, track_idx: int) -> Tuple[float, float, float, float]:
         """Get canvas bounds (x0, y0, x1, y1) for a clip.
         
@@ -98,7 +131,7 @@ class TimelineGeometry:
         """Calculate timeline width based on content.
         
         Args:
-            timeline: Timeline object with all_placements() method
+            timeline: Timeline object with get_end_time() method
             min_width: Minimum width in pixels
             
         Returns:
@@ -108,8 +141,7 @@ class TimelineGeometry:
         
         if timeline is not None:
             try:
-                for _, clip in timeline.all_placements():
-                    max_end = max(max_end, clip.end_time)
+                max_end = max(max_end, timeline.get_end_time())
             except Exception:
                 pass
         
@@ -130,7 +130,7 @@ class MouseEventCoordinator:
             y = event.y
             
             if self.loop_marker_controller and player:
-                marker = self.loop_marker_controller.check_loop_marker_hit(x, y, player)
+                marker = self.loop_marker_controller.check_loop_marker_hit(x, y, player, on_ruler=True)
                 if marker:
                     self.loop_marker_controller.start_drag(marker)
                     return {'type': 'loop_marker', 'data': marker}
@@ -157,7 +157,7 @@ class MouseEventCoordinator:
         # Check for box selection (Shift in track area)
         if shift_pressed and y > self.geometry.ruler_height:
             if self.box_select_controller:
-                self.box_select_controller.start_selection(x, y)
+                self.box_select_controller.start_selection(x, y, canvas)
                 return {'type': 'box_selection_start', 'data': (x, y)}
         
         # Check for clip click
@@ -398,7 +398,7 @@ class MouseEventCoordinator:
             y = event.y
             
             if self.loop_marker_controller and player:
-                marker = self.loop_marker_controller.check_loop_marker_hit(x, y, player)
+                marker = self.loop_marker_controller.check_loop_marker_hit(x, y, player, on_ruler=True)
                 if marker:
                     ruler_canvas.config(cursor="sb_h_double_arrow")
                     return {'type': 'loop_marker_hover', 'cursor': 'sb_h_double_arrow'}
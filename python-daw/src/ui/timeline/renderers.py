@@ -1,6 +1,17 @@
 """Timeline rendering components - modular renderers for different timeline elements."""
 
-from typing import Any, Optional
+import functools
+from typing import Any, Optional, Tuple
+
+
+@functools.lru_cache(maxsize=64)
+def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    """Parse "#rrggbb" once per color (track colors are a small set)."""
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) != 6:
+        raise ValueError(f"Invalid color: #{hex_color}")
+    packed = int(hex_color, 16)
+    return packed >> 16, (packed >> 8) & 0xFF, packed & 0xFF
 
 
 class RulerRenderer:
@@ -367,16 +378,18 @@ class ClipRenderer:
                 continue
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _tint_color(hex_color: str, factor: float) -> str:
+        """Scale a hex color (memoized: one entry per color and velocity)."""
         try:
-            hex_color = hex_color.lstrip('#')
-            r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+            r, g, b = _hex_to_rgb(hex_color)
             r = min(255, int(r * factor))
             g = min(255, int(g * factor))
             b = min(255, int(b * factor))
             return f"#{r:02x}{g:02x}{b:02x}"
         except Exception:
             return hex_color
+
     def _draw_waveform(self, canvas, clip, x0: float, x1: float, y0: float, y1: float):
         """Draw waveform visualization in clip."""
         try:
@@ -437,11 +450,11 @@ class ClipRenderer:
         )
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _lighten_color(hex_color: str, factor: float = 1.3) -> str:
-        """Lighten a hex color."""
+        """Lighten a hex color (memoized)."""
         try:
-            hex_color = hex_color.lstrip('#')
-            r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+            r, g, b = _hex_to_rgb(hex_color)
             r = min(255, int(r * factor))
             g = min(255, int(g * factor))
             b = min(255, int(b * factor))
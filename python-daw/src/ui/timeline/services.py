@@ -15,6 +15,10 @@ class SnapService:
         self.project = project
         self.enabled = False
         self.grid_division = 0.25  # Default: quarter notes
+        # Grid step in seconds and its reciprocal, derived from BPM,
+        # time signature and grid_division; None until next snap
+        self._grid_sec: Optional[float] = None
+        self._inv_grid: float = 0.0
     
     def set_enabled(self, enabled: bool):
         """Enable or disable snapping."""
@@ -27,6 +31,11 @@ class SnapService:
             division: Grid division in fraction of a bar (e.g., 0.25 = quarter notes)
         """
         self.grid_division = division
+        self.invalidate()
+    
+    def invalidate(self):
+        """Drop the cached grid step (call after BPM or time signature changes)."""
+        self._grid_sec = None
     
     def snap_time(self, time: float) -> float:
         """Snap time to grid if enabled.
@@ -40,10 +49,15 @@ class SnapService:
         if not self.enabled or self.project is None:
             return time
         
-        try:
-            return self.project.snap_to_grid(time, self.grid_division)
-        except Exception:
-            return time
+        if self._grid_sec is None:
+            try:
+                grid_sec = self.project.get_bar_duration() * self.grid_division
+                self._inv_grid = 1.0 / grid_sec
+            except Exception:
+                return time
+            self._grid_sec = grid_sec
+        
+        return round(time * self._inv_grid) * self._grid_sec
 
 
 class ClipboardService:
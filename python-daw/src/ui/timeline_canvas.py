@@ -1,8 +1,23 @@
+import contextlib
+import functools
+import logging
+import operator
+from bisect import bisect_left, bisect_right
+
 try:
     import tkinter as tk
 except Exception:  # pragma: no cover
     tk = None
 
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+_log = logging.getLogger(__name__)
+
+_player_time = operator.attrgetter("_current_time")
+
 # Import timeline components for modular architecture
 from .timeline.geometry import TimelineGeometry
 from .timeline.renderers import (
@@ -89,8 +104,29 @@ class TimelineCanvas:
         
         # Clip selection state
         self.selected_clip = None  # (track_index, clip) - backward compatibility
-        self.selected_clips = []  # [(track_index, clip), ...] - multi-selection
-        self.clip_canvas_ids = {}  # {canvas_id: (track_idx, clip)}
+        # Multi-selection as an insertion-ordered set keyed by
+        # (track_index, id(clip)) -> (track_index, clip); exposed as the
+        # selected_clips list property (MidiClip dataclasses aren't hashable)
+        self._selection = {}
+        self._selected_ids = set()  # id(clip) of selected clips, cached per redraw
+        # Hit-test index rebuilt on each redraw (structure of arrays):
+        # _clip_rects[i] = [x0, x1, y0, y1] for the clip in _clip_objs[i]
+        self._clip_rects = []
+        self._clip_objs = []  # [(track_idx, clip), ...]
+        # Per-track hover lookup sorted by x0:
+        # {track_idx: (x0s, x1s, draw_orders, max_width)}
+        self._hit_tracks = {}
+        self._clip_items = {}  # {id(clip): (rect_id, tag, track_idx)}
+        self._n_tracks = 0  # len(mixer.tracks), refreshed on each redraw
+        # Redraw batching: while _batch_depth > 0, _mark_dirty() only records
+        # that a redraw is needed; the outermost batched_updates() flushes it
+        self._batch_depth = 0
+        self._batch_dirty = False
+        
+        # Drag motion coalescing: only the latest <B1-Motion> event is
+        # processed once Tk goes idle
+        self._pending_motion = None
+        self._motion_scheduled = None
         
         # Track selection state
         self.selected_track_idx = None
@@ -139,6 +175,11 @@ class TimelineCanvas:
         self.resize_controller.on_invalidate = self.redraw
         self.loop_marker_controller.on_invalidate = self.redraw
         self.track_controls_controller.on_invalidate = self.redraw
+        
+        # Clip drag/resize only touch the affected clip's items while the
+        # mouse moves; the full redraw happens once on release
+        self.drag_controller.on_clip_changed = self._update_clip_items
+        self.resize_controller.on_clip_changed = self._update_clip_items
     
     def _init_event_coordinator(self):
         """Initialize mouse event coordinator.
@@ -191,12 +232,31 @@ class TimelineCanvas:
         # Result contains info about what was clicked for debugging/logging
     
     def _on_mouse_drag(self, event):
-        """Route drag events to coordinator."""
-        self.event_coordinator.handle_drag(event, self.mixer, self.player)
-        # Result contains info about drag operation
+        """Queue drag events; bursts within one idle cycle are coalesced."""
+        self._pending_motion = event
+        if self._motion_scheduled is None and self.canvas is not None:
+            self._motion_scheduled = self.canvas.after_idle(self._flush_motion)
+        elif self.canvas is None:
+            self._flush_motion()
+    
+    def _flush_motion(self):
+        """Route the latest queued drag event to coordinator."""
+        self._motion_scheduled = None
+        event, self._pending_motion = self._pending_motion, None
+        if event is not None:
+            self.event_coordinator.handle_drag(event, self.mixer, self.player)
+            # Result contains info about drag operation
     
     def _on_mouse_release(self, event):
         """Route release events to coordinator."""
+        # Apply any drag position still waiting for the idle callback
+        if self._motion_scheduled is not None:
+            try:
+                self.canvas.after_cancel(self._motion_scheduled)
+            except Exception:
+                pass
+            self._flush_motion()
+        
         result = self.event_coordinator.handle_release(
             event,
             timeline=self.timeline,
@@ -210,6 +270,10 @@ class TimelineCanvas:
             if clip:
                 print(f"✓ Resize complete: {clip.name} | "
                      f"Start: {clip.start_time:.3f}s | Duration: {clip.duration:.3f}s")
+            self.redraw()
+        
+        elif result['type'] == 'drag_release':
+            self.redraw()
         
         elif result['type'] == 'volume_release' and result.get('data'):
             track_idx = result['data'].get('track')
@@ -231,8 +295,8 @@ class TimelineCanvas:
             if selected:
                 self.selected_clips = selected
                 self.selected_clip = selected[0] if selected else None
-                print(f"📦 Box selection: {len(selected)} clip(s) selected")
-            self.redraw()
+                _log.info("Box selection: %d clip(s) selected", len(selected))
+            self._mark_dirty()
     
     def _on_mouse_motion(self, event):
         """Route motion events to coordinator."""
@@ -286,8 +350,7 @@ class TimelineCanvas:
                 visible=True
             )
             self.redraw()
-            print(f"📍 Paste position set to {self.clipboard_service.paste_position:.2f}s "
-                 f"(press Ctrl+V to paste)")
+            _log.info("Paste position set to %.2fs", self.clipboard_service.paste_position)
         else:
             # No clipboard or clicked in ruler - hide paste cursor
             self.clipboard_service.paste_cursor_visible = False
@@ -353,6 +416,16 @@ class TimelineCanvas:
         """Get track height (backward compatibility)."""
         return self.geometry.track_height
     
+    @property
+    def selected_clips(self):
+        """Get selected clips as a list of (track_index, clip) tuples."""
+        return list(self._selection.values())
+    
+    @selected_clips.setter
+    def selected_clips(self, clips):
+        """Replace the selection with (track_index, clip) tuples."""
+        self._selection = {(ti, id(clip)): (ti, clip) for ti, clip in clips}
+    
     @property
     def ruler_height(self):
         """Get ruler height (backward compatibility)."""
@@ -429,7 +502,7 @@ class TimelineCanvas:
         Returns:
             Height in pixels
         """
-        tracks_count = max(1, len(getattr(self.mixer, 'tracks', [])))
+        tracks_count = max(1, len(self.mixer.tracks) if self.mixer is not None else 0)
         return self.geometry.compute_height(tracks_count)
     
     # =========================================================================
@@ -451,7 +524,17 @@ class TimelineCanvas:
         # Step 1: Clear all canvases (delegate to canvas manager)
         self.canvas_manager.clear_all()
         
+        # BPM/time signature, zoom or loop points may have changed since the last frame
+        self.snap_service.invalidate()
+        # ...and clips may have been moved or resized in place
+        if self.timeline is not None:
+            self.timeline.invalidate()
+        self.loop_marker_controller.refresh_loop_cache(self.player)
+        
         # Step 2: Calculate dimensions
+        # Every path that adds or removes tracks ends with a redraw, so the
+        # cached count stays valid for the motion handlers in between
+        self._n_tracks = len(self.mixer.tracks) if self.mixer is not None else 0
         width = self.compute_width()
         height = self.compute_height()
         
@@ -476,10 +559,49 @@ class TimelineCanvas:
         except Exception:
             pass
     
+    # Ruler lines of the same style are packed into a single multi-point
+    # line item: fewer canvas items means faster redraw and damage repaint
+    # inside Tk. The connecting segments run outside the ruler strip, either
+    # off-canvas or under the track backgrounds (ruler on the main canvas).
+    # Grid lines span the track area, so they stay one item per line.
+    _LINE_PAD = 4
+
+    @staticmethod
+    def _zigzag_path(xs, y0, y1):
+        """Flat coords for vertical lines at xs joined alternately at y0/y1."""
+        coords = []
+        top = True
+        for x in xs:
+            if top:
+                coords.extend((x, y0, x, y1))
+            else:
+                coords.extend((x, y1, x, y0))
+            top = not top
+        return coords
+
+    @staticmethod
+    def _tick_path(xs, y_tip, y_base):
+        """Flat coords for ticks from y_base up to y_tip, joined along y_base."""
+        coords = []
+        for x in xs:
+            coords.extend((x, y_base, x, y_tip, x, y_base))
+        return coords
+
+    def _create_vlines(self, target_canvas, coords, **options):
+        """Create one line item from a flat path (needs at least 2 points)."""
+        if len(coords) >= 4:
+            target_canvas.create_line(*coords, **options)
+
+    def _vline_cmds(self, cmds, xs, y0, y1, opts):
+        """Append Tcl commands creating one vertical line per x (see _draw_grid)."""
+        w = self.canvas._w
+        for x in xs:
+            cmds.append(f"{w} create line {x} {y0} {x} {y1} {opts}")
+
     def _draw_ruler(self, width):
         """Draw the time ruler at the top with time markers on the fixed ruler canvas."""
         # Use ruler_canvas if available, otherwise fall back to main canvas
-        target_canvas = self.ruler_canvas if hasattr(self, 'ruler_canvas') else self.canvas
+        target_canvas = self.ruler_canvas if self.ruler_canvas is not None else self.canvas
         if target_canvas is None:
             return
             
@@ -489,6 +611,9 @@ class TimelineCanvas:
             fill="#1a1a1a", outline=""
         )
         
+        pad = self._LINE_PAD
+        rh = self.ruler_height
+        
         # Draw time markers and divisions
         if self.project is not None:
             # Musical ruler - bars and beats
@@ -497,6 +622,7 @@ class TimelineCanvas:
             max_time = width / self.px_per_sec
             
             # Draw bar markers
+            bar_xs = []
             bar_num = 0
             while True:
                 bar_time = bar_num * bar_duration
@@ -504,9 +630,7 @@ class TimelineCanvas:
                     break
                 
                 x = bar_time * self.px_per_sec
-                
-                # Bar line in ruler
-                target_canvas.create_line(x, 0, x, self.ruler_height, fill="#3b82f6", width=2)
+                bar_xs.append(x)
                 
                 # Bar number
                 target_canvas.create_text(
@@ -515,31 +639,36 @@ class TimelineCanvas:
                 )
                 bar_num += 1
             
+            # Bar lines in ruler
+            self._create_vlines(target_canvas, self._zigzag_path(bar_xs, -pad, rh + pad),
+                                fill="#3b82f6", width=2)
+            
             # Draw beat markers
+            beat_xs = []
             beat_num = 0
             while True:
                 beat_time = beat_num * beat_duration
                 if beat_time > max_time:
                     break
                 
-                x = beat_time * self.px_per_sec
                 is_bar = abs(beat_time % bar_duration) < 0.001
-                
                 if not is_bar:  # Don't overdraw bar lines
-                    # Beat line in ruler
-                    target_canvas.create_line(x, self.ruler_height - 8, x, self.ruler_height, 
-                                          fill="#1e40af", width=1)
+                    beat_xs.append(beat_time * self.px_per_sec)
                 
                 beat_num += 1
+            
+            # Beat lines in ruler
+            self._create_vlines(target_canvas, self._tick_path(beat_xs, rh - 8, rh + pad),
+                                fill="#1e40af", width=1)
         else:
             # Simple time ruler - seconds
             total_secs = int(width / self.px_per_sec) + 1
+            sec_xs = []
+            quarter_xs = []
             
             for sec in range(0, total_secs):
                 x = sec * self.px_per_sec
-                
-                # Second marker
-                target_canvas.create_line(x, 0, x, self.ruler_height, fill="#3b82f6", width=2)
+                sec_xs.append(x)
                 
                 # Time label
                 target_canvas.create_text(
@@ -549,43 +678,55 @@ class TimelineCanvas:
                 
                 # Quarter second markers
                 for q in range(1, 4):
-                    mx = x + q * (self.px_per_sec / 4.0)
-                    target_canvas.create_line(mx, self.ruler_height - 6, mx, self.ruler_height, 
-                                          fill="#60a5fa", width=1)
+                    quarter_xs.append(x + q * (self.px_per_sec / 4.0))
+            
+            self._create_vlines(target_canvas, self._zigzag_path(sec_xs, -pad, rh + pad),
+                                fill="#3b82f6", width=2)
+            self._create_vlines(target_canvas, self._tick_path(quarter_xs, rh - 6, rh + pad),
+                                fill="#60a5fa", width=1)
 
     def _draw_grid(self, width, height):
-        """Draw the musical grid or time grid."""
+        """Draw the musical grid or time grid.
+
+        All lines are emitted as a single Tcl script to avoid the per-item
+        option marshaling of ``create_line``.
+        """
         if self.canvas is None:
             return
             
         if self.project is not None:
-            self._draw_musical_grid(width, height)
+            cmds = self._draw_musical_grid(width, height)
         else:
-            self._draw_time_grid(width, height)
+            cmds = self._draw_time_grid(width, height)
+        
+        if cmds:
+            self.canvas.tk.eval("\n".join(cmds))
 
     def _draw_musical_grid(self, width, height):
-        """Draw musical grid with bars, beats and subdivisions based on grid_division."""
+        """Build the Tcl commands of the musical grid (bars, beats and
+        subdivisions based on grid_division)."""
         bar_duration = self.project.get_bar_duration()
         beat_duration = self.project.get_beat_duration()
         
         max_time = width / self.px_per_sec
+        y0 = self.ruler_height
+        y1 = height
         
-        # PASS 1: Draw bar lines first (strongest - every bar)
+        # PASS 1: Collect bar lines first (strongest - every bar)
+        bar_xs = []
         bar_num = 0
         while True:
             bar_time = bar_num * bar_duration
             if bar_time > max_time:
                 break
             
-            x = bar_time * self.px_per_sec  # No left_margin offset
-            
-            # Bar line - thick bright blue (#3b82f6)
-            self.canvas.create_line(x, self.ruler_height, x, height, fill="#3b82f6", width=3)
-            
+            bar_xs.append(bar_time * self.px_per_sec)  # No left_margin offset
             bar_num += 1
         
-        # PASS 2: Draw ALL grid subdivision lines based on selected grid_division
+        # PASS 2: Collect ALL grid subdivision lines based on selected grid_division
         # grid_division is in fractions of a bar (e.g., 0.25 = 1/4 bar, 0.125 = 1/8 bar)
+        beat_xs = []
+        sub_xs = []
         if self.grid_division > 0:
             grid_time = bar_duration * self.grid_division
             t = grid_time  # Start from first grid point
@@ -601,29 +742,43 @@ class TimelineCanvas:
                     # Skip - already drawn as bar
                     pass
                 elif is_beat:
-                    # Beat line - medium blue, solid (#1e40af)
-                    self.canvas.create_line(x, self.ruler_height, x, height, fill="#1e40af", width=2)
+                    beat_xs.append(x)
                 else:
-                    # Subdivision line - light blue, dashed (#60a5fa)
-                    self.canvas.create_line(x, self.ruler_height, x, height, 
-                                          fill="#60a5fa", width=1, dash=(3, 3))
+                    sub_xs.append(x)
                 
                 t += grid_time
+        
+        cmds = []
+        # Subdivision lines - light blue, dashed (#60a5fa)
+        self._vline_cmds(cmds, sub_xs, y0, y1, "-fill #60a5fa -width 1 -dash {3 3}")
+        # Beat lines - medium blue, solid (#1e40af)
+        self._vline_cmds(cmds, beat_xs, y0, y1, "-fill #1e40af -width 2")
+        # Bar lines - thick bright blue (#3b82f6)
+        self._vline_cmds(cmds, bar_xs, y0, y1, "-fill #3b82f6 -width 3")
+        return cmds
 
     def _draw_time_grid(self, width, height):
-        """Draw simple time-based grid (seconds) - visible on dark background."""
+        """Build the Tcl commands of the simple time-based grid (seconds)."""
         total_secs = int(width / self.px_per_sec) + 1
+        y0 = self.ruler_height
+        y1 = height
+        major_xs = []
+        minor_xs = []
         
         for sec in range(0, total_secs):
             x = sec * self.px_per_sec  # No left_margin offset
+            major_xs.append(x)
             
-            # Major gridline - bright blue like musical grid
-            self.canvas.create_line(x, self.ruler_height, x, height, fill="#3b82f6", width=2)
-            
-            # Minor ticks (quarters) - light blue dashed
+            # Minor ticks (quarters)
             for q in range(1, 4):
-                mx = x + q * (self.px_per_sec / 4.0)
-                self.canvas.create_line(mx, self.ruler_height, mx, height, fill="#60a5fa", width=1, dash=(3, 3))
+                minor_xs.append(x + q * (self.px_per_sec / 4.0))
+        
+        cmds = []
+        # Minor gridlines - light blue dashed
+        self._vline_cmds(cmds, minor_xs, y0, y1, "-fill #60a5fa -width 1 -dash {3 3}")
+        # Major gridlines - bright blue like musical grid, visible on dark background
+        self._vline_cmds(cmds, major_xs, y0, y1, "-fill #3b82f6 -width 2")
+        return cmds
 
     def _draw_track_controls(self):
         """Draw track controls on the fixed left canvas."""
@@ -672,7 +827,8 @@ class TimelineCanvas:
                 font=("Segoe UI", 9, "bold")
             )
             
-            # M/S/FX Buttons (small, top-right of control area)
+            # M/S/FX Buttons (small, top-right of control area); clicks are
+            # hit-tested by position, so all tracks share one tag per button
             btn_y = y0 + 8
             btn_x = self.left_margin - 95
             
@@ -681,13 +837,13 @@ class TimelineCanvas:
             self.controls_canvas.create_rectangle(
                 btn_x, btn_y, btn_x + 20, btn_y + 18,
                 fill=mute_color, outline="#555555", width=1,
-                tags=f"mute_{i}"
+                tags="mute"
             )
             self.controls_canvas.create_text(
                 btn_x + 10, btn_y + 9,
                 text="M", fill="#ffffff",
                 font=("Segoe UI", 8, "bold"),
-                tags=f"mute_{i}"
+                tags="mute"
             )
             
             # Solo button
@@ -695,26 +851,26 @@ class TimelineCanvas:
             self.controls_canvas.create_rectangle(
                 btn_x + 25, btn_y, btn_x + 45, btn_y + 18,
                 fill=solo_color, outline="#555555", width=1,
-                tags=f"solo_{i}"
+                tags="solo"
             )
             self.controls_canvas.create_text(
                 btn_x + 35, btn_y + 9,
                 text="S", fill="#ffffff",
                 font=("Segoe UI", 8, "bold"),
-                tags=f"solo_{i}"
+                tags="solo"
             )
             
             # FX button
             self.controls_canvas.create_rectangle(
                 btn_x + 50, btn_y, btn_x + 72, btn_y + 18,
                 fill="#8b5cf6", outline="#555555", width=1,
-                tags=f"fx_{i}"
+                tags="fx"
             )
             self.controls_canvas.create_text(
                 btn_x + 61, btn_y + 9,
                 text="FX", fill="#ffffff",
                 font=("Segoe UI", 7, "bold"),
-                tags=f"fx_{i}"
+                tags="fx"
             )
             
             # Volume control (slider representation)
@@ -811,41 +967,88 @@ class TimelineCanvas:
             pass
     
     def _draw_track_backgrounds(self, width):
-        """Draw track backgrounds on the main timeline canvas."""
+        """Draw track backgrounds on the main timeline canvas.
+
+        All rectangles are emitted as a single Tcl script to avoid the
+        per-item option marshaling of ``create_rectangle``.
+        """
         if self.canvas is None or self.mixer is None:
             return
             
         tracks_count = len(self.mixer.tracks)
+        y0s, y1s = self.geometry.track_bands(tracks_count)
+        w = self.canvas._w
+        cmds = []
         
         for i in range(tracks_count):
-            y0 = self.ruler_height + i * self.track_height
-            y1 = y0 + self.track_height
+            y0 = y0s[i]
+            y1 = y1s[i]
             
             # Alternating background for timeline area (highlight if selected)
             if self.selected_track_idx == i:
                 bg_color = "#0f172a"  # subtle blue-ish highlight
             else:
                 bg_color = "#0d0d0d" if i % 2 == 0 else "#111111"
-            self.canvas.create_rectangle(
-                0, y0, width, y1,
-                fill=bg_color, outline=""
+            cmds.append(
+                f"{w} create rectangle 0 {y0} {width} {y1} -fill {bg_color} -outline {{}}"
             )
+        
+        if cmds:
+            self.canvas.tk.eval("\n".join(cmds))
 
     def _draw_clips(self):
         """Draw all clips on the timeline."""
         if self.canvas is None or self.timeline is None:
             return
             
-        self.clip_canvas_ids = {}
+        self._clip_rects = []
+        self._clip_objs = []
+        self._clip_items = {}
+        self._selected_ids = {id(clip) for _, clip in self._selection.values()}
         
         try:
             for ti, clip in self.timeline.all_placements():
                 self._draw_clip(ti, clip)
         except Exception:
             pass
+        
+        self._rebuild_hit_tracks()
+
+    def _rebuild_hit_tracks(self):
+        """Group the clip rectangles per track, sorted by left edge."""
+        grouped = {}
+        for order, (track_idx, _) in enumerate(self._clip_objs):
+            x0, x1, _, _ = self._clip_rects[order]
+            grouped.setdefault(track_idx, []).append((x0, x1, order))
+        
+        hit_tracks = {}
+        for track_idx, entries in grouped.items():
+            entries.sort()
+            x0s = [e[0] for e in entries]
+            x1s = [e[1] for e in entries]
+            orders = [e[2] for e in entries]
+            max_width = max(x1 - x0 for x0, x1 in zip(x0s, x1s))
+            if np is not None:
+                x0s = np.array(x0s, dtype=np.float64)
+                x1s = np.array(x1s, dtype=np.float64)
+                orders = np.array(orders, dtype=np.int64)
+            hit_tracks[track_idx] = (x0s, x1s, orders, max_width)
+        self._hit_tracks = hit_tracks
 
-    def _draw_clip(self, track_idx, clip):
-        """Draw a single clip."""
+    def _draw_clip(self, track_idx, clip, tag=None):
+        """Draw a single clip.
+
+        Args:
+            track_idx: Track index
+            clip: Clip object
+            tag: Existing canvas tag when redrawing one clip in place;
+                None for a regular redraw, which also records the clip
+                in the hit-test index
+        """
+        register = tag is None
+        if register:
+            tag = f"clip_{len(self._clip_objs)}"
+        
         y0 = self.ruler_height + track_idx * self.track_height
         y1 = y0 + self.track_height
         x0 = int(clip.start_time * self.px_per_sec)  # No left_margin offset
@@ -863,7 +1066,7 @@ class TimelineCanvas:
             pass
         
         # Check if clip is in multi-selection
-        is_selected = any(c == clip for _, c in self.selected_clips)
+        is_selected = id(clip) in self._selected_ids
         
         # Selection highlight
         border_width = 3 if is_selected else 2
@@ -871,65 +1074,113 @@ class TimelineCanvas:
             clip_border = "#ffffff"
         
         # Clip rectangle
-        clip_id = self.canvas.create_rectangle(
+        rect_id = self.canvas.create_rectangle(
             x0, y0 + 8, x1, y1 - 8,
-            fill=clip_color, outline=clip_border, width=border_width
+            fill=clip_color, outline=clip_border, width=border_width,
+            tags=tag
         )
         
-        self.clip_canvas_ids[clip_id] = (track_idx, clip)
+        self._clip_items[id(clip)] = (rect_id, tag, track_idx)
+        if register:
+            self._clip_rects.append((x0, x1, y0 + 8, y1 - 8))
+            self._clip_objs.append((track_idx, clip))
         
         # Draw waveform
-        self._draw_waveform(clip, x0, x1, y0, y1)
+        self._draw_waveform(clip, x0, x1, y0, y1, tag)
         
         # Clip name
         clip_name = getattr(clip, 'name', 'clip')
         self.canvas.create_text(
             x0 + 6, y0 + 14, anchor="nw", text=clip_name,
-            fill="#ffffff", font=("Segoe UI", 9, "bold")
+            fill="#ffffff", font=("Segoe UI", 9, "bold"), tags=tag
         )
         
         # Draw resize handles se la clip è selezionata
         if is_selected:
-            self._draw_resize_handles(x0, x1, y0, y1)
+            self._draw_resize_handles(x0, x1, y0, y1, tag)
+
+    def _update_clip_items(self, clip):
+        """Refresh the canvas items of a single clip during drag/resize.
+
+        A pure move shifts the clip's items with ``canvas.move``; a width
+        change redraws only that clip. Falls back to a full redraw when the
+        clip is not on the canvas yet.
 
-    def _draw_waveform(self, clip, x0, x1, y0, y1):
-        """Draw waveform visualization in clip."""
+        Args:
+            clip: Clip object that was moved or resized
+        """
+        if self.timeline is not None:
+            self.timeline.invalidate()
+        
+        entry = self._clip_items.get(id(clip))
+        if self.canvas is None or entry is None:
+            self.redraw()
+            return
+        
+        rect_id, tag, track_idx = entry
+        try:
+            old_x0, _, old_x1, _ = self.canvas.coords(rect_id)
+        except Exception:
+            self.redraw()
+            return
+        
+        x0 = int(clip.start_time * self.px_per_sec)
+        x1 = int(clip.end_time * self.px_per_sec)
+        if x1 - x0 == old_x1 - old_x0:
+            if x0 != old_x0:
+                self.canvas.move(tag, x0 - old_x0, 0)
+        else:
+            self.canvas.delete(tag)
+            self._draw_clip(track_idx, clip, tag)
+
+    def _draw_waveform(self, clip, x0, x1, y0, y1, tag=None):
+        """Draw waveform visualization in clip.
+
+        The envelope lines are created with one batched Tcl eval instead of
+        one ``create_line`` call per peak.
+        """
         try:
             clip_width = x1 - x0
-            if clip_width > 20:
-                num_points = max(10, int(clip_width / 2))
+            # Skip tiny clips; one peak per 4 px is visually enough
+            if clip_width >= 8:
+                num_points = min(2048, max(10, clip_width // 4))
                 peaks = clip.get_peaks(num_points)
+                if not peaks:
+                    return
                 
                 wave_y_center = (y0 + y1) / 2
                 wave_h = (y1 - y0 - 20) / 2
+                step = clip_width / len(peaks)
+                w = self.canvas._w
+                opts = f"-fill #000000 -width 1 -tags {tag}" if tag else "-fill #000000 -width 1"
+                cmds = []
                 
                 for i, (min_val, max_val) in enumerate(peaks):
-                    px = x0 + (i * clip_width / len(peaks))
+                    px = x0 + i * step
                     py_min = wave_y_center - (min_val * wave_h)
                     py_max = wave_y_center - (max_val * wave_h)
-                    
-                    self.canvas.create_line(
-                        px, py_min, px, py_max,
-                        fill="#000000", width=1
-                    )
+                    cmds.append(f"{w} create line {px} {py_min} {px} {py_max} {opts}")
+                
+                self.canvas.tk.eval("\n".join(cmds))
         except Exception:
             pass
     
-    def _draw_resize_handles(self, x0, x1, y0, y1):
+    def _draw_resize_handles(self, x0, x1, y0, y1, tag=None):
         """Disegna i handle di ridimensionamento ai bordi della clip selezionata."""
         handle_color = "#ffffff"
         handle_width = 3
+        tags = ("resize_handle", tag) if tag else "resize_handle"
         
         # Handle sinistro (linea verticale)
         self.canvas.create_line(
             x0, y0 + 8, x0, y1 - 8,
-            fill=handle_color, width=handle_width, tags="resize_handle"
+            fill=handle_color, width=handle_width, tags=tags
         )
         
         # Handle destro (linea verticale)
         self.canvas.create_line(
             x1, y0 + 8, x1, y1 - 8,
-            fill=handle_color, width=handle_width, tags="resize_handle"
+            fill=handle_color, width=handle_width, tags=tags
         )
         
         # Indicatore visivo centrale sui bordi (per maggiore chiarezza)
@@ -940,7 +1191,7 @@ class TimelineCanvas:
             x0 + 1, handle_mid_y,
             x0 + 8, handle_mid_y - 4,
             x0 + 8, handle_mid_y + 4,
-            fill=handle_color, outline="", tags="resize_handle"
+            fill=handle_color, outline="", tags=tags
         )
         
         # Frecce destra
@@ -948,7 +1199,7 @@ class TimelineCanvas:
             x1 - 1, handle_mid_y,
             x1 - 8, handle_mid_y - 4,
             x1 - 8, handle_mid_y + 4,
-            fill=handle_color, outline="", tags="resize_handle"
+            fill=handle_color, outline="", tags=tags
         )
 
     def _draw_loop_markers(self, height):
@@ -972,7 +1223,7 @@ class TimelineCanvas:
             )
             
             # Draw loop markers on ruler canvas (fixed, doesn't scroll vertically)
-            ruler_canvas = self.ruler_canvas if hasattr(self, 'ruler_canvas') else self.canvas
+            ruler_canvas = self.ruler_canvas if self.ruler_canvas is not None else self.canvas
             
             # Loop start marker on ruler
             self._draw_loop_marker(loop_x_start, "[", ruler_canvas)
@@ -1032,11 +1283,7 @@ class TimelineCanvas:
         if self.canvas is None:
             return
             
-        cur = 0.0
-        try:
-            cur = float(getattr(self.player, "_current_time", 0.0))
-        except Exception:
-            pass
+        cur = self._get_player_time()
         
         # Use cursor renderer
         self.cursor_id = self.cursor_renderer.draw(self.canvas, height, cur)
@@ -1129,12 +1376,12 @@ class TimelineCanvas:
             return
         
         # Click on ruler canvas - handle loop markers
-        if hasattr(self, 'ruler_canvas') and widget == self.ruler_canvas:
+        if self.ruler_canvas is not None and widget == self.ruler_canvas:
             x = self.ruler_canvas.canvasx(event.x)
             y = event.y  # ruler_canvas doesn't scroll vertically
             
             # Check if clicking on loop markers
-            marker = self.loop_marker_controller.check_loop_marker_hit(x, y, self.player)
+            marker = self.loop_marker_controller.check_loop_marker_hit(x, y, self.player, on_ruler=True)
             if marker:
                 self.loop_marker_controller.start_drag(marker)
                 return
@@ -1175,7 +1422,7 @@ class TimelineCanvas:
                 # Start resize mode
                 self.resize_controller.start_resize(clip, track_idx, resize_edge)
                 # Assicurati che la clip sia selezionata
-                if not any(c == clip for _, c in self.selected_clips):
+                if not any(c is clip for _, c in self._selection.values()):
                     self.select_clip(track_idx, clip)
                 # Imposta cursore
                 self.canvas.config(cursor="sb_h_double_arrow")
@@ -1192,8 +1439,8 @@ class TimelineCanvas:
             
             # Check for Shift key first - box selection (only in track area, not ruler)
             if event.state & 0x0001 and y > self.ruler_height:  # Shift key in track area
-                self.box_select_controller.start_selection(x, y)
-                print(f"📦 Box selection started at ({x:.1f}, {y:.1f})")
+                self.box_select_controller.start_selection(x, y, self.canvas)
+                _log.debug("Box selection started at (%.1f, %.1f)", x, y)
                 return
             
             # Clear selection if not holding Ctrl
@@ -1205,7 +1452,7 @@ class TimelineCanvas:
                 time = self.geometry.x_to_time(x)
                 self.clipboard_service.set_paste_position(max(0, self.snap_time(time)), visible=True)
                 self.redraw()
-                print(f"📍 Paste position set to {self.clipboard_service.paste_position:.2f}s (press Ctrl+V to paste)")
+                _log.info("Paste position set to %.2fs", self.clipboard_service.paste_position)
             else:
                 # No clipboard or clicked in ruler - hide paste cursor
                 self.clipboard_service.paste_cursor_visible = False
@@ -1286,7 +1533,7 @@ class TimelineCanvas:
         widget = event.widget
         
         # Handle drag on ruler canvas (for loop markers)
-        if hasattr(self, 'ruler_canvas') and widget == self.ruler_canvas:
+        if self.ruler_canvas is not None and widget == self.ruler_canvas:
             x = self.ruler_canvas.canvasx(event.x)
             if self.loop_marker_controller.is_dragging():
                 self.loop_marker_controller.update_drag(x, self.player)
@@ -1362,7 +1609,7 @@ class TimelineCanvas:
         if self.loop_marker_controller.is_dragging():
             self.loop_marker_controller.end_drag()
             # Reset cursor on appropriate canvas
-            if hasattr(self, 'ruler_canvas') and widget == self.ruler_canvas:
+            if self.ruler_canvas is not None and widget == self.ruler_canvas:
                 self.ruler_canvas.config(cursor="")
             elif self.canvas:
                 self.canvas.config(cursor="")
@@ -1425,7 +1672,7 @@ class TimelineCanvas:
             if selected:
                 self.selected_clips = selected
                 self.selected_clip = selected[0] if selected else None
-                print(f"📦 Box selection: {len(selected)} clip(s) selected")
+                _log.info("Box selection: %d clip(s) selected", len(selected))
             self.redraw()
             return
         
@@ -1438,7 +1685,7 @@ class TimelineCanvas:
         widget = event.widget
         
         # Handle motion on ruler canvas
-        if hasattr(self, 'ruler_canvas') and widget == self.ruler_canvas:
+        if self.ruler_canvas is not None and widget == self.ruler_canvas:
             # Don't change cursor while dragging
             if self.loop_marker_controller.is_dragging():
                 return
@@ -1447,7 +1694,7 @@ class TimelineCanvas:
             y = event.y
             
             # Check if hovering over loop markers on ruler
-            marker = self.loop_marker_controller.check_loop_marker_hit(x, y, self.player)
+            marker = self.loop_marker_controller.check_loop_marker_hit(x, y, self.player, on_ruler=True)
             if marker:
                 self.ruler_canvas.config(cursor="sb_h_double_arrow")
             else:
@@ -1503,17 +1750,39 @@ class TimelineCanvas:
         pass
 
     def _find_clip_at(self, x, y):
-        """Find clip at given canvas coordinates."""
-        if self.canvas is None:
+        """Find clip at given canvas coordinates.
+
+        Uses the per-track index built by the last redraw: the track comes
+        from y, then a binary search on the sorted left edges narrows the
+        candidates to clips starting within the widest clip's width of x.
+        The first clip drawn wins when several overlap.
+        """
+        track_idx = self.geometry.y_to_track(y)
+        entry = self._hit_tracks.get(track_idx)
+        if entry is None:
             return None
-            
-        items = self.canvas.find_overlapping(x, y, x, y)
         
-        for item in items:
-            if item in self.clip_canvas_ids:
-                return self.clip_canvas_ids[item]
+        # Clip rectangles are inset 8 px from the track band
+        band_y0 = self.ruler_height + track_idx * self.track_height
+        if not band_y0 + 8 <= y <= band_y0 + self.track_height - 8:
+            return None
         
-        return None
+        x0s, x1s, orders, max_width = entry
+        if np is not None and isinstance(x0s, np.ndarray):
+            lo = int(np.searchsorted(x0s, x - max_width, side="left"))
+            hi = int(np.searchsorted(x0s, x, side="right"))
+            if lo >= hi:
+                return None
+            hits = orders[lo:hi][x1s[lo:hi] >= x]
+            if hits.size == 0:
+                return None
+            return self._clip_objs[int(hits.min())]
+        
+        best = None
+        for j in range(bisect_left(x0s, x - max_width), bisect_right(x0s, x)):
+            if x1s[j] >= x and (best is None or orders[j] < best):
+                best = orders[j]
+        return self._clip_objs[best] if best is not None else None
 
     def _handle_resize(self, x):
         """Handle clip resize con feedback visivo migliorato."""
@@ -1533,7 +1802,8 @@ class TimelineCanvas:
                 
                 # Feedback visivo: mostra il delta tempo
                 delta = new_time - old_start
-                print(f"⬅ Resize left: {delta:+.3f}s | Duration: {clip.duration:.3f}s")
+                if _log.isEnabledFor(logging.DEBUG):
+                    _log.debug("Resize left %+.3fs dur=%.3fs", delta, clip.duration)
         else:
             # Ridimensiona dal bordo destro
             # La clip non può diventare più corta di 0.1 secondi
@@ -1544,7 +1814,8 @@ class TimelineCanvas:
                 
                 # Feedback visivo: mostra il delta tempo
                 delta = clip.duration - old_duration
-                print(f"➡ Resize right: {delta:+.3f}s | Duration: {clip.duration:.3f}s")
+                if _log.isEnabledFor(logging.DEBUG):
+                    _log.debug("Resize right %+.3fs dur=%.3fs", delta, clip.duration)
         
         self.redraw()
 
@@ -1574,28 +1845,7 @@ class TimelineCanvas:
 
     def _handle_box_selection_drag(self, x, y):
         """Handle dragging for box selection."""
-        if self.box_selection_start is None:
-            return
-        
-        start_x, start_y = self.box_selection_start
-        
-        # Calculate rectangle bounds
-        x1 = min(start_x, x)
-        y1 = min(start_y, y)
-        x2 = max(start_x, x)
-        y2 = max(start_y, y)
-        
-        # Delete previous selection rectangle
-        if self.box_selection_rect is not None:
-            self.canvas.delete(self.box_selection_rect)
-        
-        # Draw selection rectangle
-        self.box_selection_rect = self.canvas.create_rectangle(
-            x1, y1, x2, y2,
-            outline="#60a5fa", width=2, dash=(4, 4),
-            fill="#3b82f6", stipple="gray25",
-            tags="box_selection"
-        )
+        self.box_select_controller.update_selection(self.canvas, x, y)
     
     def _complete_box_selection(self):
         """Complete box selection and select all clips within the box."""
@@ -1629,7 +1879,7 @@ class TimelineCanvas:
                 if selected:
                     self.selected_clips = selected
                     self.selected_clip = selected[0] if selected else None
-                    print(f"📦 Selected {len(selected)} clip(s) with box selection")
+                    _log.info("Box selection: %d clip(s) selected", len(selected))
             
             # Clean up
             self.canvas.delete(self.box_selection_rect)
@@ -1641,35 +1891,35 @@ class TimelineCanvas:
     def select_clip(self, track_idx, clip):
         """Select a single clip (clears previous selection)."""
         # Clear all previous selections
-        self.selected_clips = []
+        self._selection = {}
         self.selected_clip = None
         
         if clip:
-            self.selected_clips = [(track_idx, clip)]
+            self._selection = {(track_idx, id(clip)): (track_idx, clip)}
             self.selected_clip = (track_idx, clip)
         
         self.redraw()
 
     def toggle_clip_selection(self, track_idx, clip):
         """Toggle clip selection (for multi-selection with Ctrl)."""
-        # Check if already selected
-        clip_tuple = (track_idx, clip)
+        # Check if already selected (O(1) dict lookup)
+        key = (track_idx, id(clip))
         
-        if clip_tuple in self.selected_clips:
+        if key in self._selection:
             # Deselect
-            self.selected_clips.remove(clip_tuple)
-            if self.selected_clip == clip_tuple:
-                self.selected_clip = self.selected_clips[0] if self.selected_clips else None
+            del self._selection[key]
+            if self.selected_clip is not None and self.selected_clip[1] is clip:
+                self.selected_clip = next(iter(self._selection.values()), None)
         else:
             # Add to selection
-            self.selected_clips.append(clip_tuple)
-            self.selected_clip = clip_tuple
+            self._selection[key] = (track_idx, clip)
+            self.selected_clip = (track_idx, clip)
         
         self.redraw()
 
     def clear_selection(self):
         """Clear all clip selections."""
-        self.selected_clips = []
+        self._selection = {}
         self.selected_clip = None
         self.redraw()
 
@@ -1677,8 +1927,13 @@ class TimelineCanvas:
     def select_track(self, track_idx: int):
         """Select a track by index, highlight it, and notify callback."""
         try:
-            if self.mixer is None or track_idx < 0 or track_idx >= len(self.mixer.tracks):
+            if self.mixer is None or track_idx < 0:
                 return
+            if track_idx >= self._n_tracks:
+                # Track may have been added since the last redraw
+                self._n_tracks = len(self.mixer.tracks)
+                if track_idx >= self._n_tracks:
+                    return
             self.selected_track_idx = int(track_idx)
             # Notify parent if callback provided
             if callable(self.on_track_selected):
@@ -1703,17 +1958,17 @@ class TimelineCanvas:
     
     def copy_selected_clips(self):
         """Copy selected clips to clipboard."""
-        if not self.selected_clips:
+        if not self._selection:
             return False
         
         # Use clipboard service to copy
-        current_time = float(getattr(self.player, "_current_time", 0.0)) if self.player else 0.0
+        current_time = self._get_player_time()
         num_copied = self.clipboard_service.copy_clips(self.selected_clips, current_time)
         
-        self.redraw()
+        self._mark_dirty()
         
-        print(f"📋 Copied {num_copied} clip(s) to clipboard")
-        print(f"📍 Paste position set to {self.clipboard_service.paste_position:.2f}s (click on timeline to change, or press Ctrl+V to paste)")
+        _log.info("Copied %d clip(s) to clipboard; paste position %.2fs",
+                  num_copied, self.clipboard_service.paste_position)
         return num_copied > 0
     
     def paste_clips(self, at_time=None):
@@ -1731,20 +1986,51 @@ class TimelineCanvas:
             if self.clipboard_service.paste_cursor_visible:
                 at_time = self.clipboard_service.paste_position
             else:
-                at_time = float(getattr(self.player, "_current_time", 0.0)) if self.player else 0.0
+                at_time = self._get_player_time()
         
-        # Use clipboard service to paste
-        pasted_clips = self.clipboard_service.paste_clips(at_time, self.timeline)
-        
-        # Select pasted clips
-        self.selected_clips = pasted_clips
-        self.selected_clip = pasted_clips[0] if pasted_clips else None
-        
-        self.redraw()
-        print(f"📌 Pasted {len(pasted_clips)} clip(s) at {at_time:.3f}s")
+        with self.batched_updates():
+            # Use clipboard service to paste
+            pasted_clips = self.clipboard_service.paste_clips(at_time, self.timeline)
+            
+            # Select pasted clips
+            self.selected_clips = pasted_clips
+            self.selected_clip = pasted_clips[0] if pasted_clips else None
+            
+            self._mark_dirty()
+        _log.info("Pasted %d clip(s) at %.3fs", len(pasted_clips), at_time)
         
         return pasted_clips
 
+    @contextlib.contextmanager
+    def batched_updates(self):
+        """Defer redraws requested inside the block to a single one on exit.
+        
+        Blocks may be nested; only the outermost one redraws, and only if
+        something inside called _mark_dirty().
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self.redraw()
+
+    def _mark_dirty(self):
+        """Request a redraw, deferred while inside batched_updates()."""
+        if self._batch_depth:
+            self._batch_dirty = True
+        else:
+            self.redraw()
+
+    def _get_player_time(self):
+        """Return the player's current time in seconds (0.0 if unavailable)."""
+        try:
+            return float(_player_time(self.player))
+        except Exception:
+            return 0.0
+
     def _get_resize_edge(self, mouse_x, clip_x0, clip_x1):
         """Determina se il mouse è su un bordo ridimensionabile della clip.
         
@@ -1756,24 +2042,31 @@ class TimelineCanvas:
         Returns:
             "left" se sul bordo sinistro, "right" se sul bordo destro, None altrimenti
         """
+        size = self.resize_handle_size
+        
         # Controlla bordo sinistro (priorità maggiore)
-        if abs(mouse_x - clip_x0) <= self.resize_handle_size:
+        if -size <= mouse_x - clip_x0 <= size:
             return "left"
         
         # Controlla bordo destro
-        if abs(mouse_x - clip_x1) <= self.resize_handle_size:
+        if -size <= mouse_x - clip_x1 <= size:
             return "right"
         
         return None
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _lighten_color(hex_color, factor=1.3):
-        """Lighten a hex color by a factor."""
+        """Lighten a hex color by a factor (memoized: one color per track)."""
         try:
             hex_color = hex_color.lstrip('#')
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
+            if len(hex_color) != 6:
+                raise ValueError(hex_color)
+            # One int parse, channels split with shifts
+            packed = int(hex_color, 16)
+            r = packed >> 16
+            g = (packed >> 8) & 0xFF
+            b = packed & 0xFF
             
             r = min(255, int(r * factor))
             g = min(255, int(g * factor))
@@ -1783,105 +2076,6 @@ class TimelineCanvas:
         except Exception:
             return "#60a5fa"
 
-    def _check_loop_marker_click_on_ruler(self, x, y):
-        """Check if click is on a loop marker in the ruler canvas and start dragging."""
-        if self.player is None:
-            return False
-        
-        try:
-            loop_enabled, loop_start, loop_end = self.player.get_loop()
-            if not loop_enabled:
-                return False
-            
-            loop_x_start = loop_start * self.px_per_sec
-            loop_x_end = loop_end * self.px_per_sec
-            
-            # Check click on start marker (15px tolerance)
-            if abs(x - loop_x_start) < 15 and 0 <= y <= self.ruler_height:
-                self.dragging_loop_marker = "start"
-                if hasattr(self, 'ruler_canvas'):
-                    self.ruler_canvas.config(cursor="sb_h_double_arrow")
-                return True
-            
-            # Check click on end marker
-            if abs(x - loop_x_end) < 15 and 0 <= y <= self.ruler_height:
-                self.dragging_loop_marker = "end"
-                if hasattr(self, 'ruler_canvas'):
-                    self.ruler_canvas.config(cursor="sb_h_double_arrow")
-                return True
-        except Exception:
-            pass
-        
-        return False
-    
-    def _check_loop_marker_click(self, x, y):
-        """Check if click is on a loop marker and start dragging (legacy, for main canvas)."""
-        if self.player is None or y > self.ruler_height + 30:
-            return False
-        
-        try:
-            loop_enabled, loop_start, loop_end = self.player.get_loop()
-            if not loop_enabled:
-                return False
-            
-            loop_x_start = loop_start * self.px_per_sec  # No left_margin offset
-            loop_x_end = loop_end * self.px_per_sec
-            
-            # Check click on start marker (15px tolerance)
-            if abs(x - loop_x_start) < 15:
-                self.dragging_loop_marker = "start"
-                self.canvas.config(cursor="sb_h_double_arrow")
-                return True
-            
-            # Check click on end marker
-            if abs(x - loop_x_end) < 15:
-                self.dragging_loop_marker = "end"
-                self.canvas.config(cursor="sb_h_double_arrow")
-                return True
-        except Exception:
-            pass
-        
-        return False
-    
-    def _is_over_loop_marker_on_ruler(self, x, y):
-        """Check if mouse is over a loop marker on the ruler canvas."""
-        if self.player is None:
-            return False
-        
-        try:
-            loop_enabled, loop_start, loop_end = self.player.get_loop()
-            if not loop_enabled:
-                return False
-            
-            loop_x_start = loop_start * self.px_per_sec
-            loop_x_end = loop_end * self.px_per_sec
-            
-            # Check if hovering over markers in ruler area
-            if 0 <= y <= self.ruler_height:
-                if abs(x - loop_x_start) < 15 or abs(x - loop_x_end) < 15:
-                    return True
-        except Exception:
-            pass
-        
-        return False
-
-    def _is_over_loop_marker(self, x, y):
-        """Check if mouse is over a loop marker."""
-        if self.player is None or y > self.ruler_height + 30:
-            return False
-        
-        try:
-            loop_enabled, loop_start, loop_end = self.player.get_loop()
-            if not loop_enabled:
-                return False
-            
-            loop_x_start = loop_start * self.px_per_sec  # No left_margin offset
-            loop_x_end = loop_end * self.px_per_sec
-            
-            return abs(x - loop_x_start) < 15 or abs(x - loop_x_end) < 15
-        except Exception:
-            return False
-
     def _handle_loop_marker_drag(self, x):
         """Handle dragging of loop markers."""
         if self.player is None:
@@ -1,5 +1,7 @@
 """Toolbar manager for transport controls and settings."""
 
+import time
+
 try:
     import tkinter as tk
     from tkinter import ttk
@@ -11,6 +13,16 @@ except Exception:  # pragma: no cover
 class ToolbarManager:
     """Manages the application toolbar with transport and settings."""
 
+    BPM_DEBOUNCE_MS = 300
+    # Grid combobox label -> division in bars
+    _GRID_TABLE = {
+        "1/1 (Bar)": 1.0,
+        "1/2": 0.5,
+        "1/4": 0.25,
+        "1/8": 0.125,
+        "1/16": 0.0625,
+    }
+
     def __init__(self, parent, project=None, callbacks=None):
         self.parent = parent
         self.project = project
@@ -25,6 +37,8 @@ class ToolbarManager:
         
         self.toolbar = None
         self.bpm_change_job = None
+        self._bpm_dirty_epoch = 0.0  # time.monotonic() of the last BPM edit
+        self._current_grid = 0.25  # division for the selected grid entry
 
     def build_toolbar(self):
         """Build the toolbar UI."""
@@ -111,7 +125,6 @@ class ToolbarManager:
         # BPM
         current_bpm = int(getattr(self.project, "bpm", 120))
         self.bpm_var = tk.IntVar(value=current_bpm)
-        self.bpm_var.trace_add("write", lambda *args: self._on_bpm_change())
         
         ttk.Label(
             self.toolbar, text="BPM:",
@@ -123,9 +136,14 @@ class ToolbarManager:
             textvariable=self.bpm_var, width=5,
             bg="#1a1a1a", fg="#f5f5f5",
             buttonbackground="#3b82f6", relief="flat",
-            font=("Segoe UI", 9)
+            font=("Segoe UI", 9),
+            command=self._on_bpm_change
         )
         bpm_spin.pack(side="left", padx=(0, 8))
+        # Only committed values trigger a BPM change: arrow buttons/keys go
+        # through command, typed values through Return or focus loss
+        bpm_spin.bind("<Return>", self._on_bpm_change)
+        bpm_spin.bind("<FocusOut>", self._on_bpm_change)
         
         # Snap
         self.snap_var = tk.BooleanVar(value=False)
@@ -145,14 +163,11 @@ class ToolbarManager:
         self.grid_var = tk.StringVar(value="1/4")
         grid_combo = ttk.Combobox(
             self.toolbar, textvariable=self.grid_var,
-            values=["1/1 (Bar)", "1/2", "1/4", "1/8", "1/16"],
+            values=list(self._GRID_TABLE),
             state="readonly", width=8
         )
         grid_combo.pack(side="left")
-        grid_combo.bind(
-            "<<ComboboxSelected>>",
-            self.callbacks.get('grid_change', lambda e: None)
-        )
+        grid_combo.bind("<<ComboboxSelected>>", self._on_grid_selected)
         grid_combo.current(2)
 
     def _build_time_display(self):
@@ -170,19 +185,38 @@ class ToolbarManager:
         sep = ttk.Frame(self.toolbar, style="Toolbar.TFrame", width=2)
         sep.pack(side="left", fill="y", padx=12, pady=8)
 
-    def _on_bpm_change(self):
-        """Handle BPM change with debouncing."""
-        if self.toolbar is not None and self.bpm_change_job is not None:
-            try:
-                self.toolbar.after_cancel(self.bpm_change_job)
-            except Exception:
-                pass
+    def _on_bpm_change(self, event=None):
+        """Handle BPM change with debouncing.
         
-        if self.toolbar is not None:
+        Each edit only stamps the time; a single pending timer fires the
+        callback once the value has been stable for BPM_DEBOUNCE_MS.
+        
+        Args:
+            event: Tk event when called from a key/focus binding (unused)
+        """
+        self._bpm_dirty_epoch = time.monotonic()
+        if self.toolbar is not None and self.bpm_change_job is None:
+            self.bpm_change_job = self.toolbar.after(
+                self.BPM_DEBOUNCE_MS, self._maybe_fire_bpm
+            )
+
+    def _maybe_fire_bpm(self):
+        """Fire the BPM callback if no edit happened in the debounce window."""
+        elapsed_ms = (time.monotonic() - self._bpm_dirty_epoch) * 1000.0
+        if elapsed_ms < self.BPM_DEBOUNCE_MS and self.toolbar is not None:
+            # Still changing: wait for the remainder of the window
             self.bpm_change_job = self.toolbar.after(
-                300,
-                lambda: self.callbacks.get('bpm_change', lambda: None)()
+                int(self.BPM_DEBOUNCE_MS - elapsed_ms) + 1, self._maybe_fire_bpm
             )
+            return
+        
+        self.bpm_change_job = None
+        self.callbacks.get('bpm_change', lambda: None)()
+
+    def _on_grid_selected(self, event=None):
+        """Cache the selected grid division and notify the callback."""
+        self._current_grid = self._GRID_TABLE.get(self.grid_var.get(), 0.25)
+        self.callbacks.get('grid_change', lambda e: None)(event)
 
     def update_time(self, time_seconds):
         """Update time display."""
@@ -218,19 +252,5 @@ class ToolbarManager:
             self.loop_var.set(enabled)
 
     def get_grid_division(self):
-        """Get grid division value."""
-        if self.grid_var is None:
-            return 0.25
-            
-        grid_str = self.grid_var.get()
-        if "(" in grid_str:
-            grid_str = grid_str.split()[0]
-        
-        try:
-            parts = grid_str.split("/")
-            if len(parts) == 2:
-                return float(parts[0]) / float(parts[1])
-        except Exception:
-            pass
-        
-        return 0.25
+        """Get grid division value (cached on combobox selection)."""
+        return self._current_grid
@@ -1,11 +1,75 @@
 """Track and Clip management operations - Refactored from MainWindow."""
 
+import logging
+import operator
+import os
+
 try:
     from tkinter import messagebox, filedialog
 except Exception:
     messagebox = None
     filedialog = None
 
+from src.audio.clip import AudioClip
+from src.audio.peaks import build_peak_pyramid
+from src.core.track import Track
+from src.midi.clip import MidiClip
+from src.utils.audio_io import get_supported_formats, get_audio_info
+from src.utils.audio_io_cache import cached_load_audio_file
+
+try:
+    from src.instruments.synthesizer import Synthesizer
+except Exception:  # pragma: no cover
+    Synthesizer = None
+
+try:
+    from .clip_inspector import show_clip_inspector
+except Exception:  # pragma: no cover
+    show_clip_inspector = None
+
+# AudioClip constructor fields read by _clone_clip in one call
+_AUDIO_CTOR_ATTRS = operator.attrgetter('name', 'buffer', 'sample_rate', 'duration', 'color', 'file_path')
+
+# AudioClip editing parameters copied by _clone_clip, with their defaults
+_AUDIO_COPY_FIELDS = (
+    ('start_offset', 0.0),
+    ('end_offset', 0.0),
+    ('fade_in', 0.0),
+    ('fade_in_shape', 'linear'),
+    ('fade_out', 0.0),
+    ('fade_out_shape', 'linear'),
+    ('pitch_semitones', 0.0),
+    ('volume', 1.0),
+)
+
+# Message box text for show_clip_properties (used without the inspector)
+_MIDI_PROPS_TMPL = """MIDI Clip Properties
+
+Name: {name}
+Start Time: {start:.3f} s
+End Time: {end:.3f} s
+Duration: {length:.3f} s
+Sample Rate: {sr} Hz
+Notes: {notes}
+""".format
+_AUDIO_PROPS_TMPL = """Clip Properties
+
+Name: {name}
+Start Time: {start:.3f} s
+End Time: {end:.3f} s
+Duration: {length:.3f} s
+Sample Rate: {sr} Hz
+Samples: {samples}
+""".format
+
+# Tk filetypes for the audio import dialogs, built once. Tk expects
+# space-separated patterns, so the ";" lists are converted here.
+_AUDIO_FILETYPES = tuple(
+    (label, patterns.replace(";", " ")) for label, patterns in get_supported_formats()
+)
+
+_log = logging.getLogger(__name__)
+
 
 class TrackClipManager:
     """Manages track and clip operations (add, delete, duplicate, etc.)."""
@@ -17,6 +81,7 @@ class TrackClipManager:
             window: Reference to the MainWindow instance
         """
         self.window = window
+        self._redraw_pending = False  # A schedule_redraw() is queued
     
     @property
     def project(self):
@@ -48,6 +113,27 @@ class TrackClipManager:
         """Get status var from window."""
         return self.window._status
     
+    def schedule_redraw(self):
+        """Request a timeline redraw on the next idle cycle.
+        
+        Several requests before Tk goes idle collapse into one redraw.
+        Without a running window the canvas is redrawn immediately.
+        """
+        if self._redraw_pending or self._timeline_canvas is None:
+            return
+        root = self.window._root
+        if root is None:
+            self._timeline_canvas.redraw()
+            return
+        self._redraw_pending = True
+        root.after_idle(self._flush_redraw)
+    
+    def _flush_redraw(self):
+        """Perform a redraw requested by schedule_redraw."""
+        self._redraw_pending = False
+        if self._timeline_canvas is not None:
+            self._timeline_canvas.redraw()
+    
     def _get_current_track_index(self):
         """Get currently selected track index."""
         return self.window._current_track_idx
@@ -59,111 +145,175 @@ class TrackClipManager:
     
     # Import methods
     
+    def _load_audio_async(self, file_path, on_loaded, on_failed, target_sr=44100):
+        """Decode an audio file on the window's I/O pool.
+        
+        Decoded buffers are cached per file, so re-importing the same file
+        reuses (shares) the earlier buffer. The decode runs on a worker
+        thread, which also builds the waveform peak pyramid;
+        ``on_loaded(buffer, sr, peaks)`` or ``on_failed(exc)`` is then
+        called on the Tk thread (via the window's TkResultQueue). Without
+        a running window the file is decoded synchronously (peaks is then
+        None and the clip builds its pyramid on first draw).
+        
+        Args:
+            file_path: Path to audio file
+            on_loaded: Callback receiving (buffer, sample_rate, peaks)
+            on_failed: Callback receiving the raised exception
+            target_sr: Target sample rate
+        """
+        root = self.window._root
+        if root is None:
+            try:
+                buffer, sr = cached_load_audio_file(file_path, target_sr=target_sr)
+            except Exception as e:
+                on_failed(e)
+                return
+            on_loaded(buffer, sr, None)
+            return
+        
+        def _load():
+            buffer, sr = cached_load_audio_file(file_path, target_sr=target_sr)
+            return buffer, sr, build_peak_pyramid(buffer)
+        
+        def _deliver(future):
+            try:
+                buffer, sr, peaks = future.result()
+            except Exception as e:
+                on_failed(e)
+                return
+            on_loaded(buffer, sr, peaks)
+        
+        self.window._worker_results.submit(self.window._io_pool, _load, _deliver)
+    
+    def _track_at(self, track_idx):
+        """Return the mixer track dict at track_idx, or None if there is none."""
+        if self.mixer is None or track_idx is None or not 0 <= track_idx < len(self.mixer.tracks):
+            return None
+        return self.mixer.tracks[track_idx]
+    
+    def _add_loaded_clip(self, track, clip_name, buffer, sr, start_time, file_path, peaks=None):
+        """Create an AudioClip from decoded audio and add it to a track.
+        
+        The track is identified by its mixer dict, captured when the load
+        started: tracks deleted meanwhile shift the indices of later ones.
+        
+        Returns:
+            (clip, track_idx) with the track's current index, or
+            (None, None) if the track was deleted meanwhile
+        """
+        track_idx = None
+        if self.timeline is not None and self.mixer is not None:
+            track_idx = next((i for i, t in enumerate(self.mixer.tracks) if t is track), None)
+        if track_idx is None:
+            if self._status:
+                self._status.set(f"⚠ Track removed while loading '{clip_name}'")
+            return None, None
+        
+        clip = AudioClip(clip_name, buffer, sr, start_time=start_time, file_path=file_path)
+        if peaks is not None:
+            clip.set_peak_pyramid(peaks)
+        
+        self.timeline.add_clip(track_idx, clip)
+        self.schedule_redraw()
+        return clip, track_idx
+    
+    def _get_current_time(self):
+        """Get current playhead position in seconds (0.0 if unavailable)."""
+        try:
+            return float(getattr(self.player, "_current_time", 0.0))
+        except Exception:
+            return 0.0
+    
     def import_audio_dialog(self):
         """Import audio file (WAV, MP3, FLAC, OGG, etc.) and add to selected track."""
         if self.timeline is None or self.mixer is None or filedialog is None:
             return
         
         track_idx = self._get_current_track_index()
-        if track_idx is None:
+        track = self._track_at(track_idx)
+        if track is None:
             if self._status:
                 self._status.set("⚠ Select a track first")
             return
         
         try:
-            # Get supported formats from audio_io utility
-            from src.utils.audio_io import get_supported_formats, load_audio_file, get_audio_info
-            
-            filetypes = get_supported_formats()
-            
             file_path = filedialog.askopenfilename(
                 title="Import Audio",
-                filetypes=filetypes
+                filetypes=_AUDIO_FILETYPES
             )
             
             if not file_path:
                 return
             
+            # Get file info first (fast)
+            clip_name = os.path.splitext(os.path.basename(file_path))[0]
+            
+            try:
+                info = get_audio_info(file_path)
+                duration = info.get('duration', 0)
+                original_sr = info.get('sample_rate', 44100)
+                
+                # Show info dialog for long files
+                if duration > 60:  # More than 1 minute
+                    if messagebox:
+                        proceed = messagebox.askyesno(
+                            "Large File",
+                            f"File duration: {duration:.1f} seconds\n"
+                            f"Sample rate: {original_sr} Hz\n"
+                            f"This may take a moment to load.\n\n"
+                            f"Continue?"
+                        )
+                        if not proceed:
+                            if self._status:
+                                self._status.set("● Ready")
+                            return
+            except Exception:
+                pass  # Info not available, proceed anyway
+            
             # Show loading status
             if self._status:
                 self._status.set("⏳ Loading audio file...")
             
-            try:
-                # Get file info first (fast)
-                import os
-                clip_name = os.path.splitext(os.path.basename(file_path))[0]
-                
-                try:
-                    info = get_audio_info(file_path)
-                    duration = info.get('duration', 0)
-                    original_sr = info.get('sample_rate', 44100)
-                    
-                    # Show info dialog for long files
-                    if duration > 60:  # More than 1 minute
-                        if messagebox:
-                            proceed = messagebox.askyesno(
-                                "Large File",
-                                f"File duration: {duration:.1f} seconds\n"
-                                f"Sample rate: {original_sr} Hz\n"
-                                f"This may take a moment to load.\n\n"
-                                f"Continue?"
-                            )
-                            if not proceed:
-                                if self._status:
-                                    self._status.set("● Ready")
-                                return
-                except Exception:
-                    pass  # Info not available, proceed anyway
-                
-                # Load the audio file
-                target_sr = 44100  # Standard sample rate for DAW
-                buffer, sr = load_audio_file(file_path, target_sr=target_sr)
-                
-                # Get current time for clip placement
-                cur = 0.0
-                try:
-                    cur = float(getattr(self.player, "_current_time", 0.0))
-                except Exception:
-                    pass
-                
-                # Create clip
-                from src.audio.clip import AudioClip
-                clip = AudioClip(clip_name, buffer, sr, start_time=cur, file_path=file_path)
-                
-                # Add to timeline
-                self.timeline.add_clip(track_idx, clip)
-                if self._timeline_canvas:
-                    self._timeline_canvas.redraw()
+            # Place the clip where the playhead was when the import started
+            cur = self._get_current_time()
+            
+            def on_loaded(buffer, sr, peaks):
+                clip, idx = self._add_loaded_clip(track, clip_name, buffer, sr, cur, file_path, peaks)
+                if clip is None:
+                    return
                 
                 # Success feedback
                 if self._status:
-                    track_name = self.mixer.tracks[track_idx].get("name", f"Track {track_idx+1}")
+                    track_name = track.get("name", f"Track {idx+1}")
                     duration_str = f"{clip.length_seconds:.2f}s"
-                    size_mb = len(buffer) * 4 / (1024 * 1024)  # Approximate size in MB
+                    size_mb = getattr(buffer, "nbytes", len(buffer) * 4) / (1024 * 1024)
                     self._status.set(
                         f"✓ Imported '{clip_name}' to {track_name} "
                         f"({duration_str}, {sr}Hz, {size_mb:.1f}MB)"
                     )
                 
-                print(f"✓ Successfully imported: {file_path}")
-                print(f"  - Duration: {clip.length_seconds:.2f}s")
-                print(f"  - Sample rate: {sr} Hz")
-                print(f"  - Samples: {len(buffer):,}")
-                    
-            except ImportError as e:
-                if messagebox:
-                    messagebox.showerror(
-                        "Import Error",
-                        f"Required audio library not available.\n\n{str(e)}\n\n"
-                        "Install with:\n"
-                        "  pip install soundfile\n"
-                        "or\n"
-                        "  pip install pydub"
+                if _log.isEnabledFor(logging.DEBUG):
+                    _log.debug(
+                        "Imported %s (duration %.2fs, %d Hz, %s samples)",
+                        file_path, clip.length_seconds, sr, f"{len(buffer):,}",
                     )
-                if self._status:
-                    self._status.set("⚠ Audio library missing")
-                    
-            except Exception as e:
+            
+            def on_failed(e):
+                if isinstance(e, ImportError):
+                    if messagebox:
+                        messagebox.showerror(
+                            "Import Error",
+                            f"Required audio library not available.\n\n{str(e)}\n\n"
+                            "Install with:\n"
+                            "  pip install soundfile\n"
+                            "or\n"
+                            "  pip install pydub"
+                        )
+                    if self._status:
+                        self._status.set("⚠ Audio library missing")
+                    return
+                
                 if messagebox:
                     messagebox.showerror(
                         "Import Error",
@@ -173,7 +323,8 @@ class TrackClipManager:
                 if self._status:
                     self._status.set(f"⚠ Import failed: {str(e)}")
                 print(f"✗ Import error: {e}")
-                return
+            
+            self._load_audio_async(file_path, on_loaded, on_failed)
                     
         except Exception as e:
             print(f"Import dialog error: {e}")
@@ -188,52 +339,41 @@ class TrackClipManager:
         """
         if not self.timeline or not self.mixer:
             return
+        status = self._status
         
         track_idx = self._get_current_track_index()
-        if track_idx is None:
-            if self._status:
-                self._status.set("⚠ Select a track first")
+        track = self._track_at(track_idx)
+        if track is None:
+            if status:
+                status.set("⚠ Select a track first")
             return
         
-        try:
-            from src.utils.audio_io import load_audio_file
-            import os
-            
-            if self._status:
-                self._status.set(f"⏳ Loading {os.path.basename(file_path)}...")
-            
-            # Load file
-            buffer, sr = load_audio_file(file_path, target_sr=44100)
-            
-            # Get clip name
-            clip_name = os.path.splitext(os.path.basename(file_path))[0]
-            
-            # Get current time
-            cur = 0.0
-            try:
-                cur = float(getattr(self.player, "_current_time", 0.0))
-            except Exception:
-                pass
-            
-            # Create and add clip
-            from src.audio.clip import AudioClip
-            clip = AudioClip(clip_name, buffer, sr, start_time=cur, file_path=file_path)
-            
-            self.timeline.add_clip(track_idx, clip)
-            if self._timeline_canvas:
-                self._timeline_canvas.redraw()
+        base_name = os.path.basename(file_path)
+        if status:
+            status.set(f"⏳ Loading {base_name}...")
+        
+        # Get clip name and current time
+        clip_name = os.path.splitext(base_name)[0]
+        cur = self._get_current_time()
+        
+        def on_loaded(buffer, sr, peaks):
+            clip, idx = self._add_loaded_clip(track, clip_name, buffer, sr, cur, file_path, peaks)
+            if clip is None:
+                return
             
             # Success feedback
-            if self._status:
-                track_name = self.mixer.tracks[track_idx].get("name", f"Track {track_idx+1}")
-                self._status.set(f"✓ Imported '{clip_name}' to {track_name}")
-            
-            print(f"✓ Imported: {file_path}")
+            if status:
+                track_name = track.get("name", f"Track {idx+1}")
+                status.set(f"✓ Imported '{clip_name}' to {track_name}")
             
-        except Exception as e:
-            if self._status:
-                self._status.set(f"⚠ Failed to import: {str(e)}")
+            _log.debug("Imported %s", file_path)
+        
+        def on_failed(e):
+            if status:
+                status.set(f"⚠ Failed to import: {str(e)}")
             print(f"✗ Import error: {e}")
+        
+        self._load_audio_async(file_path, on_loaded, on_failed)
     
     # Track management methods
     
@@ -305,7 +445,6 @@ class TrackClipManager:
             pass
 
         # Also add to project.tracks so it persists in save/load
-        from src.core.track import Track
         track = Track(name=track_name)
         track.set_volume(1.0)
         
@@ -320,8 +459,7 @@ class TrackClipManager:
         
         self.project.create_track(track)
         
-        if self._timeline_canvas:
-            self._timeline_canvas.redraw()
+        self.schedule_redraw()
         
         if self._status:
             self._status.set(f"✓ Track '{track_name}' added")
@@ -331,21 +469,16 @@ class TrackClipManager:
         if self.timeline is None or self.mixer is None or filedialog is None:
             return
         
-        if track_idx >= len(self.mixer.tracks):
+        track = self._track_at(track_idx)
+        if track is None:
             if self._status:
                 self._status.set("⚠ Invalid track index")
             return
         
         try:
-            from src.utils.audio_io import get_supported_formats, load_audio_file
-            from src.audio.clip import AudioClip
-            import os
-            
-            filetypes = get_supported_formats()
-            
             file_path = filedialog.askopenfilename(
                 title="Add Audio Clip",
-                filetypes=filetypes
+                filetypes=_AUDIO_FILETYPES
             )
             
             if not file_path:
@@ -354,31 +487,27 @@ class TrackClipManager:
             if self._status:
                 self._status.set("⏳ Loading audio file...")
             
-            # Load audio file
-            target_sr = 44100
-            buffer, sr = load_audio_file(file_path, target_sr=target_sr)
-            
-            # Get current playhead position
-            cur = 0.0
-            try:
-                cur = float(getattr(self.player, "_current_time", 0.0))
-            except Exception:
-                pass
-            
-            # Create clip
+            # Get current playhead position and clip name
+            cur = self._get_current_time()
             clip_name = os.path.splitext(os.path.basename(file_path))[0]
-            clip = AudioClip(clip_name, buffer, sr, start_time=cur, file_path=file_path)
             
-            # Add to timeline
-            self.timeline.add_clip(track_idx, clip)
-            if self._timeline_canvas:
-                self._timeline_canvas.redraw()
+            def on_loaded(buffer, sr, peaks):
+                clip, idx = self._add_loaded_clip(track, clip_name, buffer, sr, cur, file_path, peaks)
+                if clip is None:
+                    return
+                
+                # Success feedback
+                track_name = track.get("name", f"Track {idx+1}")
+                if self._status:
+                    self._status.set(f"✓ Added '{clip_name}' to '{track_name}'")
+                _log.debug("Added clip '%s' to track %d ('%s')", clip_name, idx, track_name)
             
-            # Success feedback
-            track_name = self.mixer.tracks[track_idx].get("name", f"Track {track_idx+1}")
-            if self._status:
-                self._status.set(f"✓ Added '{clip_name}' to '{track_name}'")
-            print(f"🎵 Added clip '{clip_name}' to track {track_idx} ('{track_name}')")
+            def on_failed(e):
+                if self._status:
+                    self._status.set(f"⚠ Error loading audio: {e}")
+                print(f"Error loading audio: {e}")
+            
+            self._load_audio_async(file_path, on_loaded, on_failed)
             
         except Exception as e:
             if self._status:
@@ -396,14 +525,12 @@ class TrackClipManager:
                 if self._status:
                     self._status.set("⚠ Selected track is not a MIDI track")
                 return
-            from src.midi.clip import MidiClip
             # pick instrument from project track if present
             instrument = None
             if self.project and hasattr(self.project, 'tracks') and track_idx < len(self.project.tracks):
                 instrument = getattr(self.project.tracks[track_idx], 'instrument', None)
-            if instrument is None:
+            if instrument is None and Synthesizer is not None:
                 try:
-                    from src.instruments.synthesizer import Synthesizer
                     instrument = Synthesizer()
                 except Exception:
                     instrument = None
@@ -437,8 +564,7 @@ class TrackClipManager:
             )
             
             self.timeline.add_clip(track_idx, mclip)
-            if self._timeline_canvas:
-                self._timeline_canvas.redraw()
+            self.schedule_redraw()
             if self._status:
                 tn = self.mixer.tracks[track_idx].get("name", f"Track {track_idx+1}")
                 self._status.set(f"✓ Added empty MIDI clip to '{tn}' - Double-click to edit notes")
@@ -581,11 +707,13 @@ class TrackClipManager:
     
     def rename_track(self, track_idx):
         """Rename a track."""
-        if self.mixer is None or track_idx >= len(self.mixer.tracks):
+        mixer = self.mixer
+        if mixer is None or track_idx >= len(mixer.tracks):
             return
+        track = mixer.tracks[track_idx]
         
         import tkinter.simpledialog as simpledialog
-        current_name = self.mixer.tracks[track_idx].get("name", f"Track {track_idx+1}")
+        current_name = track.get("name", f"Track {track_idx+1}")
         
         new_name = simpledialog.askstring(
             "Rename Track",
@@ -594,18 +722,27 @@ class TrackClipManager:
         )
         
         if new_name and new_name.strip():
-            self.mixer.tracks[track_idx]["name"] = new_name.strip()
-            if self._timeline_canvas:
-                self._timeline_canvas.redraw()
-            if self._status:
-                self._status.set(f"✓ Track renamed to '{new_name.strip()}'")
+            new_name = new_name.strip()
+            track["name"] = new_name
+            self.schedule_redraw()
+            status = self._status
+            if status:
+                status.set(f"✓ Track renamed to '{new_name}'")
     
     def delete_track(self, track_idx):
         """Delete a track."""
-        if self.mixer is None or track_idx >= len(self.mixer.tracks):
+        # Resolve window attributes once (properties chase self.window)
+        mixer = self.mixer
+        if mixer is None or track_idx >= len(mixer.tracks):
             return
+        tracks = mixer.tracks
+        timeline = self.timeline
+        project = self.project
+        canvas = self._timeline_canvas
+        status = self._status
+        window = self.window
         
-        track_name = self.mixer.tracks[track_idx].get("name", f"Track {track_idx+1}")
+        track_name = tracks[track_idx].get("name", f"Track {track_idx+1}")
         
         # Confirm deletion
         if messagebox:
@@ -616,62 +753,54 @@ class TrackClipManager:
             if not confirm:
                 return
         try:
-            # Remove from timeline placements and shift indices after deleted track
-            if self.timeline and hasattr(self.timeline, '_placements'):
-                new_placements = []
-                for ti, clip in self.timeline._placements:
-                    if ti == track_idx:
-                        continue  # drop clips on deleted track
-                    elif ti > track_idx:
-                        new_placements.append((ti - 1, clip))
-                    else:
-                        new_placements.append((ti, clip))
-                self.timeline._placements = new_placements
+            # Remove the track's clips; later tracks shift down by one
+            if timeline:
+                timeline.remove_track(track_idx)
 
             # Remove from project.tracks if present
-            if self.project and hasattr(self.project, 'tracks') and track_idx < len(self.project.tracks):
+            if project and hasattr(project, 'tracks') and track_idx < len(project.tracks):
                 try:
-                    self.project.tracks.pop(track_idx)
+                    project.tracks.pop(track_idx)
                 except Exception:
                     pass
 
             # Remove from mixer
-            self.mixer.tracks.pop(track_idx)
+            tracks.pop(track_idx)
+            n_tracks = len(tracks)
 
             # Update selection to a valid index
-            if hasattr(self.window, '_current_track_idx'):
-                if self.window._current_track_idx is not None:
-                    if len(self.mixer.tracks) == 0:
-                        self.window._current_track_idx = None
-                    else:
-                        self.window._current_track_idx = max(0, min(self.window._current_track_idx, len(self.mixer.tracks) - 1))
+            cur = getattr(window, '_current_track_idx', None)
+            if cur is not None:
+                window._current_track_idx = max(0, min(cur, n_tracks - 1)) if n_tracks else None
             # Reflect selection in canvas
-            if self._timeline_canvas and hasattr(self._timeline_canvas, 'selected_track_idx'):
-                sel = self._timeline_canvas.selected_track_idx
+            if canvas and hasattr(canvas, 'selected_track_idx'):
+                sel = canvas.selected_track_idx
                 if sel is not None:
-                    if len(self.mixer.tracks) == 0:
-                        self._timeline_canvas.selected_track_idx = None
+                    if n_tracks == 0:
+                        canvas.selected_track_idx = None
                     else:
-                        self._timeline_canvas.selected_track_idx = max(0, min(sel if sel != track_idx else sel - 1, len(self.mixer.tracks) - 1))
+                        canvas.selected_track_idx = max(0, min(sel if sel != track_idx else sel - 1, n_tracks - 1))
 
-            # Redraw UI immediately
-            if self._timeline_canvas:
-                self._timeline_canvas.redraw()
+            # Redraw UI
+            self.schedule_redraw()
 
-            if self._status:
-                self._status.set(f"✓ Track '{track_name}' deleted")
+            if status:
+                status.set(f"✓ Track '{track_name}' deleted")
         except Exception as e:
-            if self._status:
-                self._status.set(f"⚠ Failed to delete track: {e}")
+            if status:
+                status.set(f"⚠ Failed to delete track: {e}")
             print(f"Delete track error: {e}")
     
     def duplicate_track(self, track_idx):
         """Duplicate a track with all its clips."""
-        if self.mixer is None or track_idx >= len(self.mixer.tracks):
+        mixer = self.mixer
+        if mixer is None or track_idx >= len(mixer.tracks):
             return
+        tracks = mixer.tracks
+        timeline = self.timeline
         
         # Duplicate mixer track
-        original_track = self.mixer.tracks[track_idx]
+        original_track = tracks[track_idx]
         new_track = {
             "name": original_track.get("name", f"Track {track_idx+1}") + " (copy)",
             "volume": original_track.get("volume", 1.0),
@@ -680,39 +809,42 @@ class TrackClipManager:
             "solo": original_track.get("solo", False),
             "color": original_track.get("color", "#3b82f6")
         }
-        self.mixer.tracks.append(new_track)
+        tracks.append(new_track)
         
-        # Duplicate timeline clips
-        self.timeline.tracks.append([])
-        for clip in self.timeline.tracks[track_idx]:
-            new_clip = clip.copy()
-            self.timeline.tracks[-1].append(new_clip)
+        # Duplicate timeline clips onto the new (last) track
+        new_idx = len(tracks) - 1
+        clone = self._clone_clip
+        timeline.add_clips(
+            [(new_idx, clone(clip, clip.start_time)) for clip in timeline.get_clips_for_track(track_idx)]
+        )
         
-        if self._timeline_canvas:
-            self._timeline_canvas.redraw()
+        self.schedule_redraw()
         
-        if self._status:
-            self._status.set(f"✓ Track duplicated: '{new_track['name']}'")
+        status = self._status
+        if status:
+            status.set(f"✓ Track duplicated: '{new_track['name']}'")
     
     def change_track_color(self, track_idx):
         """Change the color of a track."""
-        if self.mixer is None or track_idx >= len(self.mixer.tracks):
+        mixer = self.mixer
+        if mixer is None or track_idx >= len(mixer.tracks):
             return
+        track = mixer.tracks[track_idx]
         
         from tkinter import colorchooser
         
-        current_color = self.mixer.tracks[track_idx].get("color", "#3b82f6")
+        current_color = track.get("color", "#3b82f6")
         color = colorchooser.askcolor(
             title="Choose Track Color",
             initialcolor=current_color
         )
         
         if color and color[1]:  # color[1] is the hex value
-            self.mixer.tracks[track_idx]["color"] = color[1]
-            if self._timeline_canvas:
-                self._timeline_canvas.redraw()
-            if self._status:
-                self._status.set(f"✓ Track color changed")
+            track["color"] = color[1]
+            self.schedule_redraw()
+            status = self._status
+            if status:
+                status.set(f"✓ Track color changed")
     
     # Clip management methods
     
@@ -729,8 +861,7 @@ class TrackClipManager:
         self.timeline.remove_clip(track_idx, clip)
         self._timeline_canvas.selected_clip = None
         self._timeline_canvas.selected_clips = []
-        if self._timeline_canvas:
-            self._timeline_canvas.redraw()
+        self.schedule_redraw()
         
         if self._status:
             self._status.set(f"✓ Deleted clip '{clip.name}'")
@@ -746,12 +877,10 @@ class TrackClipManager:
         
         count = len(selected_clips)
         
-        for track_idx, clip in selected_clips:
-            self.timeline.remove_clip(track_idx, clip)
+        self.timeline.remove_clips(selected_clips)
         
         self._timeline_canvas.clear_selection()
-        if self._timeline_canvas:
-            self._timeline_canvas.redraw()
+        self.schedule_redraw()
         
         if self._status:
             self._status.set(f"✓ Deleted {count} clip(s)")
@@ -779,11 +908,10 @@ class TrackClipManager:
                 self._status.set("⚠ Clipboard is empty")
             return
         
+        # The canvas redraws once itself after pasting
         pasted_clips = self._timeline_canvas.paste_clips()
         
         if pasted_clips:
-            if self._timeline_canvas:
-                self._timeline_canvas.redraw()
             if self._status:
                 self._status.set(f"📌 Pasted {len(pasted_clips)} clip(s)")
         else:
@@ -851,8 +979,6 @@ class TrackClipManager:
             pasted_clips = self._timeline_canvas.paste_clips(at_time=loop_end)
             
             if pasted_clips:
-                if self._timeline_canvas:
-                    self._timeline_canvas.redraw()
                 if self._status:
                     self._status.set(f"📌 Pasted {len(pasted_clips)} clip(s) at loop end ({loop_end:.2f}s)")
             else:
@@ -881,8 +1007,7 @@ class TrackClipManager:
         
         self.timeline.add_clip(track_idx, new_clip)
         self._timeline_canvas.select_clip(track_idx, new_clip)
-        if self._timeline_canvas:
-            self._timeline_canvas.redraw()
+        self.schedule_redraw()
         
         if self._status:
             self._status.set(f"✓ Duplicated clip '{clip.name}'")
@@ -912,25 +1037,19 @@ class TrackClipManager:
             
             loop_duration = loop_end - loop_start
             
-            # Duplicate each clip
-            duplicated_count = 0
-            
-            for track_idx, clip in clips_in_loop:
-                # Calculate offset from loop start
-                clip_offset_from_loop_start = clip.start_time - loop_start
-                
-                # Calculate new start time (right after the loop end)
-                new_start_time = loop_end + clip_offset_from_loop_start
-                
-                # Clone clip with all properties (trim/fades/pitch/color/file_path/duration)
-                new_clip = self._clone_clip(clip, new_start_time)
-                
-                self.timeline.add_clip(track_idx, new_clip)
-                duplicated_count += 1
+            # Clone each clip with all properties (trim/fades/pitch/color/
+            # file_path/duration) right after the loop end, keeping its
+            # offset from the loop start, then add them in one batch
+            clone = self._clone_clip
+            new_placements = [
+                (track_idx, clone(clip, loop_end + (clip.start_time - loop_start)))
+                for track_idx, clip in clips_in_loop
+            ]
+            self.timeline.add_clips(new_placements)
+            duplicated_count = len(new_placements)
             
             # Update UI
-            if self._timeline_canvas:
-                self._timeline_canvas.redraw()
+            self.schedule_redraw()
             
             if self._status:
                 self._status.set(f"✓ Duplicated loop region: {duplicated_count} clip(s) | {loop_start:.2f}s - {loop_end:.2f}s")
@@ -953,62 +1072,37 @@ class TrackClipManager:
         Returns:
             New clip instance with all properties copied
         """
-        # Try to detect MIDI vs Audio at runtime to avoid hard imports up-top
-        try:
-            from src.midi.clip import MidiClip
-            from src.midi.note import MidiNote
-            is_midi = isinstance(clip, MidiClip)
-        except Exception:
-            MidiClip = None  # type: ignore
-            MidiNote = None  # type: ignore
-            is_midi = False
-
-        if is_midi:
-            # Deep copy notes; note times are clip-local, so keep as-is
-            try:
-                notes = [
-                    MidiNote(pitch=n.pitch, start=n.start, duration=n.duration, velocity=getattr(n, 'velocity', 100))
-                    for n in getattr(clip, 'notes', [])
-                ] if MidiNote is not None else []
-            except Exception:
-                notes = []
-
-            new_clip = MidiClip(
-                name=name or clip.name,
-                notes=notes,
-                start_time=new_start_time,
-                duration=getattr(clip, 'duration', None),
-                color=getattr(clip, 'color', None),
-                instrument=getattr(clip, 'instrument', None),
-                sample_rate=getattr(clip, 'sample_rate', 44100),
-            )
-            return new_clip
+        copy = getattr(clip, 'copy', None)
+        if copy is not None:
+            # AudioClip shares the sample buffer; MidiClip clones its notes
+            return copy(start_time=new_start_time, name=name or None)
 
         # Fallback: treat as AudioClip
-        from src.audio.clip import AudioClip
-
+        try:
+            src_name, buffer, sr, duration, color, file_path = _AUDIO_CTOR_ATTRS(clip)
+        except AttributeError:
+            src_name = getattr(clip, 'name', 'clip')
+            buffer = getattr(clip, 'buffer', [])
+            sr = getattr(clip, 'sample_rate', 44100)
+            duration = getattr(clip, 'duration', None)
+            color = getattr(clip, 'color', None)
+            file_path = getattr(clip, 'file_path', None)
         new_clip = AudioClip(
-            name or getattr(clip, 'name', 'clip'),
-            getattr(clip, 'buffer', []),
-            getattr(clip, 'sample_rate', 44100),
+            name or src_name,
+            buffer,
+            sr,
             new_start_time,
-            duration=getattr(clip, 'duration', None),
-            color=getattr(clip, 'color', None),
-            file_path=getattr(clip, 'file_path', None),
+            duration=duration,
+            color=color,
+            file_path=file_path,
         )
 
-        # Copy editing properties (trim, fades, pitch, volume) when available
-        try:
-            new_clip.start_offset = getattr(clip, 'start_offset', 0.0)
-            new_clip.end_offset = getattr(clip, 'end_offset', 0.0)
-            new_clip.fade_in = getattr(clip, 'fade_in', 0.0)
-            new_clip.fade_in_shape = getattr(clip, 'fade_in_shape', 'linear')
-            new_clip.fade_out = getattr(clip, 'fade_out', 0.0)
-            new_clip.fade_out_shape = getattr(clip, 'fade_out_shape', 'linear')
-            new_clip.pitch_semitones = getattr(clip, 'pitch_semitones', 0.0)
-            new_clip.volume = getattr(clip, 'volume', 1.0)
-        except Exception:
-            pass
+        # Copy editing properties (trim, fades, pitch, volume) when available;
+        # they are plain instance attributes, so read/write the dicts directly
+        src_d = getattr(clip, '__dict__', {})
+        dst_d = new_clip.__dict__
+        for key, default in _AUDIO_COPY_FIELDS:
+            dst_d[key] = src_d.get(key, default)
 
         return new_clip
 
@@ -1023,51 +1117,31 @@ class TrackClipManager:
 
         track_idx, clip = selected
 
-        try:
-            from .clip_inspector import show_clip_inspector
-        except Exception:
-            show_clip_inspector = None
-
-        if show_clip_inspector is None or self.window._root is None:
-            # Fallback: simple message box with info
-            if messagebox is None:
-                return
-            
-            # Check if it's a MIDI clip
-            try:
-                from src.midi.clip import MidiClip
-                is_midi = isinstance(clip, MidiClip)
-            except:
-                is_midi = False
-            
-            if is_midi:
-                props = f"""MIDI Clip Properties
-
-Name: {clip.name}
-Start Time: {clip.start_time:.3f} s
-End Time: {clip.end_time:.3f} s
-Duration: {clip.length_seconds:.3f} s
-Sample Rate: {clip.sample_rate} Hz
-Notes: {len(getattr(clip, 'notes', []))}
-"""
-            else:
-                props = f"""Clip Properties
+        root = self.window._root
+        if show_clip_inspector is not None and root is not None:
+            def on_apply(_clip):
+                # Redraw timeline to reflect changes (length/peaks)
+                self.schedule_redraw()
 
-Name: {clip.name}
-Start Time: {clip.start_time:.3f} s
-End Time: {clip.end_time:.3f} s
-Duration: {clip.length_seconds:.3f} s
-Sample Rate: {clip.sample_rate} Hz
-Samples: {len(clip.buffer)}
-"""
-                if hasattr(clip, 'file_path') and clip.file_path:
-                    props += f"\nSource: {clip.file_path}"
-            messagebox.showinfo("Clip Properties", props)
+            show_clip_inspector(root, clip, on_apply=on_apply, player=self.player, project=self.window.project)
             return
 
-        def on_apply(_clip):
-            # Redraw timeline to reflect changes (length/peaks)
-            if self._timeline_canvas:
-                self._timeline_canvas.redraw()
-
-        show_clip_inspector(self.window._root, clip, on_apply=on_apply, player=self.player, project=self.window.project)
+        # Fallback: simple message box with info
+        if messagebox is None:
+            return
+        
+        if isinstance(clip, MidiClip):
+            props = _MIDI_PROPS_TMPL(
+                name=clip.name, start=clip.start_time, end=clip.end_time,
+                length=clip.length_seconds, sr=clip.sample_rate,
+                notes=len(getattr(clip, 'notes', [])),
+            )
+        else:
+            props = _AUDIO_PROPS_TMPL(
+                name=clip.name, start=clip.start_time, end=clip.end_time,
+                length=clip.length_seconds, sr=clip.sample_rate,
+                samples=len(clip.buffer),
+            )
+            if hasattr(clip, 'file_path') and clip.file_path:
+                props += f"\nSource: {clip.file_path}"
+        messagebox.showinfo("Clip Properties", props)
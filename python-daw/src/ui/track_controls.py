@@ -1,11 +1,89 @@
 """Track controls for volume, pan, and meters."""
 
+import concurrent.futures
+import logging
+import operator
+import os
+import time
+import traceback
+from types import SimpleNamespace
+
 try:
     import tkinter as tk
-    from tkinter import ttk
+    from tkinter import ttk, filedialog, messagebox
 except Exception:  # pragma: no cover
     tk = None
     ttk = None
+    filedialog = None
+    messagebox = None
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+from .peak_meter import PeakMeterEnvelope
+from .worker_results import TkResultQueue
+
+_log = logging.getLogger(__name__)
+
+_METER_MIN_INTERVAL = 1.0 / 30.0  # seconds between meter updates
+_METER_BAR_HEIGHT = 16  # output meter bar thickness in pixels
+_METER_BAR_GAP = 4  # vertical space between the L and R bars
+_METER_BAR_X = 30  # bars start right of the L/R captions
+_MIX_UPDATE_INTERVAL_MS = 50  # minimum gap between vol/pan writes while dragging
+_MIX_EPSILON = 1e-4  # vol/pan changes smaller than this are not written
+_EXPORT_CHUNK_SECONDS = 1.0  # render window size for track/master exports
+_ROW_PAD_X = 4  # track row margins in the sidebar list
+_ROW_PAD_Y = 2
+
+# Clip fields stored in track templates, with defaults for clips lacking them
+_TEMPLATE_CLIP_FIELDS = (
+    ('name', None),
+    ('start_time', 0.0),
+    ('duration', None),
+    ('file_path', None),
+    ('color', None),
+    ('volume', 1.0),
+    ('pitch_semitones', 0.0),
+    ('fade_in', 0.0),
+    ('fade_out', 0.0),
+    ('start_offset', 0.0),
+    ('end_offset', 0.0),
+)
+_TEMPLATE_CLIP_KEYS = tuple(key for key, _ in _TEMPLATE_CLIP_FIELDS)
+_TEMPLATE_CLIP_ATTRS = operator.attrgetter(*_TEMPLATE_CLIP_KEYS)
+
+
+# Value label texts, pre-formatted: pan in 0.1 steps, volume in 0.01 steps
+_PAN_TEXTS = tuple(
+    "C" if p == 0 else (f"L{-p / 10:.1f}" if p < 0 else f"R{p / 10:.1f}")
+    for p in range(-10, 11)
+)
+_VOLUME_TEXTS = tuple(f"{v / 100:.2f}" for v in range(101))
+
+
+def _pan_text(pan):
+    """Format a pan value for its value label (L/C/R)."""
+    return _PAN_TEXTS[int(round(max(-1.0, min(1.0, pan)) * 10)) + 10]
+
+
+def _volume_text(vol):
+    """Format a volume for its value label (two decimals)."""
+    if 0.0 <= vol <= 1.0:
+        return _VOLUME_TEXTS[int(round(vol * 100))]
+    return f"{vol:.2f}"
+
+
+class _TrackRow:
+    """Widgets of one pooled track row in the sidebar list."""
+    
+    __slots__ = ("idx", "window", "frame", "label", "mute_btn", "solo_btn",
+                 "controls_frame", "vol_var", "pan_var", "vol_value_label",
+                 "pan_value_label", "widgets")
+    
+    def __init__(self):
+        self.idx = None  # Track index shown, None while unbound
 
 
 class TrackControls:
@@ -19,50 +97,75 @@ class TrackControls:
         self.project = project
         self._redraw_cb = redraw_cb
         
-        # Track list (custom frames instead of Treeview)
-        self.track_list_container = None
+        # Track list (custom frames instead of Treeview); track rows are
+        # pooled and rebound while scrolling (see _layout_track_rows)
+        self.canvas = None
+        self._row_pool = []  # [_TrackRow]
+        self._row_pitch = None  # Row height + padding, measured once
+        self._scrollregion = None
+        self._row_layout_pending = False
         self.track_frames = {}  # {track_idx: frame} or {"master": frame}
         self.track_labels = {}  # {track_idx: label}
         self.mute_buttons = {}  # {track_idx: button}
         self.solo_buttons = {}  # {track_idx: button}
         self.track_controls = {}  # {track_idx: controls_frame} for inline vol/pan
+        self.value_labels = {}  # {(track_idx, "vol"|"pan"): value label}
+        self._value_texts = {}  # Text last written to each value label
+        self._row_widgets = {}  # {track_id: [widgets repainted on selection]}
         
         # Control variables per track
         self.volume_vars = {}  # {track_idx: tk.DoubleVar}
         self.pan_vars = {}  # {track_idx: tk.DoubleVar}
         
-        # Meters
-        self.meter_L = None
-        self.meter_R = None
+        # Meters: one canvas with a static background and two bar items
+        self.meter_canvas = None
+        self._bar_L = None
+        self._bar_R = None
         
         # Current selection
         self.current_track_idx = None
+        self._highlighted_track = None  # Row currently painted as selected
+        self._highlight_scheduled = False
         
         # Control frames that need color update
         self.controls_frame = None
         self.meters_frame = None
         self.vol_row = None
         self.pan_row = None
-        self.meter_L_row = None
-        self.meter_R_row = None
         self.vol_label = None
         self.pan_label = None
         self.output_label = None
-        self.meter_L_label = None
-        self.meter_R_label = None
         self.mute_solo_row = None
         
-        # TTK Style for dynamic colors
+        # Unused: row colors are plain tk options, ttk styles are set once
+        # by ThemeManager at startup
         self.style = None
         
+        # Pending vol/pan values, written at most once per update interval
+        self._pending_mix = {}  # {(track_idx | "master", "volume"|"pan"): value}
+        self._mix_after_id = None
+        
+        # Meter throttling: last update time and last displayed values
+        self._last_meter_update = 0.0
+        self._meter_envs = (PeakMeterEnvelope(1), PeakMeterEnvelope(1))
+        
+        # Context menus, built once in build_ui
+        self._track_menu = None
+        self._master_menu = None
+        self._menu_track_idx = None  # Track the track menu acts on
+        
+        # Offline render engine for exports (see _get_export_engine)
+        self._engine = None
+        # Exports render and write on a worker thread (see _run_export)
+        self._export_pool = None
+        self._export_results = None  # TkResultQueue on the sidebar
+        self._export_future = None
+        
     def build_ui(self):
         """Build the track controls UI - fixed list with optional scrollbar."""
         if self.parent is None or tk is None:
             return
         
-        # Initialize style
-        self.style = ttk.Style()
-        
         # Master track pinned (non-scrolling)
         self.master_container = ttk.Frame(self.parent, style="Sidebar.TFrame")
         self.master_container.pack(fill="x", padx=0, pady=(0, 0))
@@ -79,14 +182,7 @@ class TrackControls:
         self.canvas = tk.Canvas(tracks_outer, bg="#2d2d2d", highlightthickness=0)
         self.scrollbar = ttk.Scrollbar(tracks_outer, orient="vertical", command=self.canvas.yview)
         
-        self.track_list_container = ttk.Frame(self.canvas, style="Sidebar.TFrame")
-        self.track_list_container.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-        
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.track_list_container, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=self._on_track_list_scroll)
         
         # Bind mouse wheel for sidebar scrolling
         self.canvas.bind("<Enter>", lambda e: self.canvas.bind_all("<MouseWheel>", self._on_mousewheel))
@@ -98,6 +194,8 @@ class TrackControls:
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
         
+        self._build_context_menus()
+        
         # Bottom section: OUTPUT meters (fixed at bottom)
         self.meters_frame = ttk.Frame(self.parent, style="Sidebar.TFrame")
         self.meters_frame.pack(fill="x", padx=12, pady=(12, 12), side="bottom")
@@ -112,283 +210,439 @@ class TrackControls:
         )
         self.output_label.pack(anchor="w", padx=12, pady=(0, 8))
         
-        # Left meter with improved layout
-        self.meter_L_row = ttk.Frame(self.meters_frame, style="Sidebar.TFrame")
-        self.meter_L_row.pack(fill="x", padx=12, pady=2)
-        self.meter_L_label = ttk.Label(
-            self.meter_L_row, text="L", style="Sidebar.TLabel",
-            width=3, font=("Segoe UI", 8, "bold")
-        )
-        self.meter_L_label.pack(side="left", padx=(0, 8))
-        
-        self.meter_L = ttk.Progressbar(
-            self.meter_L_row, mode="determinate", maximum=1.0,
-            style="Meter.Horizontal.TProgressbar"
+        # L/R meters share one canvas: captions and troughs are drawn once
+        # (and moved on resize), updates only change the two bars' coords
+        self.meter_canvas = tk.Canvas(
+            self.meters_frame, bg="#2d2d2d", highlightthickness=0,
+            height=2 * _METER_BAR_HEIGHT + _METER_BAR_GAP
         )
-        self.meter_L.pack(side="left", fill="x", expand=True, padx=0)
-        
-        # Right meter with improved layout
-        self.meter_R_row = ttk.Frame(self.meters_frame, style="Sidebar.TFrame")
-        self.meter_R_row.pack(fill="x", padx=12, pady=2)
-        self.meter_R_label = ttk.Label(
-            self.meter_R_row, text="R", style="Sidebar.TLabel",
-            width=3, font=("Segoe UI", 8, "bold")
+        self.meter_canvas.pack(fill="x", padx=12, pady=2)
+        for ch, text in enumerate(("L", "R")):
+            y0 = ch * (_METER_BAR_HEIGHT + _METER_BAR_GAP)
+            self.meter_canvas.create_text(
+                0, y0 + _METER_BAR_HEIGHT // 2, text=text, anchor="w",
+                fill="#f5f5f5", font=("Segoe UI", 8, "bold"), tags="bg"
+            )
+            self.meter_canvas.create_rectangle(
+                _METER_BAR_X, y0, _METER_BAR_X, y0 + _METER_BAR_HEIGHT,
+                fill="#1a1a1a", width=0, tags=("bg", f"trough{ch}")
+            )
+        self._bar_L = self.meter_canvas.create_rectangle(
+            _METER_BAR_X, 0, _METER_BAR_X, _METER_BAR_HEIGHT, fill="#10b981", width=0
         )
-        self.meter_R_label.pack(side="left", padx=(0, 8))
-        
-        self.meter_R = ttk.Progressbar(
-            self.meter_R_row, mode="determinate", maximum=1.0,
-            style="Meter.Horizontal.TProgressbar"
+        y0 = _METER_BAR_HEIGHT + _METER_BAR_GAP
+        self._bar_R = self.meter_canvas.create_rectangle(
+            _METER_BAR_X, y0, _METER_BAR_X, y0 + _METER_BAR_HEIGHT, fill="#10b981", width=0
         )
-        self.meter_R.pack(side="left", fill="x", expand=True, padx=0)
+        self.meter_canvas.bind("<Configure>", self._on_meter_resize)
     
     def populate_tracks(self, timeline=None):
         """Populate track list from mixer - Master pinned, tracks scrollable."""
-        if self.mixer is None or self.track_list_container is None:
-            print(f"populate_tracks: mixer={self.mixer}, container={self.track_list_container}")
+        if self.mixer is None or self.canvas is None:
+            _log.debug("populate_tracks: mixer=%s, canvas=%s", self.mixer, self.canvas)
             return
         
-        print(f"populate_tracks: Found {len(self.mixer.tracks)} tracks in mixer")
+        _log.debug("populate_tracks: %d tracks in mixer", len(self.mixer.tracks))
         
-        # Clear existing widgets in both containers
-        # Master (pinned)
-        if hasattr(self, 'master_container') and self.master_container is not None:
-            for widget in self.master_container.winfo_children():
-                widget.destroy()
-        # Tracks (scrollable)
-        for widget in self.track_list_container.winfo_children():
-            widget.destroy()
+        # Master (pinned) never changes shape, so an existing row is kept and
+        # only resynced; rebuilding it would repaint the visible sidebar
+        master_frame = self.track_frames.get("master")
+        master_label = self.track_labels.get("master")
+        if self._highlighted_track == "master" and master_frame is not None:
+            self._paint_track_row("master", "#2d2d2d")
+        master_widgets = self._row_widgets.get("master")
+        for row in self._row_pool:
+            if row.idx is not None:
+                self._unbind_row(row)
         self.track_frames.clear()
         self.track_labels.clear()
+        self._row_widgets.clear()
         self.mute_buttons.clear()
         self.solo_buttons.clear()
+        self._highlighted_track = None  # Rows are rebuilt unselected
         
-        # Add Master to pinned container (no M/S buttons)
-        self._create_track_row("master", "Master", None, show_ms=False, container=getattr(self, 'master_container', None))
+        if master_frame is not None and master_frame.winfo_exists():
+            self.track_frames["master"] = master_frame
+            self.track_labels["master"] = master_label
+            self._row_widgets["master"] = master_widgets
+            self._sync_master_row()
+        else:
+            if hasattr(self, 'master_container') and self.master_container is not None:
+                for widget in self.master_container.winfo_children():
+                    widget.destroy()
+            # Add Master to pinned container (no M/S buttons)
+            self._create_master_row(self.master_container)
         
-        # Add all tracks
-        for idx, track in enumerate(self.mixer.tracks):
-            name = track.get("name", f"Track {idx+1}")
-            color = track.get("color", "#3b82f6")
-            self._create_track_row(idx, name, color, show_ms=True, container=self.track_list_container)
+        # Tracks (scrollable): the pooled rows are rebound to the current
+        # mixer tracks; only the rows in view exist, whatever the track count
+        self._layout_track_rows()
         
-        print(f"populate_tracks: Created {len(self.track_frames)} track rows")
+        _log.debug("populate_tracks: %d track rows in view", len(self.track_frames) - 1)
     
-    def _create_track_row(self, track_id, name, color, show_ms=True, container=None):
-        """Create a single track row with name + M/S buttons + inline controls.
+    def _get_track(self, track_idx):
+        """Return the mixer track dict at track_idx, or None if there is none."""
+        mixer = self.mixer
+        if mixer is None or not isinstance(track_idx, int):
+            return None
+        tracks = mixer.tracks
+        if not 0 <= track_idx < len(tracks):
+            return None
+        return tracks[track_idx]
+    
+    def _sync_master_row(self):
+        """Show the mixer's master volume on the kept master row."""
+        vol = getattr(self.mixer, 'master_volume', 1.0)
+        vol_var = self.volume_vars.get("master")
+        if vol_var is not None:
+            vol_var.set(vol)
+        self._set_value_label(("master", "vol"), _volume_text(vol))
+    
+    def _set_value_label(self, key, text):
+        """Write a vol/pan value label, skipping writes that keep its text.
         
-        Args:
-            track_id: "master" or int (track index)
-            name: Track name to display
-            color: Hex color for the track (None for master)
-            show_ms: Whether to show M/S buttons (False for master)
-            container: Parent container (defaults to track_list_container if None)
+        During a drag most ticks stay within one displayed step (0.01 for
+        volume, 0.1 for pan), so those Tcl writes are dropped.
         """
-        if container is None:
-            container = self.track_list_container
-        
-        # Main row frame (no fixed height, independent scrolling)
-        row_frame = tk.Frame(
-            container,
-            bg="#2d2d2d" if track_id == "master" else "#1e1e1e",
-            highlightthickness=0
+        label = self.value_labels.get(key)
+        if label is not None and self._value_texts.get(key) != text:
+            label.configure(text=text)
+            self._value_texts[key] = text
+    
+    def _on_track_list_scroll(self, first, last):
+        """Canvas yscrollcommand: move the scrollbar and rebind rows in view."""
+        self.scrollbar.set(first, last)
+        self._schedule_row_layout()
+    
+    def _schedule_row_layout(self):
+        """Lay out the track rows once Tk is idle.
+        
+        Scrolling and resizing report many view changes in a burst; they
+        collapse into one _layout_track_rows call.
+        """
+        if self._row_layout_pending:
+            return
+        self._row_layout_pending = True
+        self.canvas.after_idle(self._flush_row_layout)
+    
+    def _flush_row_layout(self):
+        """Apply a scheduled row layout."""
+        self._row_layout_pending = False
+        try:
+            self._layout_track_rows()
+        except tk.TclError:
+            pass  # Sidebar destroyed before the idle callback ran
+    
+    def _layout_track_rows(self):
+        """Bind and place the pooled rows covering the visible part of the list.
+        
+        Only enough rows to fill the viewport exist. Track i is shown by
+        pool slot i % len(pool), so scrolling by one row rebinds a single
+        row; slots past the last track are hidden.
+        """
+        canvas = self.canvas
+        if canvas is None or self.mixer is None:
+            return
+        count = len(self.mixer.tracks)
+        pool = self._row_pool
+        if not pool:
+            pool.append(self._create_pool_row())
+        pitch = self._row_pitch
+        if pitch is None:
+            # Rows are uniform: measure the first one once
+            frame = pool[0].frame
+            frame.update_idletasks()
+            pitch = self._row_pitch = frame.winfo_reqheight() + 2 * _ROW_PAD_Y
+        
+        needed = min(count, max(1, canvas.winfo_height()) // pitch + 2)
+        while len(pool) < needed:
+            pool.append(self._create_pool_row())
+        
+        region = (0, 0, canvas.winfo_width(), count * pitch)
+        if region != self._scrollregion:
+            # Only on change: configuring it reports a view change, which
+            # schedules another layout
+            self._scrollregion = region
+            canvas.configure(scrollregion=region)
+        
+        size = len(pool)
+        first = max(0, int(canvas.canvasy(0)) // pitch)
+        visible = range(first, min(count, first + size))
+        for i in visible:
+            row = pool[i % size]
+            if row.idx != i:
+                self._bind_row(row, i)
+                canvas.coords(row.window, _ROW_PAD_X, i * pitch + _ROW_PAD_Y)
+                canvas.itemconfigure(row.window, state="normal")
+        used = {i % size for i in visible}
+        for slot, row in enumerate(pool):
+            if slot not in used and row.idx is not None:
+                self._unbind_row(row)
+                canvas.itemconfigure(row.window, state="hidden")
+    
+    def _bind_row(self, row, idx):
+        """Show mixer track idx on a pooled row and register its widgets."""
+        if row.idx is not None:
+            self._unbind_row(row)
+        track = self.mixer.tracks[idx]
+        row.idx = idx
+        
+        bg = "#2d4a6b" if idx == self._highlighted_track else "#1e1e1e"
+        for widget in row.widgets:
+            widget.configure(bg=bg)
+        row.label.configure(
+            text=track.get("name", f"Track {idx+1}"),
+            fg=track.get("color", "#3b82f6")
         )
-        row_frame.pack(fill="x", padx=4, pady=2)
+        row.mute_btn.configure(style="Mute.On.TButton" if track.get("mute", False) else "Mute.Off.TButton")
+        row.solo_btn.configure(style="Solo.On.TButton" if track.get("solo", False) else "Solo.Off.TButton")
+        volume = track.get("volume", 1.0)
+        pan = track.get("pan", 0.0)
+        # Setting the variables moves the scales without calling their command
+        row.vol_var.set(volume)
+        row.pan_var.set(pan)
+        
+        self.track_frames[idx] = row.frame
+        self.track_labels[idx] = row.label
+        self.mute_buttons[idx] = row.mute_btn
+        self.solo_buttons[idx] = row.solo_btn
+        self.track_controls[idx] = row.controls_frame
+        self.volume_vars[idx] = row.vol_var
+        self.pan_vars[idx] = row.pan_var
+        self.value_labels[(idx, "vol")] = row.vol_value_label
+        self.value_labels[(idx, "pan")] = row.pan_value_label
+        self._set_value_label((idx, "vol"), _volume_text(volume))
+        self._set_value_label((idx, "pan"), _pan_text(pan))
+        self._row_widgets[idx] = row.widgets
+    
+    def _unbind_row(self, row):
+        """Detach a pooled row from its track (the widgets are kept).
+        
+        Entries are only dropped while they still point at this row's
+        widgets: when the pool grows, a track can already have been bound
+        to its new slot before its old slot is reused.
+        """
+        idx = row.idx
+        row.idx = None
+        for registry, widget in ((self.track_frames, row.frame),
+                                 (self.track_labels, row.label),
+                                 (self.mute_buttons, row.mute_btn),
+                                 (self.solo_buttons, row.solo_btn),
+                                 (self.track_controls, row.controls_frame),
+                                 (self.volume_vars, row.vol_var),
+                                 (self.pan_vars, row.pan_var),
+                                 (self._row_widgets, row.widgets)):
+            if registry.get(idx) is widget:
+                del registry[idx]
+        for key, label in (((idx, "vol"), row.vol_value_label),
+                           ((idx, "pan"), row.pan_value_label)):
+            if self.value_labels.get(key) is label:
+                del self.value_labels[key]
+                self._value_texts.pop(key, None)
+    
+    def _create_pool_row(self):
+        """Create an unbound, hidden track row: name + FX/S/M buttons + vol/pan.
+        
+        Callbacks read the row's current track index, so a row is rebound
+        to another track without touching its bindings.
+        """
+        row = _TrackRow()
+        bg = "#1e1e1e"
+        
+        # Main row frame, placed on the list canvas as a window item
+        row_frame = tk.Frame(self.canvas, bg=bg, highlightthickness=0)
         
         # Top bar with name and buttons
-        top_bar = tk.Frame(row_frame, bg=row_frame["bg"])
+        top_bar = tk.Frame(row_frame, bg=bg)
         top_bar.pack(fill="x", padx=4, pady=4)
         
-        # Make row clickable for selection
-        top_bar.bind("<Button-1>", lambda e, tid=track_id: self._on_track_click(tid))
-        
         # Track name label
         label = tk.Label(
             top_bar,
-            text=name,
-            fg=color if color else "#f5f5f5",
-            bg=row_frame["bg"],
-            font=("Segoe UI", 10, "bold" if track_id == "master" else "normal"),
+            text="",
+            bg=bg,
+            font=("Segoe UI", 10, "normal"),
             anchor="w"
         )
         label.pack(side="left", fill="x", expand=True)
-        label.bind("<Button-1>", lambda e, tid=track_id: self._on_track_click(tid))
         
-        # Right-click menu
-        if track_id != "master":
-            top_bar.bind("<Button-3>", lambda e, tid=track_id: self._on_track_right_click_new(e, tid))
-            label.bind("<Button-3>", lambda e, tid=track_id: self._on_track_right_click_new(e, tid))
-        else:
-            top_bar.bind("<Button-3>", lambda e: self._on_master_right_click(e))
-            label.bind("<Button-3>", lambda e: self._on_master_right_click(e))
-        
-        # M/S buttons (only for tracks, not master) - improved sizing
-        if show_ms and track_id != "master":
-            idx = track_id
-            is_muted = self.mixer.tracks[idx].get("mute", False)
-            is_soloed = self.mixer.tracks[idx].get("solo", False)
-            
-            # Buttons container for consistent spacing
-            buttons_frame = tk.Frame(top_bar, bg=row_frame["bg"])
-            buttons_frame.pack(side="right", padx=0)
-            
-            # FX button (new)
-            fx_btn = tk.Button(
-                buttons_frame,
-                text="FX",
-                width=3,
-                height=1,
-                bg="#8b5cf6",
-                fg="#ffffff",
-                font=("Segoe UI", 8, "bold"),
-                relief="flat",
-                cursor="hand2",
-                borderwidth=0,
-                command=lambda: self._open_effects_dialog(idx)
-            )
-            fx_btn.pack(side="right", padx=2)
-            
-            # Solo button with improved style
-            solo_btn = tk.Button(
-                buttons_frame,
-                text="S",
-                width=2,
-                height=1,
-                bg="#eab308" if is_soloed else "#404040",
-                fg="#ffffff",
-                font=("Segoe UI", 9, "bold"),
-                relief="flat",
-                cursor="hand2",
-                borderwidth=0,
-                command=lambda: self._toggle_solo(idx)
-            )
-            solo_btn.pack(side="right", padx=2)
-            self.solo_buttons[idx] = solo_btn
-            
-            # Mute button with improved style
-            mute_btn = tk.Button(
-                buttons_frame,
-                text="M",
-                width=2,
-                height=1,
-                bg="#dc2626" if is_muted else "#404040",
-                fg="#ffffff",
-                font=("Segoe UI", 9, "bold"),
-                relief="flat",
-                cursor="hand2",
-                borderwidth=0,
-                command=lambda: self._toggle_mute(idx)
-            )
-            mute_btn.pack(side="right", padx=2)
-            self.mute_buttons[idx] = mute_btn
+        # Row is clickable for selection, right-click opens the track menu
+        for widget in (top_bar, label):
+            widget.bind("<Button-1>", lambda e, r=row: self._on_track_click(r.idx))
+            widget.bind("<Button-3>", lambda e, r=row: self._on_track_right_click_new(e, r.idx))
+        
+        # Buttons container for consistent spacing
+        buttons_frame = tk.Frame(top_bar, bg=bg)
+        buttons_frame.pack(side="right", padx=0)
+        
+        # FX button (new)
+        fx_btn = tk.Button(
+            buttons_frame,
+            text="FX",
+            width=3,
+            height=1,
+            bg="#8b5cf6",
+            fg="#ffffff",
+            font=("Segoe UI", 8, "bold"),
+            relief="flat",
+            cursor="hand2",
+            borderwidth=0,
+            command=lambda r=row: self._open_effects_dialog(r.idx)
+        )
+        fx_btn.pack(side="right", padx=2)
         
-        # Inline controls frame (Vol/Pan) - for ALL tracks including master
-        # Master: inline in top_bar to fit in 32px, Tracks: separate frame
+        # Solo/mute buttons: colors come from the Solo/Mute On/Off ttk
+        # styles (ThemeManager), so toggling swaps one style name
+        solo_btn = ttk.Button(
+            buttons_frame,
+            text="S",
+            width=2,
+            style="Solo.Off.TButton",
+            cursor="hand2",
+            command=lambda r=row: self._toggle_solo(r.idx)
+        )
+        solo_btn.pack(side="right", padx=2)
+        
+        mute_btn = ttk.Button(
+            buttons_frame,
+            text="M",
+            width=2,
+            style="Mute.Off.TButton",
+            cursor="hand2",
+            command=lambda r=row: self._toggle_mute(r.idx)
+        )
+        mute_btn.pack(side="right", padx=2)
         
-        # Controls frame for vol/pan sliders
-        controls_frame = tk.Frame(row_frame, bg=row_frame["bg"])
+        # Controls frame for vol/pan sliders; label / scale / value columns
+        # are gridded straight into it (no per-line sub-frames)
+        controls_frame = tk.Frame(row_frame, bg=bg)
         controls_frame.pack(fill="x", padx=4, pady=(0, 4))
+        controls_frame.grid_columnconfigure(1, weight=1)
         
-        if track_id == "master":
-            # Master: only volume control
-            vol_row = tk.Frame(controls_frame, bg=row_frame["bg"])
-            vol_row.pack(fill="x", padx=4, pady=2)
-            
-            vol_label = tk.Label(
-                vol_row, text="Vol", bg=row_frame["bg"], fg="#a0a0a0",
-                font=("Segoe UI", 8), width=3, anchor="w"
-            )
-            vol_label.pack(side="left", padx=(0, 4))
-            
-            vol_var = tk.DoubleVar(value=getattr(self.mixer, 'master_volume', 1.0))
-            vol_scale = ttk.Scale(
-                vol_row, from_=0.0, to=1.0, orient="horizontal",
-                variable=vol_var, 
-                command=lambda v: self._on_master_volume_change(v)
-            )
-            vol_scale.pack(side="left", fill="x", expand=True, padx=(0, 4))
-            
-            vol_value_label = tk.Label(
-                vol_row, text="1.00", bg=row_frame["bg"], fg="#f5f5f5",
-                font=("Segoe UI", 8, "bold"), width=4, anchor="e"
-            )
-            vol_value_label.pack(side="left")
-            
-            self.track_controls["master"] = controls_frame
-            self.volume_vars["master"] = vol_var
-            if not hasattr(self, 'value_labels'):
-                self.value_labels = {}
-            self.value_labels[("master", "vol")] = vol_value_label
-            
-        else:
-            # Regular tracks: vol + pan controls
-            idx = track_id
-            
-            # Volume control
-            vol_row = tk.Frame(controls_frame, bg=row_frame["bg"])
-            vol_row.pack(fill="x", padx=4, pady=2)
-            
-            vol_label = tk.Label(
-                vol_row, text="Vol", bg=row_frame["bg"], fg="#a0a0a0",
-                font=("Segoe UI", 8), width=3, anchor="w"
-            )
-            vol_label.pack(side="left", padx=(0, 4))
-            
-            vol_var = tk.DoubleVar(value=self.mixer.tracks[idx].get("volume", 1.0))
-            vol_scale = ttk.Scale(
-                vol_row, from_=0.0, to=1.0, orient="horizontal",
-                variable=vol_var, 
-                command=lambda v, i=idx: self._on_volume_change_inline(i, v)
-            )
-            vol_scale.pack(side="left", fill="x", expand=True, padx=(0, 4))
-            
-            vol_value_label = tk.Label(
-                vol_row, text=f"{self.mixer.tracks[idx].get('volume', 1.0):.2f}", 
-                bg=row_frame["bg"], fg="#f5f5f5",
-                font=("Segoe UI", 8, "bold"), width=4, anchor="e"
-            )
-            vol_value_label.pack(side="left")
-            
-            # Pan control
-            pan_row = tk.Frame(controls_frame, bg=row_frame["bg"])
-            pan_row.pack(fill="x", padx=4, pady=2)
-            
-            pan_label = tk.Label(
-                pan_row, text="Pan", bg=row_frame["bg"], fg="#a0a0a0",
-                font=("Segoe UI", 8), width=3, anchor="w"
-            )
-            pan_label.pack(side="left", padx=(0, 4))
-            
-            pan_var = tk.DoubleVar(value=self.mixer.tracks[idx].get("pan", 0.0))
-            pan_scale = ttk.Scale(
-                pan_row, from_=-1.0, to=1.0, orient="horizontal",
-                variable=pan_var,
-                command=lambda v, i=idx: self._on_pan_change_inline(i, v)
-            )
-            pan_scale.pack(side="left", fill="x", expand=True, padx=(0, 4))
-            
-            # Value label (L/C/R format)
-            pan_value = self.mixer.tracks[idx].get("pan", 0.0)
-            pan_text = "C" if abs(pan_value) < 0.05 else (f"L{abs(pan_value):.1f}" if pan_value < 0 else f"R{pan_value:.1f}")
-            pan_value_label = tk.Label(
-                pan_row, text=pan_text, 
-                bg=row_frame["bg"], fg="#f5f5f5",
-                font=("Segoe UI", 8, "bold"), width=4, anchor="e"
-            )
-            pan_value_label.pack(side="left")
-            
-            self.track_controls[idx] = controls_frame
-            self.volume_vars[idx] = vol_var
-            self.pan_vars[idx] = pan_var
-            
-            # Store value labels for updates
-            if not hasattr(self, 'value_labels'):
-                self.value_labels = {}
-            self.value_labels[(idx, "vol")] = vol_value_label
-            self.value_labels[(idx, "pan")] = pan_value_label
+        # Volume control
+        vol_label = tk.Label(
+            controls_frame, text="Vol", bg=bg, fg="#a0a0a0",
+            font=("Segoe UI", 8), width=3, anchor="w"
+        )
+        vol_label.grid(row=0, column=0, sticky="w", padx=(4, 4), pady=2)
+        
+        vol_var = tk.DoubleVar(value=1.0)
+        vol_scale = ttk.Scale(
+            controls_frame, from_=0.0, to=1.0, orient="horizontal",
+            variable=vol_var, 
+            command=lambda v, r=row: self._queue_mix_update(r.idx, "volume", v)
+        )
+        vol_scale.bind("<ButtonRelease-1>", self._commit_mix_updates)
+        vol_scale.grid(row=0, column=1, sticky="ew", padx=(0, 4), pady=2)
+        
+        vol_value_label = tk.Label(
+            controls_frame, text="1.00", bg=bg, fg="#f5f5f5",
+            font=("Segoe UI", 8, "bold"), width=4, anchor="e"
+        )
+        vol_value_label.grid(row=0, column=2, sticky="e", padx=(0, 4), pady=2)
+        
+        # Pan control
+        pan_label = tk.Label(
+            controls_frame, text="Pan", bg=bg, fg="#a0a0a0",
+            font=("Segoe UI", 8), width=3, anchor="w"
+        )
+        pan_label.grid(row=1, column=0, sticky="w", padx=(4, 4), pady=2)
+        
+        pan_var = tk.DoubleVar(value=0.0)
+        pan_scale = ttk.Scale(
+            controls_frame, from_=-1.0, to=1.0, orient="horizontal",
+            variable=pan_var,
+            command=lambda v, r=row: self._queue_mix_update(r.idx, "pan", v)
+        )
+        pan_scale.bind("<ButtonRelease-1>", self._commit_mix_updates)
+        pan_scale.grid(row=1, column=1, sticky="ew", padx=(0, 4), pady=2)
+        
+        # Value label (L/C/R format)
+        pan_value_label = tk.Label(
+            controls_frame, text="C", bg=bg, fg="#f5f5f5",
+            font=("Segoe UI", 8, "bold"), width=4, anchor="e"
+        )
+        pan_value_label.grid(row=1, column=2, sticky="e", padx=(0, 4), pady=2)
         
-        self.track_frames[track_id] = row_frame
-        self.track_labels[track_id] = label
+        row.frame = row_frame
+        row.label = label
+        row.mute_btn = mute_btn
+        row.solo_btn = solo_btn
+        row.controls_frame = controls_frame
+        row.vol_var = vol_var
+        row.pan_var = pan_var
+        row.vol_value_label = vol_value_label
+        row.pan_value_label = pan_value_label
+        # Widgets sharing the row background, repainted on selection
+        row.widgets = [row_frame, top_bar, label, buttons_frame, controls_frame,
+                       vol_label, vol_value_label, pan_label, pan_value_label]
+        row.window = self.canvas.create_window(
+            _ROW_PAD_X, 0, window=row_frame, anchor="nw", state="hidden",
+            width=max(1, self.canvas.winfo_width() - 2 * _ROW_PAD_X), tags="track_row"
+        )
+        return row
+    
+    def _create_master_row(self, container):
+        """Create the pinned Master row: name + inline master volume."""
+        bg = "#2d2d2d"
+        
+        # Main row frame (no fixed height)
+        row_frame = tk.Frame(container, bg=bg, highlightthickness=0)
+        row_frame.pack(fill="x", padx=_ROW_PAD_X, pady=_ROW_PAD_Y)
+        
+        # Top bar with name
+        top_bar = tk.Frame(row_frame, bg=bg)
+        top_bar.pack(fill="x", padx=4, pady=4)
+        
+        label = tk.Label(
+            top_bar,
+            text="Master",
+            fg="#f5f5f5",
+            bg=bg,
+            font=("Segoe UI", 10, "bold"),
+            anchor="w"
+        )
+        label.pack(side="left", fill="x", expand=True)
+        
+        # Row is clickable for selection, right-click opens the master menu
+        for widget in (top_bar, label):
+            widget.bind("<Button-1>", lambda e: self._on_track_click("master"))
+            widget.bind("<Button-3>", lambda e: self._on_master_right_click(e))
+        
+        # Controls frame for the volume slider
+        controls_frame = tk.Frame(row_frame, bg=bg)
+        controls_frame.pack(fill="x", padx=4, pady=(0, 4))
+        controls_frame.grid_columnconfigure(1, weight=1)
+        
+        vol_label = tk.Label(
+            controls_frame, text="Vol", bg=bg, fg="#a0a0a0",
+            font=("Segoe UI", 8), width=3, anchor="w"
+        )
+        vol_label.grid(row=0, column=0, sticky="w", padx=(4, 4), pady=2)
+        
+        vol_var = tk.DoubleVar(value=getattr(self.mixer, 'master_volume', 1.0))
+        vol_scale = ttk.Scale(
+            controls_frame, from_=0.0, to=1.0, orient="horizontal",
+            variable=vol_var, 
+            command=self._on_master_volume_change
+        )
+        vol_scale.bind("<ButtonRelease-1>", self._commit_mix_updates)
+        vol_scale.grid(row=0, column=1, sticky="ew", padx=(0, 4), pady=2)
+        
+        vol_value_label = tk.Label(
+            controls_frame, text="1.00", bg=bg, fg="#f5f5f5",
+            font=("Segoe UI", 8, "bold"), width=4, anchor="e"
+        )
+        vol_value_label.grid(row=0, column=2, sticky="e", padx=(0, 4), pady=2)
+        
+        self.track_controls["master"] = controls_frame
+        self.volume_vars["master"] = vol_var
+        self.value_labels[("master", "vol")] = vol_value_label
+        self._value_texts.pop(("master", "vol"), None)
+        self._set_value_label(("master", "vol"), _volume_text(vol_var.get()))
+        self.track_frames["master"] = row_frame
+        self.track_labels["master"] = label
+        self._row_widgets["master"] = [row_frame, top_bar, label, controls_frame,
+                                       vol_label, vol_value_label]
     
     def get_current_track_index(self):
         """Get currently selected track index."""
@@ -402,45 +656,56 @@ class TrackControls:
             self.current_track_idx = track_id
         
         self._on_select_track()
+        self._schedule_selection_highlight()
+    
+    def _schedule_selection_highlight(self):
+        """Repaint the selected row once Tk is idle.
+        
+        Selection changes arriving in one burst (auto-repeat, a click
+        followed by a menu) are painted once, for the last selection.
+        """
+        if self._highlight_scheduled:
+            return
+        self._highlight_scheduled = True
+        try:
+            self.parent.after_idle(self._flush_selection_highlight)
+        except Exception:
+            self._flush_selection_highlight()
+    
+    def _flush_selection_highlight(self):
+        """Apply a scheduled selection highlight."""
+        self._highlight_scheduled = False
         self._update_selection_highlight()
     
     def _update_selection_highlight(self):
-        """Update visual highlight for selected track - controls are always visible."""
-        for tid, frame in self.track_frames.items():
-            if tid == self.current_track_idx or (tid == "master" and self.current_track_idx == -1):
-                # Selected track - subtle blue-gray background
-                selected_bg = "#2d4a6b"  # More subtle blue-gray color
-                frame.configure(bg=selected_bg)
-                if tid in self.track_labels:
-                    self.track_labels[tid].configure(bg=selected_bg)
-                
-                # Update all child frames and labels bg
-                for child in frame.winfo_children():
-                    if isinstance(child, tk.Frame):
-                        child.configure(bg=selected_bg)
-                        for subchild in child.winfo_children():
-                            if isinstance(subchild, (tk.Label, tk.Frame)):
-                                try:
-                                    subchild.configure(bg=selected_bg)
-                                except:
-                                    pass
-            else:
-                # Unselected track - dark background
-                bg_color = "#2d2d2d" if tid == "master" else "#1e1e1e"
-                frame.configure(bg=bg_color)
-                if tid in self.track_labels:
-                    self.track_labels[tid].configure(bg=bg_color)
-                
-                # Update all child frames and labels bg
-                for child in frame.winfo_children():
-                    if isinstance(child, tk.Frame):
-                        child.configure(bg=bg_color)
-                        for subchild in child.winfo_children():
-                            if isinstance(subchild, (tk.Label, tk.Frame)):
-                                try:
-                                    subchild.configure(bg=bg_color)
-                                except:
-                                    pass
+        """Update visual highlight for selected track - controls are always visible.
+        
+        Only the previously highlighted row and the newly selected one are
+        repainted; walking every row's children costs Tk round-trips.
+        """
+        selected = "master" if self.current_track_idx == -1 else self.current_track_idx
+        previous = self._highlighted_track
+        if previous == selected:
+            return
+        if previous in self.track_frames:
+            # Unselected track - dark background
+            self._paint_track_row(previous, "#2d2d2d" if previous == "master" else "#1e1e1e")
+        if selected in self.track_frames:
+            # Selected track - subtle blue-gray background
+            self._paint_track_row(selected, "#2d4a6b")
+        self._highlighted_track = selected
+    
+    def _paint_track_row(self, tid, bg_color):
+        """Set the background of a track row's frames and labels.
+        
+        The widgets are listed when the row is created, so no
+        winfo_children() walk is needed.
+        """
+        for widget in self._row_widgets.get(tid, ()):
+            try:
+                widget.configure(bg=bg_color)
+            except tk.TclError:
+                pass  # Widget already destroyed
     
     def _on_select_track(self, event=None):
         """Handle track selection."""
@@ -452,55 +717,113 @@ class TrackControls:
         # Just trigger color update if needed
         pass
     
-    def _on_volume_change_inline(self, track_idx, value=None):
-        """Handle volume change for inline track control."""
-        if self.mixer is None or track_idx >= len(self.mixer.tracks):
+    def _queue_mix_update(self, track_idx, key, value):
+        """Throttle scale drags to one mixer write per update interval.
+        
+        ttk.Scale calls its command for every intermediate value while
+        dragging. The first change after a quiet period is applied at once
+        so the audio reacts immediately; later ones only replace the pending
+        value, and the latest is applied when the interval ends.
+        """
+        self._pending_mix[(track_idx, key)] = value
+        if self._mix_after_id is None:
+            self._flush_mix_updates()
+    
+    def _flush_mix_updates(self):
+        """Apply the pending vol/pan values and start a new quiet interval."""
+        self._mix_after_id = None
+        if not self._apply_pending_mix():
             return
         try:
-            if track_idx in self.volume_vars:
-                vol = float(self.volume_vars[track_idx].get())
-                self.mixer.tracks[track_idx]["volume"] = vol
-                
-                # Update value label
-                if hasattr(self, 'value_labels') and (track_idx, "vol") in self.value_labels:
-                    self.value_labels[(track_idx, "vol")].configure(text=f"{vol:.2f}")
-        except Exception as e:
-            print(f"Error updating volume: {e}")
+            self._mix_after_id = self.parent.after(_MIX_UPDATE_INTERVAL_MS, self._flush_mix_updates)
+        except Exception:
+            self._mix_after_id = None
+    
+    def _commit_mix_updates(self, event=None):
+        """Write the final value of a drag on mouse release, without waiting."""
+        if self._mix_after_id is not None:
+            try:
+                self.parent.after_cancel(self._mix_after_id)
+            except Exception:
+                pass
+            self._mix_after_id = None
+        self._apply_pending_mix()
+    
+    def _apply_pending_mix(self):
+        """Apply and clear the pending vol/pan values.
+        
+        Returns:
+            True if anything was applied
+        """
+        pending, self._pending_mix = self._pending_mix, {}
+        for (track_idx, key), value in pending.items():
+            if track_idx == "master":
+                self._apply_master_volume(value)
+            elif key == "volume":
+                self._apply_volume(track_idx, value)
+            else:
+                self._apply_pan(track_idx, value)
+        return bool(pending)
+    
+    def _apply_volume(self, track_idx, value=None):
+        """Write a track volume to the mixer and its value label."""
+        track = self._get_track(track_idx)
+        # A row scrolled out of view while its value was pending is unbound;
+        # the value itself still applies
+        if track is None or (value is None and track_idx not in self.volume_vars):
+            return
+        # The scale passes its value; avoid a Tcl variable read
+        # (DoubleVar.get() already returns a float)
+        vol = float(value) if value is not None else self.volume_vars[track_idx].get()
+        if vol != vol:  # NaN
+            return
+        # Tk also calls the command for no-op moves; skip the write (and
+        # the player cache refresh it triggers) when nothing changed
+        if abs(vol - track.get("volume", 1.0)) < _MIX_EPSILON:
+            return
+        self.mixer.set_track_volume(track_idx, vol)
+        
+        # Update value label
+        self._set_value_label((track_idx, "vol"), _volume_text(vol))
     
     def _on_master_volume_change(self, value=None):
         """Handle master volume change."""
+        self._queue_mix_update("master", "volume", value)
+    
+    def _apply_master_volume(self, value=None):
+        """Write the master volume to the mixer and its value label."""
         if self.mixer is None:
             return
         try:
             if "master" in self.volume_vars:
-                vol = float(self.volume_vars["master"].get())
+                vol = float(value) if value is not None else float(self.volume_vars["master"].get())
+                if abs(vol - float(getattr(self.mixer, 'master_volume', 1.0))) < _MIX_EPSILON:
+                    return
                 if hasattr(self.mixer, 'set_master_volume'):
                     self.mixer.set_master_volume(vol)
                 else:
                     self.mixer.master_volume = vol
                 
                 # Update value label
-                if hasattr(self, 'value_labels') and ("master", "vol") in self.value_labels:
-                    self.value_labels[("master", "vol")].configure(text=f"{vol:.2f}")
+                self._set_value_label(("master", "vol"), _volume_text(vol))
         except Exception as e:
-            print(f"Error updating master volume: {e}")
+            _log.error("Error updating master volume: %s", e)
     
-    def _on_pan_change_inline(self, track_idx, value=None):
-        """Handle pan change for inline track control."""
-        if self.mixer is None or track_idx >= len(self.mixer.tracks):
+    def _apply_pan(self, track_idx, value=None):
+        """Write a track pan to the mixer and its value label."""
+        track = self._get_track(track_idx)
+        if track is None or (value is None and track_idx not in self.pan_vars):
             return
-        try:
-            if track_idx in self.pan_vars:
-                pan = float(self.pan_vars[track_idx].get())
-                pan = max(-1.0, min(1.0, pan))
-                self.mixer.tracks[track_idx]["pan"] = pan
-                
-                # Update value label (L/C/R format)
-                pan_text = "C" if abs(pan) < 0.05 else (f"L{abs(pan):.1f}" if pan < 0 else f"R{pan:.1f}")
-                if hasattr(self, 'value_labels') and (track_idx, "pan") in self.value_labels:
-                    self.value_labels[(track_idx, "pan")].configure(text=pan_text)
-        except Exception as e:
-            print(f"Error updating pan: {e}")
+        pan = float(value) if value is not None else self.pan_vars[track_idx].get()
+        if pan != pan:  # NaN
+            return
+        pan = max(-1.0, min(1.0, pan))
+        if abs(pan - track.get("pan", 0.0)) < _MIX_EPSILON:
+            return
+        self.mixer.set_track_pan(track_idx, pan)
+        
+        # Update value label (L/C/R format)
+        self._set_value_label((track_idx, "pan"), _pan_text(pan))
     
     def _on_volume_change(self, value=None):
         """Old volume change handler - no longer used with inline controls."""
@@ -510,20 +833,53 @@ class TrackControls:
         """Old pan change handler - no longer used with inline controls."""
         pass
     
+    def _set_meter_bar(self, channel, level):
+        """Resize one meter bar to a level in [0, 1]."""
+        env = self._meter_envs[channel]
+        y0 = channel * (_METER_BAR_HEIGHT + _METER_BAR_GAP)
+        self.meter_canvas.coords(
+            self._bar_R if channel else self._bar_L,
+            _METER_BAR_X, y0, _METER_BAR_X + level * env.width, y0 + _METER_BAR_HEIGHT
+        )
+    
+    def _on_meter_resize(self, event):
+        """Stretch the troughs and bars with the sidebar (the meters fill its width)."""
+        width = max(1, event.width - _METER_BAR_X)
+        canvas = self.meter_canvas
+        for ch, env in enumerate(self._meter_envs):
+            env.width = width
+            y0 = ch * (_METER_BAR_HEIGHT + _METER_BAR_GAP)
+            canvas.coords(f"trough{ch}", _METER_BAR_X, y0, _METER_BAR_X + width, y0 + _METER_BAR_HEIGHT)
+            self._set_meter_bar(ch, env.level)
+    
     def update_meters(self, player):
         """Update meter display from player."""
-        if player is None:
+        if player is None or self.meter_canvas is None:
             return
-            
+        
+        # Cap at 30 Hz: faster updates only cost repaints
+        now = time.monotonic()
+        if now - self._last_meter_update < _METER_MIN_INTERVAL:
+            return
+        self._last_meter_update = now
+        
         try:
-            peakL = float(getattr(player, "_last_peak_L", 0.0))
-            peakR = float(getattr(player, "_last_peak_R", 0.0))
-            
-            if self.meter_L is not None:
-                self.meter_L['value'] = max(0.0, min(1.0, peakL))
-            
-            if self.meter_R is not None:
-                self.meter_R['value'] = max(0.0, min(1.0, peakR))
+            # The player stores plain floats
+            pL = player._last_peak_L
+            pR = player._last_peak_R
+        except AttributeError:
+            return
+        envL, envR = self._meter_envs
+        
+        # Only move a bar when it changes by a pixel (each coords call
+        # damages the canvas)
+        try:
+            level = envL.update(pL, now)
+            if level is not None:
+                self._set_meter_bar(0, level)
+            level = envR.update(pR, now)
+            if level is not None:
+                self._set_meter_bar(1, level)
         except Exception:
             pass
     
@@ -531,23 +887,43 @@ class TrackControls:
         """Old method - no longer needed with inline controls."""
         pass
 
+    def _build_context_menus(self):
+        """Create the track and master right-click menus.
+        
+        Track menu entries act on _menu_track_idx, set when it pops up.
+        """
+        menu = tk.Menu(self.parent, tearoff=0, bg="#2d2d2d", fg="#f5f5f5", activebackground="#3b82f6")
+        menu.add_command(label="💾 Export as Audio...", command=lambda: self._export_track_audio(self._menu_track_idx))
+        menu.add_command(label="📦 Save as Template...", command=lambda: self._save_track_template(self._menu_track_idx))
+        menu.add_separator()
+        menu.add_command(label="🗑️ Delete", command=lambda: self._delete_track(self._menu_track_idx))
+        self._track_menu = menu
+        
+        menu = tk.Menu(self.parent, tearoff=0, bg="#2d2d2d", fg="#f5f5f5", activebackground="#3b82f6")
+        menu.add_command(label="💾 Export Master Audio...", command=self._export_master_audio)
+        self._master_menu = menu
+    
     def _on_track_right_click_new(self, event, track_idx):
         """Show context menu for track operations (new frame-based version)."""
         if tk is None or self.mixer is None:
             return
         
-        # Select the track first
-        self.current_track_idx = track_idx
-        self._on_select_track()
-        self._update_selection_highlight()
+        # Select the track first (nothing to do if it already is)
+        if self.current_track_idx != track_idx:
+            self.current_track_idx = track_idx
+            self._on_select_track()
+            self._schedule_selection_highlight()
         
-        # Build menu
-        menu = tk.Menu(None, tearoff=0, bg="#2d2d2d", fg="#f5f5f5", activebackground="#3b82f6")
-        track_name = self.mixer.tracks[track_idx].get("name", f"Track {track_idx + 1}")
-        menu.add_command(label=f"💾 Export '{track_name}' as Audio...", command=lambda: self._export_track_audio(track_idx))
-        menu.add_command(label=f"📦 Save '{track_name}' as Template...", command=lambda: self._save_track_template(track_idx))
-        menu.add_separator()
-        menu.add_command(label=f"🗑️ Delete '{track_name}'", command=lambda: self._delete_track(track_idx))
+        menu = self._track_menu
+        track = self._get_track(track_idx)
+        if track is None or menu is None:
+            return
+        # The menu is built once; only the labels and target track change
+        track_name = track.get("name", f"Track {track_idx + 1}")
+        self._menu_track_idx = track_idx
+        menu.entryconfigure(0, label=f"💾 Export '{track_name}' as Audio...")
+        menu.entryconfigure(1, label=f"📦 Save '{track_name}' as Template...")
+        menu.entryconfigure(3, label=f"🗑️ Delete '{track_name}'")
         
         try:
             menu.tk_popup(event.x_root, event.y_root)
@@ -559,14 +935,15 @@ class TrackControls:
         if tk is None:
             return
         
-        # Select master first
-        self.current_track_idx = -1
-        self._on_select_track()
-        self._update_selection_highlight()
+        # Select master first (nothing to do if it already is)
+        if self.current_track_idx != -1:
+            self.current_track_idx = -1
+            self._on_select_track()
+            self._schedule_selection_highlight()
         
-        # Build menu
-        menu = tk.Menu(None, tearoff=0, bg="#2d2d2d", fg="#f5f5f5", activebackground="#3b82f6")
-        menu.add_command(label="💾 Export Master Audio...", command=self._export_master_audio)
+        menu = self._master_menu
+        if menu is None:
+            return
         
         try:
             menu.tk_popup(event.x_root, event.y_root)
@@ -578,15 +955,133 @@ class TrackControls:
         # This method is no longer used with the new frame-based UI
         pass
     
+    def _get_export_engine(self):
+        """Return the AudioEngine used for exports, created on first use."""
+        engine = self._engine
+        if engine is None:
+            from src.audio.engine import AudioEngine
+            engine = AudioEngine()
+            engine.initialize()
+            self._engine = engine
+        return engine
+    
+    def _export_running(self):
+        """Tell the user and return True if an export is still in progress."""
+        future = self._export_future
+        if future is None or future.done():
+            return False
+        messagebox.showinfo("Export", "Another export is still running.")
+        return True
+    
+    def _playing_tracks(self, indices):
+        """Return the tracks among indices that mute/solo let play.
+        
+        Read on the Tk thread, so a running export isn't affected by mute
+        or solo changes made while it renders.
+        """
+        should_play = getattr(self.mixer, 'should_play_track', None)
+        if should_play is None:
+            return list(indices)
+        return [i for i in indices if should_play(i)]
+    
+    def _export_sources(self):
+        """Snapshot the timeline and the project's track list for a worker-thread render.
+        
+        Moving, trimming or deleting clips, or adding and deleting tracks,
+        while an export runs then can't shift what the worker renders
+        against the snapshotted track indices, volumes and mute/solo state.
+        The Track objects and their effect instances are shared, not
+        copied: effect edits made meanwhile can still reach the render.
+        
+        Returns:
+            (timeline, project) to pass to _render_export_chunks
+        """
+        timeline = self.timeline.snapshot()
+        project = self.project
+        if project is not None and hasattr(project, 'tracks'):
+            # The engine only reads project.tracks (per-track effects)
+            project = SimpleNamespace(tracks=list(project.tracks))
+        return timeline, project
+    
+    def _run_export(self, write_file, on_done, on_error):
+        """Render and write an export on a worker thread.
+        
+        The sidebar shows a busy cursor meanwhile; on_done() or
+        on_error(exception) is called on the Tk thread when it finishes.
+        write_file must only read snapshots (see _export_sources).
+        """
+        pool = self._export_pool
+        if pool is None:
+            pool = self._export_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="export"
+            )
+            self._export_results = TkResultQueue(self.parent)
+        parent = self.parent
+        try:
+            parent.configure(cursor="watch")
+        except Exception:
+            pass
+        
+        def _deliver(future):
+            self._export_future = None
+            try:
+                parent.configure(cursor="")
+            except Exception:
+                pass
+            try:
+                future.result()
+            except Exception as e:
+                on_error(e)
+                return
+            on_done()
+        
+        self._export_future = self._export_results.submit(pool, write_file, _deliver)
+    
+    @staticmethod
+    def _render_export_chunks(engine, timeline, duration, sample_rate, gain=1.0, **render_kwargs):
+        """Render [0, duration) in consecutive windows of _EXPORT_CHUNK_SECONDS.
+        
+        Yields each window's mono buffer, so exports can be written while
+        rendering instead of holding the whole mix. Effects keep their
+        state between calls, so delay/reverb tails carry across windows.
+        
+        Args:
+            engine: Initialized AudioEngine
+            timeline: Timeline to render
+            duration: Length to render in seconds
+            sample_rate: Sample rate in Hz
+            gain: Gain applied to every sample (clamped to [-1, 1])
+            **render_kwargs: Passed to AudioEngine.render_window
+        """
+        total = int(duration * sample_rate)
+        step = max(1, int(_EXPORT_CHUNK_SECONDS * sample_rate))
+        for start in range(0, total, step):
+            count = min(step, total - start)
+            buffer = engine.render_window(
+                timeline,
+                start_time=start / sample_rate,
+                duration=count / sample_rate,
+                sample_rate=sample_rate,
+                **render_kwargs
+            )
+            if gain != 1.0:
+                if np is not None:
+                    # The rendered window is a fresh buffer: scale in place
+                    buffer = np.asarray(buffer, dtype=np.float32)
+                    np.multiply(buffer, gain, out=buffer)
+                    np.clip(buffer, -1.0, 1.0, out=buffer)
+                else:
+                    buffer = [max(-1.0, min(1.0, s * gain)) for s in buffer]
+            yield buffer
+    
     def _export_track_audio(self, track_idx):
         """Export audio from a single track."""
-        if self.mixer is None or track_idx >= len(self.mixer.tracks):
+        track = self._get_track(track_idx)
+        if track is None or self._export_running():
             return
         
         try:
-            from tkinter import filedialog, messagebox
-            
-            track_name = self.mixer.tracks[track_idx].get("name", f"Track {track_idx + 1}")
+            track_name = track.get("name", f"Track {track_idx + 1}")
             
             # Ask user for file path
             file_path = filedialog.asksaveasfilename(
@@ -602,7 +1097,7 @@ class TrackControls:
             if not file_path:
                 return
             
-            print(f"🎵 Exporting track {track_idx} ('{track_name}') to {file_path}...")
+            _log.debug("Exporting track %d ('%s') to %s", track_idx, track_name, file_path)
             
             # Get the timeline
             timeline = self.timeline
@@ -611,70 +1106,73 @@ class TrackControls:
                 return
             
             # Find the extent of clips in this track
-            clips = list(timeline.get_clips_for_track(track_idx))
-            if not clips:
+            if not timeline.count_clips_for_track(track_idx):
                 messagebox.showwarning("Export Warning", f"Track '{track_name}' has no clips to export.")
                 return
             
-            max_end = max(clip.end_time for clip in clips)
-            duration = max_end
+            duration = timeline.get_track_end_time(track_idx)
             
             # Get track volume
-            track_volume = self.mixer.tracks[track_idx].get("volume", 1.0)
+            track_volume = track.get("volume", 1.0)
             track_volumes = {track_idx: track_volume}
             
             # Render the audio using AudioEngine
-            from src.audio.engine import AudioEngine
-            engine = AudioEngine()
-            engine.initialize()
+            engine = self._get_export_engine()
             
             sample_rate = 44100
-            audio_buffer = engine.render_window(
-                timeline,
-                start_time=0.0,
-                duration=duration,
-                sample_rate=sample_rate,
-                track_volumes=track_volumes,
-                solo_tracks=[track_idx],  # Solo this track
-                mixer=self.mixer,  # Pass mixer for mute/solo state
-                project=self.project  # Apply per-track effects if any
-            )
-            
-            if not audio_buffer or len(audio_buffer) == 0:
+            if int(duration * sample_rate) <= 0:
                 messagebox.showwarning("Export Warning", "No audio data to export.")
                 return
+            # Solo this track, unless mute/solo silence it (snapshot of
+            # the mixer state: the render runs on a worker thread)
+            solo_tracks = self._playing_tracks([track_idx])
+            # Render copies: the user may keep editing meanwhile
+            timeline, project = self._export_sources()
+            from src.utils.audio_io import save_audio_chunks
             
-            # Save to WAV file
-            from src.utils.audio_io import save_audio_file
-            save_audio_file(audio_buffer, file_path, sample_rate, format="wav")
+            def _write():
+                chunks = self._render_export_chunks(
+                    engine,
+                    timeline,
+                    duration,
+                    sample_rate,
+                    track_volumes=track_volumes,
+                    solo_tracks=solo_tracks,
+                    project=project
+                )
+                # Save to WAV file
+                save_audio_chunks(chunks, file_path, sample_rate, format="wav")
             
-            # Success message
-            import os
-            file_size = os.path.getsize(file_path) / 1024  # KB
-            messagebox.showinfo(
-                "Export Complete",
-                f"Track '{track_name}' exported successfully!\n\n"
-                f"File: {os.path.basename(file_path)}\n"
-                f"Duration: {duration:.2f}s\n"
-                f"Size: {file_size:.1f} KB"
-            )
+            def _done():
+                # Success message
+                file_size = os.path.getsize(file_path) / 1024  # KB
+                messagebox.showinfo(
+                    "Export Complete",
+                    f"Track '{track_name}' exported successfully!\n\n"
+                    f"File: {os.path.basename(file_path)}\n"
+                    f"Duration: {duration:.2f}s\n"
+                    f"Size: {file_size:.1f} KB"
+                )
+                _log.debug("Track exported: %s (%.1f KB)", file_path, file_size)
             
-            print(f"✓ Track exported: {file_path} ({file_size:.1f} KB)")
+            self._run_export(_write, _done, self._on_track_export_error)
             
         except Exception as e:
-            print(f"✗ Export error: {e}")
-            import traceback
-            traceback.print_exc()
-            try:
-                from tkinter import messagebox
-                messagebox.showerror("Export Error", f"Failed to export track:\n\n{str(e)}")
-            except:
-                pass
+            self._on_track_export_error(e)
+    
+    def _on_track_export_error(self, e):
+        """Report a failed track export."""
+        _log.error("Export error: %s", e, exc_info=e)
+        try:
+            messagebox.showerror("Export Error", f"Failed to export track:\n\n{str(e)}")
+        except Exception:
+            pass
 
     def _export_master_audio(self):
         """Export the full master mix as WAV."""
+        if self._export_running():
+            return
         try:
-            from tkinter import filedialog, messagebox
             track_name = "Master"
             file_path = filedialog.asksaveasfilename(
                 title=f"Export {track_name} Audio",
@@ -691,64 +1189,68 @@ class TrackControls:
                 return
 
             # Determine end time across all clips
-            max_end = 0.0
-            for _, clip in timeline.all_placements():
-                if hasattr(clip, 'end_time'):
-                    max_end = max(max_end, clip.end_time)
+            max_end = timeline.get_end_time()
             if max_end <= 0:
                 messagebox.showwarning("Export Warning", "No clips to export.")
                 return
 
-            from src.audio.engine import AudioEngine
-            engine = AudioEngine()
-            engine.initialize()
+            engine = self._get_export_engine()
             sample_rate = 44100
-            # No solo_tracks -> full mix
-            audio_buffer = engine.render_window(
-                timeline,
-                start_time=0.0,
-                duration=max_end,
-                sample_rate=sample_rate,
-                track_volumes={i: t.get("volume", 1.0) for i, t in enumerate(self.mixer.tracks)},
-                mixer=self.mixer,  # Pass mixer for mute/solo state
-                project=self.project  # Apply per-track effects if any
-            )
+            if int(max_end * sample_rate) <= 0:
+                messagebox.showwarning("Export Warning", "No audio data to export.")
+                return
             # Apply mixer master volume if present
             try:
                 mv = float(getattr(self.mixer, 'master_volume', 1.0))
-                if mv != 1.0:
-                    audio_buffer = [max(-1.0, min(1.0, s * mv)) for s in audio_buffer]
             except Exception:
-                pass
-            if not audio_buffer:
-                messagebox.showwarning("Export Warning", "No audio data to export.")
-                return
+                mv = 1.0
+            # Full mix of the tracks mute/solo let play; volumes and
+            # mute/solo are snapshotted since the render runs on a worker
+            tracks = self.mixer.tracks
+            track_volumes = {i: t.get("volume", 1.0) for i, t in enumerate(tracks)}
+            solo_tracks = self._playing_tracks(range(len(tracks)))
+            # Render copies: the user may keep editing meanwhile
+            timeline, project = self._export_sources()
+            from src.utils.audio_io import save_audio_chunks
+
+            def _write():
+                chunks = self._render_export_chunks(
+                    engine,
+                    timeline,
+                    max_end,
+                    sample_rate,
+                    gain=mv,
+                    track_volumes=track_volumes,
+                    solo_tracks=solo_tracks,
+                    project=project
+                )
+                save_audio_chunks(chunks, file_path, sample_rate, format="wav")
 
-            from src.utils.audio_io import save_audio_file
-            save_audio_file(audio_buffer, file_path, sample_rate, format="wav")
+            def _done():
+                size_kb = os.path.getsize(file_path) / 1024
+                messagebox.showinfo("Export Complete", f"Master exported to {os.path.basename(file_path)}\nSize: {size_kb:.1f} KB")
+                _log.debug("Master exported: %s", file_path)
 
-            import os
-            size_kb = os.path.getsize(file_path) / 1024
-            messagebox.showinfo("Export Complete", f"Master exported to {os.path.basename(file_path)}\nSize: {size_kb:.1f} KB")
-            print(f"✓ Master exported: {file_path}")
+            self._run_export(_write, _done, self._on_master_export_error)
         except Exception as e:
-            print(f"✗ Export master error: {e}")
-            try:
-                from tkinter import messagebox
-                messagebox.showerror("Export Error", f"Failed to export master:\n\n{e}")
-            except Exception:
-                pass
+            self._on_master_export_error(e)
+    
+    def _on_master_export_error(self, e):
+        """Report a failed master export."""
+        _log.error("Export master error: %s", e)
+        try:
+            messagebox.showerror("Export Error", f"Failed to export master:\n\n{e}")
+        except Exception:
+            pass
     
     def _save_track_template(self, track_idx):
         """Save track configuration and clips as a template."""
-        if self.mixer is None or track_idx >= len(self.mixer.tracks):
+        track = self._get_track(track_idx)
+        if track is None:
             return
         
         try:
-            from tkinter import filedialog, messagebox
-            import json
-            
-            track_name = self.mixer.tracks[track_idx].get("name", f"Track {track_idx + 1}")
+            track_name = track.get("name", f"Track {track_idx + 1}")
             
             # Ask user for file path
             file_path = filedialog.asksaveasfilename(
@@ -764,7 +1266,7 @@ class TrackControls:
             if not file_path:
                 return
             
-            print(f"📦 Saving track {track_idx} ('{track_name}') template to {file_path}...")
+            _log.debug("Saving track %d ('%s') template to %s", track_idx, track_name, file_path)
             
             # Get timeline
             timeline = self.timeline
@@ -775,33 +1277,26 @@ class TrackControls:
             # Collect track data
             track_data = {
                 "name": track_name,
-                "color": self.mixer.tracks[track_idx].get("color", "#3b82f6"),
-                "volume": self.mixer.tracks[track_idx].get("volume", 1.0),
-                "pan": self.mixer.tracks[track_idx].get("pan", 0.0),
+                "color": track.get("color", "#3b82f6"),
+                "volume": track.get("volume", 1.0),
+                "pan": track.get("pan", 0.0),
                 "clips": []
             }
             
             # Collect clips
-            clips = list(timeline.get_clips_for_track(track_idx))
+            clips = timeline.get_clips_for_track(track_idx)
+            clip_list = track_data["clips"]
             for clip in clips:
-                clip_data = {
-                    "name": clip.name,
-                    "start_time": clip.start_time,
-                    "duration": clip.duration,
-                    "file_path": getattr(clip, 'file_path', None),
-                    "color": getattr(clip, 'color', None),
-                    "volume": getattr(clip, 'volume', 1.0),
-                    "pitch_semitones": getattr(clip, 'pitch_semitones', 0.0),
-                    "fade_in": getattr(clip, 'fade_in', 0.0),
-                    "fade_out": getattr(clip, 'fade_out', 0.0),
-                    "start_offset": getattr(clip, 'start_offset', 0.0),
-                    "end_offset": getattr(clip, 'end_offset', 0.0),
-                }
-                track_data["clips"].append(clip_data)
+                try:
+                    values = _TEMPLATE_CLIP_ATTRS(clip)
+                except AttributeError:
+                    # Clips without the audio editing parameters (e.g. MIDI)
+                    values = [getattr(clip, key, default) for key, default in _TEMPLATE_CLIP_FIELDS]
+                clip_list.append(dict(zip(_TEMPLATE_CLIP_KEYS, values)))
             
             # Save to JSON file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(track_data, f, indent=2)
+            from src.utils.project_serializer import write_json
+            write_json(file_path, track_data)
             
             # Success message
             messagebox.showinfo(
@@ -812,15 +1307,13 @@ class TrackControls:
                 f"File: {file_path}"
             )
             
-            print(f"✓ Track template saved: {file_path}")
+            _log.debug("Track template saved: %s", file_path)
             
         except Exception as e:
-            print(f"✗ Delete track error: {e}")
-            import traceback
+            _log.error("Save track template error: %s", e)
             traceback.print_exc()
             try:
-                from tkinter import messagebox
-                messagebox.showerror("Delete Error", f"Failed to delete track:\n\n{str(e)}")
+                messagebox.showerror("Save Error", f"Failed to save track template:\n\n{str(e)}")
             except:
                 pass
     
@@ -833,15 +1326,15 @@ class TrackControls:
         
         try:
             is_muted = self.mixer.toggle_mute(idx)
-            track_name = self.mixer.tracks[idx].get("name", f"Track {idx + 1}")
-            
-            print(f"🔇 Muted: {track_name}" if is_muted else f"🔊 Unmuted: {track_name}")
+            if _log.isEnabledFor(logging.DEBUG):
+                track_name = self.mixer.tracks[idx].get("name", f"Track {idx + 1}")
+                _log.debug("%s: %s", "Muted" if is_muted else "Unmuted", track_name)
             
             # Update button appearance
             if idx in self.mute_buttons:
-                self.mute_buttons[idx].configure(bg="#dc2626" if is_muted else "#404040")
+                self.mute_buttons[idx].configure(style="Mute.On.TButton" if is_muted else "Mute.Off.TButton")
         except Exception as e:
-            print(f"Error toggling mute: {e}")
+            _log.error("Error toggling mute: %s", e)
     
     def _toggle_solo(self, idx=None):
         """Toggle solo for a track (current selection if idx is None)."""
@@ -852,15 +1345,15 @@ class TrackControls:
         
         try:
             is_soloed = self.mixer.toggle_solo(idx)
-            track_name = self.mixer.tracks[idx].get("name", f"Track {idx + 1}")
-            
-            print(f"🎯 Soloed: {track_name}" if is_soloed else f"▶ Unsoloed: {track_name}")
+            if _log.isEnabledFor(logging.DEBUG):
+                track_name = self.mixer.tracks[idx].get("name", f"Track {idx + 1}")
+                _log.debug("%s: %s", "Soloed" if is_soloed else "Unsoloed", track_name)
             
             # Update button appearance
             if idx in self.solo_buttons:
-                self.solo_buttons[idx].configure(bg="#eab308" if is_soloed else "#404040")
+                self.solo_buttons[idx].configure(style="Solo.On.TButton" if is_soloed else "Solo.Off.TButton")
         except Exception as e:
-            print(f"Error toggling solo: {e}")
+            _log.error("Error toggling solo: %s", e)
     
     def _update_track_indicators(self):
         """Update track visual indicators - not needed with button-based UI."""
@@ -876,13 +1369,12 @@ class TrackControls:
     
     def _delete_track(self, track_idx):
         """Delete a track from the project."""
-        if self.mixer is None or track_idx >= len(self.mixer.tracks):
+        track = self._get_track(track_idx)
+        if track is None:
             return
         
         try:
-            from tkinter import messagebox
-            
-            track_name = self.mixer.tracks[track_idx].get("name", f"Track {track_idx + 1}")
+            track_name = track.get("name", f"Track {track_idx + 1}")
             
             # Confirm deletion
             result = messagebox.askyesno(
@@ -894,42 +1386,26 @@ class TrackControls:
             if not result:
                 return
             
-            print(f"🗑️ Deleting track {track_idx} ('{track_name}')...")
+            _log.debug("Deleting track %d ('%s')", track_idx, track_name)
             
             # Get timeline
             timeline = self.timeline
             if timeline:
-                # Rebuild the placements list:
-                # 1. Remove all clips from the deleted track
-                # 2. Shift down track indices for tracks after the deleted one
-                new_placements = []
-                removed_count = 0
-                
-                for ti, clip in timeline._placements:
-                    if ti == track_idx:
-                        # Skip clips from the deleted track
-                        removed_count += 1
-                        continue
-                    elif ti > track_idx:
-                        # Shift track index down by 1 for tracks after the deleted one
-                        new_placements.append((ti - 1, clip))
-                    else:
-                        # Keep clips from tracks before the deleted one
-                        new_placements.append((ti, clip))
-                
-                timeline._placements = new_placements
-                print(f"  Removed {removed_count} clips from track {track_idx}")
-                print(f"  Remaining clips: {len(new_placements)}")
+                # Drop the track's clip bucket; tracks after the deleted one
+                # shift down by one
+                removed_count = timeline.count_clips_for_track(track_idx)
+                timeline.remove_track(track_idx)
+                _log.debug("Removed %d clips from track %d", removed_count, track_idx)
             
             # Get project and remove track from project.tracks as well
             project = self.project
             if project and track_idx < len(project.tracks):
                 project.tracks.pop(track_idx)
-                print(f"  Removed track from project.tracks")
+                _log.debug("Removed track from project.tracks")
             
             # Remove from mixer
             self.mixer.tracks.pop(track_idx)
-            print(f"  Removed track from mixer")
+            _log.debug("Removed track from mixer")
             
             # Repopulate track list
             self.populate_tracks(timeline)
@@ -941,20 +1417,20 @@ class TrackControls:
                 except Exception:
                     pass
             
-            print(f"✓ Track '{track_name}' deleted successfully")
+            _log.debug("Track '%s' deleted", track_name)
             
         except Exception as e:
-            print(f"✗ Delete track error: {e}")
-            import traceback
+            _log.error("Delete track error: %s", e)
             traceback.print_exc()
     
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling in sidebar."""
         if self.canvas:
-            # Only scroll if content height exceeds canvas height
+            # Only scroll if content height exceeds canvas height (hidden
+            # pooled rows would distort bbox("all"))
             try:
-                bbox = self.canvas.bbox("all") or (0, 0, 0, 0)
-                content_h = max(0, bbox[3] - bbox[1])
+                region = self._scrollregion or (0, 0, 0, 0)
+                content_h = region[3]
                 ch = max(1, self.canvas.winfo_height())
                 if content_h <= ch + 1:
                     return
@@ -964,10 +1440,10 @@ class TrackControls:
             self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
     
     def _on_canvas_configure(self, event):
-        """Update the canvas window width when canvas is resized."""
-        if self.canvas and self.canvas_window:
-            canvas_width = event.width
-            self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+        """Fit the track rows to the canvas width; a taller canvas shows more rows."""
+        if self.canvas:
+            self.canvas.itemconfigure("track_row", width=max(1, event.width - 2 * _ROW_PAD_X))
+            self._schedule_row_layout()
 
     def _open_effects_dialog(self, track_idx):
         """Open effects chain dialog for the given track."""
@@ -981,6 +1457,5 @@ class TrackControls:
             from .dialogs.effects_chain_dialog import EffectsChainDialog
             EffectsChainDialog(self.parent, track, track_name, redraw_cb=self._redraw_cb)
         except Exception as e:
-            print(f"Error opening effects dialog: {e}")
-            import traceback
+            _log.error("Error opening effects dialog: %s", e)
             traceback.print_exc()
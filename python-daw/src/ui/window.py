@@ -1,5 +1,8 @@
 """Main window for the Digital Audio Workstation - Refactored OOP version."""
 
+import concurrent.futures
+import time
+
 try:
     import tkinter as tk
     from tkinter import ttk, messagebox, filedialog
@@ -17,6 +20,10 @@ from .project_manager import ProjectManager
 from .track_clip_manager import TrackClipManager
 from .context_menus import ClipContextMenu, TrackContextMenu
 from .transport_controller import TransportController
+from .peak_meter import PeakMeterEnvelope
+from .worker_results import TkResultQueue
+
+_METER_LENGTH = 60  # output meter width in pixels
 
 
 class MainWindow:
@@ -51,11 +58,20 @@ class MainWindow:
         self._master_vol_label = None
         self._meter_L = None
         self._meter_R = None
+        # Envelope followers deciding when the meter bars need a redraw
+        self._meter_envs = (PeakMeterEnvelope(_METER_LENGTH), PeakMeterEnvelope(_METER_LENGTH))
         
         # Update jobs
         self._time_job = None
         self._meter_job = None
         
+        # Worker threads for audio file decoding (results are marshalled
+        # back to the Tk thread with root.after)
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="audio-io"
+        )
+        self._worker_results = None  # TkResultQueue, created with the root
+        
         
         # Project manager (handles new/open/save/export)
         self._project_manager = None
@@ -78,6 +94,7 @@ class MainWindow:
             return
 
         self._root.title(self.title)
+        self._worker_results = TkResultQueue(self._root)
         self._root.geometry("1200x700")
         self._root.configure(bg="#1e1e1e")
 
@@ -271,14 +288,14 @@ class MainWindow:
         ttk.Label(master_frame, text="L", style="Status.TLabel", width=2).pack(side="right", padx=(12, 2))
         self._meter_L = ttk.Progressbar(
             master_frame, mode="determinate", maximum=1.0,
-            style="Meter.Horizontal.TProgressbar", length=60
+            style="Meter.Horizontal.TProgressbar", length=_METER_LENGTH
         )
         self._meter_L.pack(side="right", padx=2)
         
         ttk.Label(master_frame, text="R", style="Status.TLabel", width=2).pack(side="right", padx=(8, 2))
         self._meter_R = ttk.Progressbar(
             master_frame, mode="determinate", maximum=1.0,
-            style="Meter.Horizontal.TProgressbar", length=60
+            style="Meter.Horizontal.TProgressbar", length=_METER_LENGTH
         )
         self._meter_R.pack(side="right", padx=2)
     
@@ -442,13 +459,24 @@ class MainWindow:
             return
         
         # Update master meters
-        if self.player and hasattr(self, '_meter_L') and hasattr(self, '_meter_R'):
+        player = self.player
+        mL, mR = self._meter_L, self._meter_R
+        if player and mL is not None and mR is not None:
             try:
-                peakL = float(getattr(self.player, "_last_peak_L", 0.0))
-                peakR = float(getattr(self.player, "_last_peak_R", 0.0))
+                # The player stores plain floats
+                pL = player._last_peak_L
+                pR = player._last_peak_R
+                envL, envR = self._meter_envs
+                now = time.monotonic()
                 
-                self._meter_L['value'] = max(0.0, min(1.0, peakL))
-                self._meter_R['value'] = max(0.0, min(1.0, peakR))
+                # Each write schedules a repaint; only write when the bar
+                # moves by a pixel (never while stopped and fully decayed)
+                level = envL.update(pL, now)
+                if level is not None:
+                    mL['value'] = level
+                level = envR.update(pR, now)
+                if level is not None:
+                    mR['value'] = level
             except Exception:
                 pass
         
@@ -647,6 +675,7 @@ class MainWindow:
     def close(self):
         """Close the window."""
         self.is_open = False
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
         if self._root is not None:
             try:
                 self._root.destroy()
@@ -0,0 +1,75 @@
+"""Delivery of worker-thread results to the Tk thread."""
+
+import logging
+import queue
+
+_log = logging.getLogger(__name__)
+
+# Delay between checks of the result queue while work is outstanding
+POLL_INTERVAL_MS = 50
+
+
+class TkResultQueue:
+    """Run callables on an executor and hand their futures to the Tk thread.
+
+    Tk may only be called from the thread running its mainloop, so worker
+    threads never touch it: a finished future is put on a queue.Queue,
+    which the Tk thread drains with ``after`` while submitted work is
+    outstanding (no polling when idle).
+    """
+
+    def __init__(self, root, interval_ms: int = POLL_INTERVAL_MS):
+        """
+        Args:
+            root: Any Tk widget; its ``after`` schedules the polling
+            interval_ms: Delay between queue checks
+        """
+        self._root = root
+        self._interval_ms = interval_ms
+        self._results = queue.Queue()
+        self._pending = 0
+        self._poll_id = None
+
+    def submit(self, executor, fn, on_done, *args):
+        """Run fn(*args) on executor and call on_done(future) on the Tk thread.
+
+        Must be called from the Tk thread.
+
+        Args:
+            executor: concurrent.futures executor running fn
+            fn: Callable run on a worker thread
+            on_done: Callback receiving the finished future
+            *args: Arguments for fn
+
+        Returns:
+            The submitted future
+        """
+        future = executor.submit(fn, *args)
+        self._pending += 1
+        results = self._results
+        future.add_done_callback(lambda f: results.put((on_done, f)))
+        if self._poll_id is None:
+            self._schedule_poll()
+        return future
+
+    def _schedule_poll(self):
+        try:
+            self._poll_id = self._root.after(self._interval_ms, self._poll)
+        except Exception:
+            self._poll_id = None  # Window closed
+
+    def _poll(self):
+        """Deliver finished futures; keep polling while work is outstanding."""
+        self._poll_id = None
+        while True:
+            try:
+                on_done, future = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            try:
+                on_done(future)
+            except Exception:
+                _log.exception("Worker result callback failed")
+        if self._pending > 0:
+            self._schedule_poll()
@@ -1,7 +1,9 @@
 """Audio I/O utilities for loading and saving audio files."""
 
+import functools
 import os
-from typing import Tuple, List, Optional
+from math import gcd
+from typing import Iterable, Optional, Sequence, Tuple
 
 try:
     import soundfile as sf
@@ -12,16 +14,28 @@ except ImportError:
     sf = None
     np = None
 
+try:
+    from scipy.signal import resample_poly
+except ImportError:
+    resample_poly = None
+
 try:
     from pydub import AudioSegment
+    from pydub.utils import mediainfo
     PYDUB_AVAILABLE = True
 except ImportError:
     PYDUB_AVAILABLE = False
     AudioSegment = None
+    mediainfo = None
+
 
+@functools.lru_cache(maxsize=1)
+def get_supported_formats() -> Tuple[Tuple[str, str], ...]:
+    """Return supported audio formats as (description, extension) tuples.
 
-def get_supported_formats() -> List[Tuple[str, str]]:
-    """Return list of supported audio formats as (description, extension) tuples."""
+    The available backends are fixed at import time, so the result is
+    computed once; it is a tuple so callers can't modify the shared value.
+    """
     formats = []
     
     if SOUNDFILE_AVAILABLE:
@@ -45,10 +59,10 @@ def get_supported_formats() -> List[Tuple[str, str]]:
     formats.append(("All audio files", "*.wav;*.mp3;*.flac;*.ogg;*.aac;*.m4a"))
     formats.append(("All files", "*.*"))
     
-    return formats
+    return tuple(formats)
 
 
-def load_audio_file(file_path: str, target_sr: Optional[int] = None) -> Tuple[List[float], int]:
+def load_audio_file(file_path: str, target_sr: Optional[int] = None) -> Tuple["np.ndarray", int]:
     """Load audio file and return (mono_buffer, sample_rate).
     
     Args:
@@ -56,7 +70,7 @@ def load_audio_file(file_path: str, target_sr: Optional[int] = None) -> Tuple[Li
         target_sr: Target sample rate (None = keep original)
         
     Returns:
-        Tuple of (mono buffer as list, sample_rate as int)
+        Tuple of (mono float32 numpy buffer, sample_rate as int)
         
     Raises:
         FileNotFoundError: If file doesn't exist
@@ -71,19 +85,24 @@ def load_audio_file(file_path: str, target_sr: Optional[int] = None) -> Tuple[Li
     # Try soundfile first (better for WAV, FLAC, OGG)
     if SOUNDFILE_AVAILABLE and ext in ['.wav', '.flac', '.ogg']:
         try:
-            data, sr = sf.read(file_path)
+            with sf.SoundFile(file_path) as f:
+                sr = f.samplerate
+                # Same-rate files (most WAV stems) skip the resampler, so
+                # decode them straight to float32; resampling keeps float64
+                same_rate = target_sr is None or target_sr == sr
+                data = f.read(dtype="float32" if same_rate else "float64", always_2d=False)
             
             # Convert to mono if stereo
             if len(data.shape) > 1:
-                data = np.mean(data, axis=1)
+                data = np.mean(data, axis=1, dtype=data.dtype)
             
             # Resample if needed
-            if target_sr is not None and target_sr != sr:
+            if not same_rate:
                 data = _resample_numpy(data, sr, target_sr)
                 sr = target_sr
             
-            # Convert to list and ensure float range [-1, 1]
-            buffer = data.tolist()
+            # Keep samples as float32: half the memory of float64/lists
+            buffer = np.asarray(data, dtype=np.float32)
             return buffer, int(sr)
         except Exception as e:
             raise ValueError(f"Failed to load {file_path} with soundfile: {str(e)}")
@@ -116,8 +135,7 @@ def load_audio_file(file_path: str, target_sr: Optional[int] = None) -> Tuple[Li
             else:
                 samples = samples.astype(np.float32)
             
-            buffer = samples.tolist()
-            return buffer, int(sr)
+            return samples, int(sr)
         except Exception as e:
             raise ValueError(f"Failed to load {file_path} with pydub: {str(e)}")
     
@@ -131,10 +149,20 @@ def load_audio_file(file_path: str, target_sr: Optional[int] = None) -> Tuple[Li
 
 
 def _resample_numpy(data, orig_sr: int, target_sr: int):
-    """Simple resampling using numpy (linear interpolation)."""
+    """Resample with a polyphase filter (scipy), or linear interpolation."""
     if not SOUNDFILE_AVAILABLE or np is None:
         return data
     
+    orig_sr = int(orig_sr)
+    target_sr = int(target_sr)
+    if orig_sr == target_sr:
+        return data
+    
+    if resample_poly is not None:
+        # Polyphase FIR: linear time, e.g. 48000 -> 44100 is up=147, down=160
+        g = gcd(orig_sr, target_sr)
+        return resample_poly(data, target_sr // g, orig_sr // g, window=("kaiser", 8.6))
+    
     orig_len = len(data)
     target_len = int(orig_len * target_sr / orig_sr)
     
@@ -146,17 +174,18 @@ def _resample_numpy(data, orig_sr: int, target_sr: int):
     return resampled
 
 
-def save_audio_file(buffer: List[float], file_path: str, sample_rate: int = 44100, format: str = "wav"):
+def save_audio_file(buffer: Sequence[float], file_path: str, sample_rate: int = 44100, format: str = "wav"):
     """Save audio buffer to file.
     
     Args:
-        buffer: Mono audio buffer (list of floats in [-1, 1])
+        buffer: Mono audio buffer (list or numpy array of floats in [-1, 1];
+            float32 arrays are written without a copy)
         file_path: Output file path
         sample_rate: Sample rate in Hz
         format: Output format ('wav', 'flac', 'ogg', 'mp3')
     """
     if SOUNDFILE_AVAILABLE and format in ['wav', 'flac', 'ogg']:
-        data = np.array(buffer, dtype=np.float32)
+        data = np.asarray(buffer, dtype=np.float32)
         sf.write(file_path, data, sample_rate, format=format)
         return
     
@@ -178,15 +207,54 @@ def save_audio_file(buffer: List[float], file_path: str, sample_rate: int = 4410
     raise ImportError("No audio library available for saving files.")
 
 
+def save_audio_chunks(chunks: Iterable[Sequence[float]], file_path: str, sample_rate: int = 44100, format: str = "wav"):
+    """Save audio rendered in consecutive chunks.
+    
+    With soundfile each chunk is written as it arrives, so the whole
+    render never has to be in memory; otherwise the chunks are joined
+    and passed to save_audio_file.
+    
+    Args:
+        chunks: Iterable of mono buffers (floats in [-1, 1]), in order
+        file_path: Output file path
+        sample_rate: Sample rate in Hz
+        format: Output format ('wav', 'flac', 'ogg', 'mp3')
+    """
+    if SOUNDFILE_AVAILABLE and format in ['wav', 'flac', 'ogg']:
+        with sf.SoundFile(file_path, "w", samplerate=sample_rate, channels=1, format=format) as f:
+            for chunk in chunks:
+                f.write(np.asarray(chunk, dtype=np.float32))
+        return
+    
+    if np is not None:
+        parts = [np.asarray(chunk, dtype=np.float32) for chunk in chunks]
+        buffer = np.concatenate(parts) if parts else np.zeros(0, dtype=np.float32)
+    else:
+        buffer = []
+        for chunk in chunks:
+            buffer.extend(chunk)
+    save_audio_file(buffer, file_path, sample_rate, format=format)
+
+
 def get_audio_info(file_path: str) -> dict:
     """Get information about an audio file without loading it.
     
+    Only the file header is read (soundfile, or ffprobe through pydub);
+    results are cached per (path, modification time).
+    
     Returns:
         Dictionary with keys: duration, sample_rate, channels, format
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file {file_path} does not exist.")
     
+    real_path = os.path.realpath(file_path)
+    return dict(_read_audio_info(real_path, os.stat(real_path).st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=256)
+def _read_audio_info(file_path: str, mtime_ns: int) -> dict:
+    """Read audio header info (cached; mtime_ns only keys the cache)."""
     if SOUNDFILE_AVAILABLE:
         try:
             info = sf.info(file_path)
@@ -201,6 +269,18 @@ def get_audio_info(file_path: str) -> dict:
             pass
     
     if PYDUB_AVAILABLE:
+        # ffprobe reads the container metadata; no decode
+        try:
+            info = mediainfo(file_path)
+            return {
+                'duration': float(info['duration']),
+                'sample_rate': int(info['sample_rate']),
+                'channels': int(info['channels']),
+                'format': os.path.splitext(file_path)[1][1:].upper(),
+            }
+        except Exception:
+            pass
+        
         try:
             audio = AudioSegment.from_file(file_path)
             return {
@@ -216,4 +296,4 @@ def get_audio_info(file_path: str) -> dict:
     return {
         'size': os.path.getsize(file_path),
         'format': os.path.splitext(file_path)[1][1:].upper(),
-    }
\ No newline at end of file
+    }
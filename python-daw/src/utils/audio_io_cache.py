@@ -0,0 +1,73 @@
+"""In-memory LRU cache of decoded audio files."""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+
+from .audio_io import load_audio_file
+
+# Total size budget for cached buffers
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+# Estimate for buffers without .nbytes (Python lists): list slot + boxed float
+_BYTES_PER_SAMPLE = 32
+
+# {(real_path, mtime_ns, target_sr): (buffer, sample_rate, size_bytes)}
+_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_cache_bytes = 0
+_lock = threading.Lock()  # Imports decode on worker threads
+
+
+def cached_load_audio_file(file_path: str, target_sr: Optional[int] = None) -> Tuple[Sequence[float], int]:
+    """Load an audio file, reusing the decoded buffer of earlier loads.
+
+    Entries are keyed by real path, modification time and target sample
+    rate, so an edited file is decoded again. The returned buffer is
+    shared between callers and must not be modified in place.
+
+    Args:
+        file_path: Path to audio file
+        target_sr: Target sample rate (None = keep original)
+
+    Returns:
+        Tuple of (mono float32 numpy buffer, sample_rate as int)
+
+    Raises:
+        Same exceptions as load_audio_file
+    """
+    global _cache_bytes
+
+    real_path = os.path.realpath(file_path)
+    try:
+        key = (real_path, os.stat(real_path).st_mtime_ns, target_sr)
+    except OSError:
+        # Missing/unreadable file: let load_audio_file raise the usual error
+        return load_audio_file(file_path, target_sr=target_sr)
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            _cache.move_to_end(key)
+            return entry[0], entry[1]
+
+    buffer, sr = load_audio_file(file_path, target_sr=target_sr)
+    size = getattr(buffer, "nbytes", len(buffer) * _BYTES_PER_SAMPLE)
+    if size > MAX_CACHE_BYTES:
+        return buffer, sr
+
+    with _lock:
+        if key not in _cache:
+            _cache[key] = (buffer, sr, size)
+            _cache_bytes += size
+            while _cache_bytes > MAX_CACHE_BYTES:
+                _, (_, _, evicted) = _cache.popitem(last=False)
+                _cache_bytes -= evicted
+    return buffer, sr
+
+
+def clear_audio_cache():
+    """Drop all cached buffers."""
+    global _cache_bytes
+    with _lock:
+        _cache.clear()
+        _cache_bytes = 0
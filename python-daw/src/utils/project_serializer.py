@@ -19,6 +19,31 @@ from pathlib import Path
 import wave
 import sys
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+def write_json(file_path, data):
+    """Write data to a file as indented JSON.
+    
+    Uses orjson when installed (several times faster on large projects,
+    e.g. with embedded audio), otherwise the stdlib encoder. orjson runs
+    with indentation only, so both accept the same data (str keys, no
+    numpy values) and saving doesn't depend on which one is present.
+    
+    Args:
+        file_path: Output path
+        data: JSON-serializable data
+    """
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
 
 def _import_project():
     """Helper to import Project class."""
@@ -92,8 +117,7 @@ class ProjectSerializer:
         }
         
         # Save JSON
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(project_data, f, indent=2)
+        write_json(file_path, project_data)
         
         print(f"Project saved to: {file_path}")
         if not embed_audio and self.audio_dir.exists():
@@ -0,0 +1,117 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+import src.core.timeline as timeline_module
+from src.core.timeline import Timeline
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def backend(request, monkeypatch):
+    """Run each test with the numpy index and the array/bisect fallback."""
+    if request.param == "numpy":
+        if timeline_module.np is None:
+            pytest.skip("numpy not installed")
+    else:
+        monkeypatch.setattr(timeline_module, "np", None)
+    return request.param
+
+
+def make_clip(start, end):
+    return SimpleNamespace(start_time=start, end_time=end)
+
+
+def query(tl, start, end):
+    return [(ti, id(clip)) for ti, clip in tl.get_clips_for_range(start, end)]
+
+
+def test_range_is_half_open(backend):
+    tl = Timeline()
+    before = make_clip(0.0, 1.0)   # ends exactly at the range start
+    inside = make_clip(1.5, 1.8)
+    after = make_clip(2.0, 3.0)    # starts exactly at the range end
+    spanning = make_clip(0.5, 2.5)
+    tl.add_clips([(0, before), (0, inside), (0, after), (1, spanning)])
+
+    found = {id(c) for _, c in tl.get_clips_for_range(1.0, 2.0)}
+
+    assert found == {id(inside), id(spanning)}
+
+
+def test_long_clip_found_through_max_length(backend):
+    tl = Timeline()
+    long_clip = make_clip(0.0, 100.0)
+    shorts = [make_clip(float(t), float(t) + 0.5) for t in range(1, 99)]
+    tl.add_clips([(0, c) for c in shorts + [long_clip]])
+
+    found = {id(c) for _, c in tl.get_clips_for_range(99.5, 99.6)}
+
+    assert found == {id(long_clip)}
+    # Starting exactly max_length before the range, but ending at its start
+    assert not list(tl.get_clips_for_range(100.0, 101.0))
+
+
+def test_matches_linear_scan(backend):
+    rng = random.Random(1234)
+    tl = Timeline()
+    placements = []
+    for _ in range(400):
+        start = rng.uniform(0.0, 50.0)
+        length = rng.choice([0.1, 0.3, 1.0 / 3.0, rng.uniform(0.01, 20.0)])
+        placements.append((rng.randrange(4), make_clip(start, start + length)))
+    tl.add_clips(placements)
+
+    for _ in range(300):
+        s = rng.uniform(-5.0, 75.0)
+        e = s + rng.uniform(0.0, 10.0)
+        if rng.random() < 0.3:
+            # Put the range edge exactly on a clip edge
+            _, clip = rng.choice(placements)
+            s = rng.choice([clip.start_time, clip.end_time])
+        expected = sorted(
+            (ti, id(c)) for ti, c in placements if c.start_time < e and c.end_time > s
+        )
+        assert sorted(query(tl, s, e)) == expected
+
+
+def test_invalidate_during_build_drops_index(backend):
+    tl = Timeline()
+    late = make_clip(10.0, 20.0)
+
+    class EditingClip:
+        """Simulates the Tk thread adding a clip while the index is built."""
+
+        start_time = 0.0
+        edited = False
+
+        @property
+        def end_time(self):
+            if not EditingClip.edited:
+                EditingClip.edited = True
+                tl.add_clip(1, late)
+            return 1.0
+
+    tl.add_clip(0, EditingClip())
+
+    tl.get_end_time()  # answered from the build that raced the edit
+    assert tl._range_index is None
+    assert tl.get_end_time() == 20.0
+    assert tl._range_index is not None
+
+
+def test_edits_invalidate_index(backend):
+    tl = Timeline()
+    a = make_clip(0.0, 1.0)
+    b = make_clip(2.0, 5.0)
+    tl.add_clip(0, a)
+    assert tl.get_end_time() == 1.0
+    tl.add_clip(0, b)
+    assert tl.get_end_time() == 5.0
+    tl.remove_clips([(0, b)])
+    assert tl.get_end_time() == 1.0
+    a.end_time = 3.0  # moved in place by the UI
+    tl.invalidate()
+    assert tl.get_end_time() == 3.0
+    tl.clear()
+    assert tl.get_end_time() == 0.0